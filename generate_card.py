@@ -10,6 +10,7 @@ import json
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -807,6 +808,60 @@ class UnifiedCardGenerator:
         return None
 
 
+@lru_cache(maxsize=8)
+def _get_generator(output: str, images_output: str, model: str) -> UnifiedCardGenerator:
+    """Return a generator for these settings, reused across generate() calls."""
+    return UnifiedCardGenerator(
+        output_dir=output, images_dir=images_output, api_model=model
+    )
+
+
+def generate(
+    name: str,
+    cost: Optional[str] = None,
+    type: Optional[str] = None,
+    text: Optional[str] = None,
+    power: Optional[str] = None,
+    toughness: Optional[str] = None,
+    flavor: Optional[str] = None,
+    rarity: Optional[str] = None,
+    art: Optional[str] = None,
+    model: str = "sdxl",
+    style: Optional[str] = None,
+    output: str = "output/cards",
+    images_output: str = "output/images",
+    custom_image: Optional[str] = None,
+    skip_image: bool = False,
+) -> Optional[Path]:
+    """
+    Generate a single card in-process.
+
+    Takes the same options as the command line flags so callers such as the
+    deck builder can reuse one interpreter for a whole deck. The generator,
+    and with it any loaded image model, is kept between calls.
+
+    Returns:
+        Path of the rendered card, or None if rendering failed
+    """
+    generator = _get_generator(output, images_output, model)
+    return asyncio.run(
+        generator.create_card(
+            name=name,
+            mana_cost=cost,
+            type_line=type,
+            oracle_text=text,
+            power=power,
+            toughness=toughness,
+            flavor_text=flavor,
+            rarity=rarity,
+            art_description=art,
+            art_style=style,
+            skip_image=skip_image,
+            custom_image_path=custom_image,
+        )
+    )
+
+
 async def main():
     """Main entry point with argument parsing."""
     parser = argparse.ArgumentParser(
@@ -5,10 +5,13 @@ Complete tool for generating 100-card Commander decks with AI assistance
 """
 
 import contextlib
+import hashlib
 import json
 import os
+import pickle
 import subprocess
 import sys
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -19,8 +22,27 @@ import yaml
 
 # Import environment variables
 from dotenv import load_dotenv
-from PyQt6.QtCore import QSettings, Qt, QThread, QTimer, pyqtSignal
-from PyQt6.QtGui import QBrush, QColor, QFont, QPixmap
+from PyQt6.QtCore import (
+    QEvent,
+    QObject,
+    QRunnable,
+    QSettings,
+    Qt,
+    QThread,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QImage,
+    QImageReader,
+    QPixmap,
+    QPixmapCache,
+    QTextCharFormat,
+)
 from PyQt6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -59,6 +81,8 @@ from src.ai_services import (
     ArtDescriptionGenerator,
     CardGenerator,
     ThemeAnalyzer,
+    load_api_key,
+    save_api_key,
 )
 
 # Import domain model - this provides backward compatibility for any code importing from this module
@@ -88,7 +112,7 @@ from src.services.deck import (
 )
 
 # Import UI components
-from src.ui.tabs import ThemeConfigTab
+from src.ui.tabs import ThemeConfigTab, noop_log
 from src.ui.widgets import (
     BatchOperationsWidget,
     CardFilterBar,
@@ -101,6 +125,32 @@ __all__ = ["MTGCard", "make_safe_filename", "escape_for_shell", "convert_mana_co
 
 load_dotenv()
 
+# libyaml's C emitter produces the same output as the pure-Python one, only
+# much faster; it is missing when PyYAML was built without libyaml
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# The five colors; intersecting with a cost string scans it once
+_COLOR_LETTERS = frozenset("WUBRG")
+
+# MTGCard attributes persisted by auto_save_deck, in file order
+_SAVED_CARD_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "cost",
+    "text",
+    "power",
+    "toughness",
+    "flavor",
+    "rarity",
+    "art",
+    "status",
+    "image_path",
+    "card_path",
+    "generated_at",
+    "set",
+)
+
 
 def get_main_window():
     """Safely get the main window instance for logging."""
@@ -110,6 +160,39 @@ def get_main_window():
     return None
 
 
+class _CardIndex:
+    """Cached card id -> position map for looking cards up in a cards list
+
+    Ids matching their position are found without the map. The map is
+    rebuilt when a different list is passed in or when the cached entry no
+    longer matches (e.g. ids were renumbered in place).
+    """
+
+    def __init__(self):
+        self._index: dict[int, int] = {}  # Card id -> position in cards list
+        self._source = None  # List the index was built from
+
+    def find(self, cards: list[MTGCard], card_id: int) -> Optional[int]:
+        """Return the position of card_id in cards, or None"""
+        # Decks are normally numbered 1..N in list order, which needs no map
+        if isinstance(card_id, int) and 0 < card_id <= len(cards):
+            if cards[card_id - 1].id == card_id:
+                return card_id - 1
+
+        if self._source is not cards or len(self._index) != len(cards):
+            self._rebuild(cards)
+
+        idx = self._index.get(card_id)
+        if idx is None or idx >= len(cards) or cards[idx].id != card_id:
+            self._rebuild(cards)
+            idx = self._index.get(card_id)
+        return idx
+
+    def _rebuild(self, cards: list[MTGCard]):
+        self._index = {c.id: i for i, c in enumerate(cards)}
+        self._source = cards
+
+
 # AIWorker class moved to src/ai_services/ai_worker.py
 # Old AIWorker implementation removed - now using new AI service architecture
 
@@ -134,6 +217,8 @@ class CardManagementTab(QWidget):
 
         # Initialize cards list
         self.cards = []
+        self._log = None  # Main window's log_message, see _logger()
+        self._card_index = _CardIndex()  # Per-card generation callbacks look up ids
 
         self.init_ui()
 
@@ -195,15 +280,25 @@ class CardManagementTab(QWidget):
 
             def log_message(self, level: str, message: str) -> None:
                 """Log a message using the main window's log system."""
-                main_window = get_main_window()
-                if main_window and hasattr(main_window, "log_message"):
-                    main_window.log_message(level, message)
+                log = self.parent._logger()
+                if log is not noop_log:
+                    log(level, message)
                 else:
                     # Fallback to console if main window not available
                     print(f"[{level}] {message}")
 
         return CardManagementLogger(self)
 
+    def _logger(self):
+        """Return the main window's log_message, looked up once it exists."""
+        if self._log is not None:
+            return self._log
+        window = self.window()
+        if window is not self and hasattr(window, "log_message"):
+            self._log = window.log_message
+            return self._log
+        return getattr(get_main_window(), "log_message", noop_log)
+
     # CRUD Manager Signal Handlers
     def _on_card_created(self, card):
         """Handle card creation from CRUD manager"""
@@ -278,9 +373,14 @@ class CardManagementTab(QWidget):
             cards: List of MTGCard objects from CardFileOperations
             skip_deck_tracking: If True, skip updating main window deck tracking
         """
+        parent = get_main_window()
+        if parent and hasattr(parent, "flush_pending_save"):
+            # Finish saving the previous deck before switching, but let a reload
+            # from disk win over edits that haven't been written yet
+            parent.flush_pending_save(discard=skip_deck_tracking)
+
         if not skip_deck_tracking:
             # Update main window deck tracking from file operations
-            parent = get_main_window()
             if parent:
                 parent.current_deck_name = self.file_operations.current_deck_name
                 parent.last_loaded_deck_path = (
@@ -617,25 +717,16 @@ class CardManagementTab(QWidget):
         self.table_manager.selection_changed.connect(self.update_button_visibility)
         self.table_manager.card_action_requested.connect(self._handle_card_action)
 
-        # Remove original table signal connections since they're now handled by the manager
-        # Use contextlib.suppress to avoid errors if connections don't exist
-        with contextlib.suppress(Exception):
-            self.table.itemChanged.disconnect()
-        with contextlib.suppress(Exception):
-            self.table.customContextMenuRequested.disconnect()
-        with contextlib.suppress(Exception):
-            self.table.itemSelectionChanged.disconnect()
+        # The table's own signals stay connected to the manager; refresh_table
+        # blocks them while it populates instead of disconnecting them
 
     def _on_table_manager_item_changed(self, card):
         """Handle table item changes from the table manager."""
         # Auto-save the deck
-        main_window = self.parent().parent() if hasattr(self, "parent") else None
-        if main_window and hasattr(main_window, "auto_save_deck"):
+        main_window = self.window()
+        if hasattr(main_window, "auto_save_deck"):
             main_window.auto_save_deck(self.cards)
-            if main_window and hasattr(main_window, "log_message"):
-                main_window.log_message(
-                    "DEBUG", f"Auto-saved deck after editing {card.name}"
-                )
+            self._logger()("DEBUG", f"Auto-saved deck after editing {card.name}")
 
     def _handle_card_action(self, action: str, data):
         """Handle card action requests from the table manager."""
@@ -790,15 +881,14 @@ class CardManagementTab(QWidget):
         from pathlib import Path
 
         artwork_dir = Path("saved_decks") / deck_name / "artwork"
+        log = getattr(parent, "log_message", None)  # Resolved once for the loop
 
         for card in cards_list:
             # Skip pending cards
             if not hasattr(card, "status") or card.status == "pending":
                 skipped_pending.append(card.name)
-                if parent and hasattr(parent, "log_message"):
-                    parent.log_message(
-                        "WARNING", f"⏭️ Skipping '{card.name}' - still pending"
-                    )
+                if log:
+                    log("WARNING", f"⏭️ Skipping '{card.name}' - still pending")
                 continue
 
             # Check if artwork exists
@@ -822,20 +912,16 @@ class CardManagementTab(QWidget):
 
             if not artwork_found:
                 skipped_no_image.append(card.name)
-                if parent and hasattr(parent, "log_message"):
-                    parent.log_message(
-                        "WARNING", f"⚠️ Skipping '{card.name}' - no image found"
-                    )
+                if log:
+                    log("WARNING", f"⚠️ Skipping '{card.name}' - no image found")
                 continue
 
             # Set the image path and mark for regeneration
             card.image_path = artwork_path
             card.status = "pending"  # Mark as pending for regeneration
             cards_to_regenerate.append(card)
-            if parent and hasattr(parent, "log_message"):
-                parent.log_message(
-                    "INFO", f"✅ Will regenerate '{card.name}' with existing image"
-                )
+            if log:
+                log("INFO", f"✅ Will regenerate '{card.name}' with existing image")
 
         # Show summary
         summary_msg = "Regeneration Summary:\n\n"
@@ -899,14 +985,16 @@ class CardManagementTab(QWidget):
         elif self.cards:
             cards_list = self.cards
 
-        # Debug logging
+        # Debug logging; runs on every selection change, so look the logger up
+        # once and skip building the messages when there is none
         parent = get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message(
-                "DEBUG", f"update_button_visibility: selected_rows = {selected_rows}"
-            )
-            parent.log_message("DEBUG", f"  - cards_list length: {len(cards_list)}")
-            parent.log_message(
+        log = None
+        if parent and getattr(parent, "debug_enabled", True):
+            log = getattr(parent, "log_message", None)
+        if log:
+            log("DEBUG", f"update_button_visibility: selected_rows = {selected_rows}")
+            log("DEBUG", f"  - cards_list length: {len(cards_list)}")
+            log(
                 "DEBUG",
                 f"  - cards source: {'crud_manager' if hasattr(self, 'crud_manager') else 'self.cards'}",
             )
@@ -920,19 +1008,17 @@ class CardManagementTab(QWidget):
                 if 0 <= row < len(cards_list):
                     card = cards_list[row]
                     # Debug logging for each card
-                    if parent and hasattr(parent, "log_message"):
+                    if log:
                         card_path = getattr(card, "card_path", None)
                         status = getattr(card, "status", "unknown")
-                        parent.log_message("DEBUG", f"Row {row}: {card.name}")
-                        parent.log_message("DEBUG", f"  - card_path: {card_path}")
-                        parent.log_message("DEBUG", f"  - status: {status}")
-                        parent.log_message(
+                        log("DEBUG", f"Row {row}: {card.name}")
+                        log("DEBUG", f"  - card_path: {card_path}")
+                        log("DEBUG", f"  - status: {status}")
+                        log(
                             "DEBUG",
                             f"  - has card_path attr: {hasattr(card, 'card_path')}",
                         )
-                        parent.log_message(
-                            "DEBUG", f"  - has status attr: {hasattr(card, 'status')}"
-                        )
+                        log("DEBUG", f"  - has status attr: {hasattr(card, 'status')}")
 
                     # Check if card has been generated (has card_path or status is completed)
                     if (hasattr(card, "card_path") and card.card_path) or (
@@ -943,8 +1029,8 @@ class CardManagementTab(QWidget):
                         has_pending = True
 
         # Debug final state
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message(
+        if log:
+            log(
                 "DEBUG",
                 f"Button visibility: has_pending={has_pending}, has_generated={has_generated}, selected_count={len(selected_rows)}",
             )
@@ -997,9 +1083,7 @@ class CardManagementTab(QWidget):
             self.update_generation_stats()
             self.update_button_visibility()  # Update button visibility after clearing
 
-            parent = get_main_window()
-            if parent and hasattr(parent, "log_message"):
-                parent.log_message("INFO", "Deck cleared")
+            self._logger()("INFO", "Deck cleared")
 
     def generate_deck_with_ai(self):
         """Generate a new deck using AI"""
@@ -1024,9 +1108,7 @@ class CardManagementTab(QWidget):
         if 0 <= row < len(self.cards):
             card = self.cards[row]
 
-            current_prompt = getattr(
-                card, "art_prompt", f"Fantasy artwork for {card.name}"
-            )
+            current_prompt = card.art_prompt or f"Fantasy artwork for {card.name}"
 
             text, ok = QInputDialog.getMultiLineText(
                 self,
@@ -1037,9 +1119,7 @@ class CardManagementTab(QWidget):
 
             if ok:
                 card.art_prompt = text
-                parent = get_main_window()
-                if parent and hasattr(parent, "log_message"):
-                    parent.log_message("INFO", f"Updated art prompt for {card.name}")
+                self._logger()("INFO", f"Updated art prompt for {card.name}")
 
     def generate_missing(self):
         """Delegate to controller"""
@@ -1082,9 +1162,7 @@ class CardManagementTab(QWidget):
         """Edit art prompt for a specific card"""
         if 0 <= row < len(self.cards):
             card = self.cards[row]
-            current_prompt = getattr(
-                card, "art_prompt", f"Fantasy artwork for {card.name}"
-            )
+            current_prompt = card.art_prompt or f"Fantasy artwork for {card.name}"
 
             text, ok = QInputDialog.getMultiLineText(
                 self,
@@ -1095,9 +1173,7 @@ class CardManagementTab(QWidget):
 
             if ok:
                 card.art_prompt = text
-                parent = get_main_window()
-                if parent and hasattr(parent, "log_message"):
-                    parent.log_message("INFO", f"Updated art prompt for {card.name}")
+                self._logger()("INFO", f"Updated art prompt for {card.name}")
 
     def regenerate_selected_with_image(self):
         """Delegate to controller"""
@@ -1301,9 +1377,7 @@ class CardManagementTab(QWidget):
             # Update button visibility after deletion
             self.update_button_visibility()
 
-            parent = get_main_window()
-            if parent and hasattr(parent, "log_message"):
-                parent.log_message("INFO", f"Deleted {deleted_count} files")
+            self._logger()("INFO", f"Deleted {deleted_count} files")
 
     def load_cards(self, cards: list[MTGCard]):
         """Load cards into table - delegates to CRUD manager and syncs with deck service"""
@@ -1327,17 +1401,16 @@ class CardManagementTab(QWidget):
         )
         
         # Log validation results
-        parent = get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            if validation_result.is_valid:
-                parent.log_message("INFO", "✅ Deck is valid for Commander format")
-            else:
-                for error in validation_result.errors:
-                    parent.log_message("ERROR", f"❌ {error}")
-                for warning in validation_result.warnings:
-                    parent.log_message("WARNING", f"⚠️ {warning}")
-                for suggestion in validation_result.suggestions:
-                    parent.log_message("INFO", f"💡 {suggestion}")
+        log = self._logger()
+        if validation_result.is_valid:
+            log("INFO", "✅ Deck is valid for Commander format")
+        else:
+            for error in validation_result.errors:
+                log("ERROR", f"❌ {error}")
+            for warning in validation_result.warnings:
+                log("WARNING", f"⚠️ {warning}")
+            for suggestion in validation_result.suggestions:
+                log("INFO", f"💡 {suggestion}")
         
         return validation_result
     
@@ -1362,10 +1435,10 @@ class CardManagementTab(QWidget):
         elif self.cards:
             cards_list = self.cards
 
-        # Use DeckStatistics service for calculations
-        stats = self.deck_stats.calculate_stats(cards_list)
-        type_dist = stats.get("type_distribution", {})
-        color_stats = stats.get("color_stats", {})
+        # Use DeckStatistics service for calculations; only the type and color
+        # breakdowns are shown here, so skip the full deck analysis
+        type_dist = self.deck_stats.calculate_type_distribution(cards_list)
+        color_stats = self.deck_stats.calculate_color_stats(cards_list)
         
         total = len(cards_list)
         # Handle TypeDistribution object or dictionary
@@ -1404,10 +1477,9 @@ class CardManagementTab(QWidget):
         commander_colors = set()
         
         if commander and commander.cost and commander.cost != "-":
-            cost = str(commander.cost).upper()
-            for color in ["W", "U", "B", "R", "G"]:
-                if color in cost:
-                    commander_colors.add(color)
+            commander_colors.update(
+                _COLOR_LETTERS.intersection(str(commander.cost).upper())
+            )
 
         # Build color string with symbols
         color_symbols = {"W": "", "U": "", "B": "", "R": "", "G": "", "C": ""}
@@ -1649,9 +1721,7 @@ class CardManagementTab(QWidget):
             # Update button visibility after deletion
             self.update_button_visibility()
 
-            parent = get_main_window()
-            if parent and hasattr(parent, "log_message"):
-                parent.log_message("INFO", f"Deleted {deleted_count} files")
+            self._logger()("INFO", f"Deleted {deleted_count} files")
 
     def refresh_cards_table(self):
         """Refresh the main cards table (renamed from refresh_table)"""
@@ -1663,11 +1733,9 @@ class CardManagementTab(QWidget):
         self.status_manager.on_generation_progress(card_id, status)
 
         # Update status label if needed
-        for card in self.cards:
-            if card.id == card_id:
-                if hasattr(self, "generation_status_label"):
-                    self.generation_status_label.setText(f"Generating: {card.name}")
-                break
+        idx = self._card_index.find(self.cards, card_id)
+        if idx is not None and hasattr(self, "generation_status_label"):
+            self.generation_status_label.setText(f"Generating: {self.cards[idx].name}")
 
         # Refresh table
         self.table_manager.refresh_table()
@@ -1682,11 +1750,8 @@ class CardManagementTab(QWidget):
         )
 
         # Find the card for preview update
-        updated_card = None
-        for card in self.cards:
-            if card.id == card_id:
-                updated_card = card
-                break
+        idx = self._card_index.find(self.cards, card_id)
+        updated_card = self.cards[idx] if idx is not None else None
 
         # Update display
         self.table_manager.refresh_table()
@@ -1750,11 +1815,7 @@ class CardManagementTab(QWidget):
         )
         self.generator_worker.start()
 
-        parent = get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message(
-                "INFO", f"Starting generation of {len(pending_cards)} cards"
-            )
+        self._logger()("INFO", f"Starting generation of {len(pending_cards)} cards")
 
     def generate_selected_cards(self):
         """Generate only selected cards"""
@@ -1791,11 +1852,7 @@ class CardManagementTab(QWidget):
         )
         self.generator_worker.start()
 
-        parent = get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message(
-                "INFO", f"Generating {len(cards_to_generate)} selected cards"
-            )
+        self._logger()("INFO", f"Generating {len(cards_to_generate)} selected cards")
 
     def refresh_generation_queue(self):
         """Refresh the generation queue table"""
@@ -1843,22 +1900,244 @@ class CardManagementTab(QWidget):
             pass  # Keep the if block valid
 
 
+class _DeckSaveSignals(QObject):
+    """Signals for _DeckSaveTask (QRunnable can't declare signals itself)"""
+
+    saved = pyqtSignal(str, str)  # latest file path, backup file path or ""
+    failed = pyqtSignal(str)  # error message
+
+
+class _DeckSaveTask(QRunnable):
+    """Serialize a deck snapshot to YAML and write it off the UI thread"""
+
+    def __init__(
+        self,
+        deck_data: dict,
+        latest_filename: Path,
+        backup_filename: Optional[Path] = None,
+        card_yaml_cache: Optional[dict] = None,
+    ):
+        """
+        Args:
+            deck_data: Deck snapshot to save
+            latest_filename: Main deck file to write
+            backup_filename: Optional backup copy to write as well
+            card_yaml_cache: YAML text of previously saved cards keyed by the
+                repr of their values, reused for unchanged cards and refreshed after the save.
+                Must only be shared between tasks that run one after another.
+        """
+        super().__init__()
+        self.deck_data = deck_data
+        self.latest_filename = latest_filename
+        self.backup_filename = backup_filename
+        self.card_yaml_cache = card_yaml_cache if card_yaml_cache is not None else {}
+        self.signals = _DeckSaveSignals()
+
+    def run(self):
+        try:
+            # Serialize once, even when a backup copy is written as well
+            content = self._serialize()
+            self._write_file(self.latest_filename, content)
+
+            if self.backup_filename:
+                self.backup_filename.parent.mkdir(exist_ok=True)
+                self._write_file(self.backup_filename, content)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.saved.emit(
+            str(self.latest_filename),
+            str(self.backup_filename) if self.backup_filename else "",
+        )
+
+    def _serialize(self) -> str:
+        """Dump deck_data to YAML, only re-emitting cards that changed
+
+        Produces the same text as dumping deck_data in one go: top-level keys
+        in sorted order and the cards as a block sequence, where each card's
+        text doesn't depend on the cards around it.
+        """
+        parts = []
+        card_yaml = {}
+        for key in sorted(self.deck_data):
+            if key != "cards":
+                parts.append(self._dump({key: self.deck_data[key]}))
+                continue
+
+            parts.append("cards:\n")
+            for card_dict in self.deck_data["cards"]:
+                # repr keeps e.g. 1 and True apart, which dump differently
+                key = repr(tuple(card_dict.values()))
+                text = card_yaml.get(key) or self.card_yaml_cache.get(key)
+                if text is None:
+                    text = self._dump([card_dict])
+                card_yaml[key] = text
+                parts.append(text)
+
+        # Keep only the cards of this save so the cache can't grow unbounded
+        self.card_yaml_cache.clear()
+        self.card_yaml_cache.update(card_yaml)
+        return "".join(parts)
+
+    @staticmethod
+    def _dump(data) -> str:
+        return yaml.dump(
+            data, Dumper=_YamlDumper, default_flow_style=False, allow_unicode=True
+        )
+
+    def _write_file(self, filename: Path, content: str):
+        """Write content to filename atomically via a temp file + os.replace"""
+        tmp_filename = filename.with_suffix(".yaml.tmp")
+        try:
+            with open(tmp_filename, "w") as f:
+                f.write(content)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp_filename.unlink()
+            raise
+
+
+class _ImageLoadSignals(QObject):
+    """Signals for _ImageLoadTask (QRunnable can't declare signals itself)"""
+
+    loaded = pyqtSignal(str, QImage)  # image key, image (null on failure)
+
+
+class _ImageLoadTask(QRunnable):
+    """Decode a card image and scale it to the preview size off the UI thread
+
+    QPixmap may only be used on the UI thread, so the result is a QImage the
+    receiver converts with QPixmap.fromImage.
+    """
+
+    def __init__(self, image_key: str, path: str, width: int, height: int):
+        super().__init__()
+        self.image_key = image_key
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = _ImageLoadSignals()
+
+    def run(self):
+        reader = QImageReader(self.path)
+        if not reader.canRead():
+            # Missing, corrupt or not an image: fail on the header alone
+            self.signals.loaded.emit(self.image_key, QImage())
+            return
+
+        # The header gives the full size; decode straight to the size that
+        # fits without cutting anything off instead of scaling afterwards
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(
+                size.scaled(self.width, self.height, Qt.AspectRatioMode.KeepAspectRatio)
+            )
+        image = reader.read()  # Null image if decoding fails part way
+        self.signals.loaded.emit(self.image_key, image)
+
+
 class MTGDeckBuilder(QMainWindow):
     """Main application window"""
 
+    AUTO_SAVE_DEBOUNCE_MS = 500  # Coalesce auto-saves within this window
+    LOG_MAX_LINES = 5000  # Oldest log lines are dropped beyond this
+    CARD_IMAGE_DIRS = ("output", "output/cards", "output/images")
+    PREVIEW_CACHE_LIMIT_KB = 65536  # Scaled preview pixmaps kept in QPixmapCache
+    PREVIEW_PREFETCH_RADIUS = 2  # Neighbouring cards decoded ahead on each side
+    PREVIEW_DEBOUNCE_MS = 80  # Preview only the selection that settles this long
+
+    # Card preview panel styles, parsed once for the panel instead of per label
+    PREVIEW_PANEL_STYLESHEET = """
+        QLabel#previewTitle {
+            color: #4ec9b0;
+            font-weight: bold;
+            padding: 10px;
+        }
+        QLabel#previewImage {
+            border: 2px solid #555;
+            border-radius: 10px;
+            background-color: #3c3c3c;
+            color: #888;
+            padding: 10px;
+        }
+        QLabel#previewName {
+            font-size: 16px;
+            font-weight: bold;
+            color: #4ec9b0;
+            padding: 5px;
+        }
+        QLabel#previewInfo {
+            padding: 2px;
+            color: #cccccc;
+        }
+        QLabel#previewText, QLabel#previewFlavor {
+            padding: 5px;
+            color: #cccccc;
+            background-color: #3c3c3c;
+            border: 1px solid #555;
+            border-radius: 3px;
+        }
+        QLabel#previewFlavor {
+            color: #dcdcaa;
+            font-style: italic;
+        }
+        QLabel#previewGeneratedAt {
+            color: #969696;
+            font-size: 10px;
+        }
+    """
+
+    # Color coding for the different log levels
+    LOG_LEVEL_COLORS = {
+        "INFO": "#4ec9b0",
+        "WARNING": "#dcdcaa",
+        "ERROR": "#f48771",
+        "DEBUG": "#969696",
+        "SUCCESS": "#4ec9b0",
+        "GENERATING": "#ce9178",
+    }
+
     def __init__(self):
         super().__init__()
         self.generation_active = False
+        # DEBUG lines are logged while set; hot paths check it before even
+        # formatting their debug messages
+        self.debug_enabled = True
         self.current_preview_card = None  # Track for resize events
+        self._preview_image_key = None  # Image the preview is waiting for
         self.current_deck_name = None  # Track active deck name
         self.last_loaded_deck_path = None  # Track last loaded deck for auto-loading
+        self._last_deck_digest = None  # Digest of the last auto-saved deck content
+        self._card_index = _CardIndex()
+        self._deck_switcher_cache = None  # (saved_decks mtime, deck names)
+        # Progress of the running image generation, counted once at its start
+        # and then advanced per completed card
+        self._generation_total = 0
+        self._generation_completed = 0
 
         # Initialize generation controller
         self.generation_controller = CardGenerationController(self)
 
+        # Scaled previews are cached so revisiting a card skips decode + scale
+        QPixmapCache.setCacheLimit(self.PREVIEW_CACHE_LIMIT_KB)
+        self._pending_image_keys = set()  # Images being decoded right now
+        # Neighbour prefetches get their own small pool so they can't hold up
+        # the image the user is actually waiting for
+        self._prefetch_pool = QThreadPool()
+        self._prefetch_pool.setMaxThreadCount(2)
+
+        # Rapid selection changes (arrow keys) coalesce into a single preview
+        self._preview_timer = QTimer()
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._commit_preview)
+        self._pending_preview_card = None
+
         self.init_ui()
         self.load_settings()
         self.setup_status_timer()
+        self.setup_save_timer()
         self.setup_file_watcher()
 
     def init_ui(self):
@@ -2046,6 +2325,8 @@ class MTGDeckBuilder(QMainWindow):
         )
         # Connect log_message signal for thread-safe logging
         self.cards_tab.generator_worker.log_message.connect(self.log_message)
+        self.cards_tab.generator_worker.log_batch.connect(self.log_messages)
+        self.cards_tab.generator_worker.debug_enabled = self.debug_enabled
 
         # Status bar
         self.statusBar().showMessage("Ready")
@@ -2100,10 +2381,9 @@ class MTGDeckBuilder(QMainWindow):
         current_cards = self.cards_tab.cards.copy()
 
         # Find and update the card in the list
-        for i, c in enumerate(current_cards):
-            if str(c.id) == str(card.id):
-                current_cards[i] = card
-                break
+        idx = self._find_card_index(self.cards_tab.cards, card.id)
+        if idx is not None:
+            current_cards[idx] = card
 
         # Load all cards to the generation tab (it will only generate pending ones)
         self.cards_tab.load_cards(current_cards)
@@ -2114,7 +2394,41 @@ class MTGDeckBuilder(QMainWindow):
         # Start generation for pending cards (which includes our reset card)
         self.cards_tab.generate_images()
 
+    def _find_card_index(self, cards: list[MTGCard], card_id: int) -> Optional[int]:
+        """Return the position of card_id in cards using a cached id -> index map"""
+        return self._card_index.find(cards, card_id)
+
     def auto_save_deck(self, cards: list[MTGCard], new_generation: bool = False):
+        """Schedule an auto-save of the deck, coalescing bursts of updates
+
+        Args:
+            cards: List of cards to save
+            new_generation: If True, saves immediately (creating a backup) instead
+                of waiting for the debounce timer.
+        """
+        if new_generation:
+            self._save_debounce_timer.stop()
+            self._pending_save = None
+            self._auto_save_deck_now(cards, new_generation=True)
+            return
+
+        self._pending_save = (cards, new_generation)
+        self._save_debounce_timer.start(self.AUTO_SAVE_DEBOUNCE_MS)
+
+    def flush_pending_save(self, discard: bool = False):
+        """Run the auto-save scheduled by auto_save_deck, if any
+
+        Args:
+            discard: If True, drop the pending save instead of writing it
+        """
+        self._save_debounce_timer.stop()
+        if self._pending_save is not None:
+            cards, new_generation = self._pending_save
+            self._pending_save = None
+            if not discard:
+                self._auto_save_deck_now(cards, new_generation)
+
+    def _auto_save_deck_now(self, cards: list[MTGCard], new_generation: bool = False):
         """Auto-save deck to YAML file
 
         Args:
@@ -2165,20 +2479,13 @@ class MTGDeckBuilder(QMainWindow):
         # Save deck file in the deck folder
         latest_filename = deck_dir / f"{self.current_deck_name}.yaml"
 
-        # Tell file watcher to ignore the next change (our save)
-        if hasattr(self, "file_watcher"):
-            self.ignore_next_change = True
-
-        # Only create timestamp file for new generations
-        timestamp_filename = None
-        if new_generation:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            timestamp_filename = deck_dir / f"deck_{theme_clean}_{timestamp}.yaml"
+        # One timestamp for the whole save so metadata and backup name agree
+        now = datetime.now()
 
         # Prepare deck data
         deck_data = {
             "theme": theme,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "card_count": len(cards),
             "cards": [],
         }
@@ -2187,52 +2494,63 @@ class MTGDeckBuilder(QMainWindow):
             # ALWAYS use sequential numeric IDs (no exceptions!)
             card.id = i + 1
 
-            card_dict = {
-                "id": card.id,
-                "name": card.name,
-                "type": card.type,
-                "cost": card.cost,
-                "text": card.text,
-                "power": card.power,
-                "toughness": card.toughness,
-                "flavor": card.flavor,
-                "rarity": card.rarity,
-                "art": card.art,
-                "status": card.status,
-                "image_path": card.image_path,
-                "card_path": card.card_path,
-                "generated_at": card.generated_at,
-                "set": card.set if hasattr(card, "set") else "CMD",
-            }
+            card_dict = {field: getattr(card, field) for field in _SAVED_CARD_FIELDS}
             deck_data["cards"].append(card_dict)
 
-        try:
-            # Save main deck file
-            with open(latest_filename, "w") as f:
-                yaml.dump(deck_data, f, default_flow_style=False, allow_unicode=True)
-
-            # Also save timestamped backup for new generations
-            if new_generation:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_dir = deck_dir / "backups"
-                backup_dir.mkdir(exist_ok=True)
-                backup_filename = (
-                    backup_dir / f"{self.current_deck_name}_{timestamp}.yaml"
-                )
-                with open(backup_filename, "w") as f:
-                    yaml.dump(
-                        deck_data, f, default_flow_style=False, allow_unicode=True
-                    )
-                self.log_message("INFO", f"Deck saved to: {deck_dir.name}/")
-                self.log_message("DEBUG", f"Backup created: {backup_filename.name}")
-            else:
-                self.log_message(
-                    "DEBUG",
-                    f"Auto-saved to: {self.current_deck_name}/{latest_filename.name}",
-                )
+        # Skip serialization and the write entirely if nothing changed since the
+        # last auto-save ("generated_at" is excluded as it changes every call)
+        digest = hashlib.blake2b(
+            pickle.dumps((str(latest_filename), theme, deck_data["cards"]), protocol=5),
+            digest_size=16,
+        ).digest()
+        if (
+            not new_generation
+            and digest == self._last_deck_digest
+            and latest_filename.exists()
+        ):
+            return
 
-        except Exception as e:
-            self.log_message("ERROR", f"Failed to auto-save deck: {str(e)}")
+        # Tell file watcher to ignore the next change (our save)
+        if hasattr(self, "file_watcher"):
+            self.ignore_next_change = True
+
+        # Also save timestamped backup for new generations
+        backup_filename = None
+        if new_generation:
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            backup_filename = (
+                deck_dir / "backups" / f"{self.current_deck_name}_{timestamp}.yaml"
+            )
+
+        # deck_data only holds fresh dicts of plain values, so it is a snapshot
+        # the worker can serialize while the UI keeps mutating the cards
+        self._last_deck_digest = digest
+        task = _DeckSaveTask(
+            deck_data, latest_filename, backup_filename, self._card_yaml_cache
+        )
+        task.signals.saved.connect(self._on_deck_saved)
+        task.signals.failed.connect(self._on_deck_save_failed)
+        self._save_pool.start(task)
+
+    def _on_deck_saved(self, latest_path: str, backup_path: str):
+        """Log a completed background deck save"""
+        # The deck may be new or now the most recent one
+        self._deck_switcher_cache = None
+
+        latest_filename = Path(latest_path)
+        if backup_path:
+            self.log_message("INFO", f"Deck saved to: {latest_filename.parent.name}/")
+            self.log_message("DEBUG", f"Backup created: {Path(backup_path).name}")
+        else:
+            self.log_message(
+                "DEBUG",
+                f"Auto-saved to: {latest_filename.parent.name}/{latest_filename.name}",
+            )
+
+    def _on_deck_save_failed(self, error: str):
+        """Log a failed background deck save and allow the next save to retry"""
+        self._last_deck_digest = None
+        self.log_message("ERROR", f"Failed to auto-save deck: {error}")
 
     def create_logger_panel(self):
         """Create the logger panel on the right side"""
@@ -2298,13 +2616,29 @@ class MTGDeckBuilder(QMainWindow):
             }
         """
         )
+        # Keep only the most recent lines so inserts and scrolling stay cheap
+        self.logger_text.document().setMaximumBlockCount(self.LOG_MAX_LINES)
         logger_layout.addWidget(self.logger_text)
 
+        # Character formats used by log_message, built once per color
+        self._log_formats = {}
+        self._timestamp_format = self._text_format("#969696")
+        self._level_formats = {
+            level: self._text_format(level_color, bold=True)
+            for level, level_color in self.LOG_LEVEL_COLORS.items()
+        }
+
         # Auto-scroll checkbox
         self.auto_scroll_cb = QCheckBox("Auto-scroll")
         self.auto_scroll_cb.setChecked(True)
         logger_layout.addWidget(self.auto_scroll_cb)
 
+        # Debug checkbox: DEBUG lines are only logged while checked
+        self.debug_log_cb = QCheckBox("Debug")
+        self.debug_log_cb.setChecked(self.debug_enabled)
+        self.debug_log_cb.toggled.connect(self.set_debug_enabled)
+        logger_layout.addWidget(self.debug_log_cb)
+
         # Initialize with welcome message
         self.log_message("INFO", "MTG Deck Builder started", "#4ec9b0")
         self.log_message("INFO", "Ready to generate Commander decks!", "#4ec9b0")
@@ -2312,30 +2646,25 @@ class MTGDeckBuilder(QMainWindow):
     def create_card_preview_panel(self):
         """Create the permanent card preview panel"""
         self.card_preview_widget = QWidget()
+        # One stylesheet for the whole panel, children pick rules by object name
+        self.card_preview_widget.setStyleSheet(self.PREVIEW_PANEL_STYLESHEET)
         layout = QVBoxLayout(self.card_preview_widget)
 
         # Title
         title_label = QLabel("<h3>Card Preview</h3>")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("color: #4ec9b0; font-weight: bold; padding: 10px;")
+        title_label.setObjectName("previewTitle")
         layout.addWidget(title_label)
 
         # Card preview image (no tabs)
         self.card_image_label = QLabel()
         self.card_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.card_image_label.setScaledContents(False)  # Keep aspect ratio
-        self.card_image_label.setStyleSheet(
-            """
-            QLabel {
-                border: 2px solid #555;
-                border-radius: 10px;
-                background-color: #3c3c3c;
-                color: #888;
-                padding: 10px;
-            }
-        """
-        )
+        self.card_image_label.setObjectName("previewImage")
         self.card_image_label.setText("Select a card to preview")
+        # The preview size is only recomputed after the label is resized
+        self._preview_size = None
+        self.card_image_label.installEventFilter(self)
         layout.addWidget(self.card_image_label, 1)  # Stretch factor 1
 
         # Card Details
@@ -2344,9 +2673,7 @@ class MTGDeckBuilder(QMainWindow):
 
         # Card name
         self.preview_name = QLabel("No card selected")
-        self.preview_name.setStyleSheet(
-            "font-size: 16px; font-weight: bold; color: #4ec9b0; padding: 5px;"
-        )
+        self.preview_name.setObjectName("previewName")
         self.preview_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
         details_layout.addWidget(self.preview_name)
 
@@ -2366,7 +2693,7 @@ class MTGDeckBuilder(QMainWindow):
             self.preview_rarity,
             self.preview_status,
         ]:
-            label.setStyleSheet("padding: 2px; color: #cccccc;")
+            label.setObjectName("previewInfo")
             info_layout.addWidget(label)
 
         details_layout.addLayout(info_layout)
@@ -2374,18 +2701,14 @@ class MTGDeckBuilder(QMainWindow):
         # Card text
         self.preview_text = QLabel("Text: ")
         self.preview_text.setWordWrap(True)
-        self.preview_text.setStyleSheet(
-            "padding: 5px; color: #cccccc; background-color: #3c3c3c; border: 1px solid #555; border-radius: 3px;"
-        )
+        self.preview_text.setObjectName("previewText")
         self.preview_text.setMaximumHeight(80)
         details_layout.addWidget(self.preview_text)
 
         # Flavor text
         self.preview_flavor = QLabel("Flavor: ")
         self.preview_flavor.setWordWrap(True)
-        self.preview_flavor.setStyleSheet(
-            "padding: 5px; color: #dcdcaa; font-style: italic; background-color: #3c3c3c; border: 1px solid #555; border-radius: 3px;"
-        )
+        self.preview_flavor.setObjectName("previewFlavor")
         self.preview_flavor.setMaximumHeight(60)
         details_layout.addWidget(self.preview_flavor)
 
@@ -2395,7 +2718,7 @@ class MTGDeckBuilder(QMainWindow):
         # Generation info
         gen_info_layout = QHBoxLayout()
         self.preview_generated_at = QLabel("Not generated")
-        self.preview_generated_at.setStyleSheet("color: #969696; font-size: 10px;")
+        self.preview_generated_at.setObjectName("previewGeneratedAt")
         gen_info_layout.addWidget(self.preview_generated_at)
         gen_info_layout.addStretch()
         layout.addLayout(gen_info_layout)
@@ -2410,30 +2733,30 @@ class MTGDeckBuilder(QMainWindow):
 
     def log_message(self, level: str, message: str, color: str = "#cccccc"):
         """Add a message to the logger"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_messages([(level, message)], color)
 
-        # Color coding for different levels
-        level_colors = {
-            "INFO": "#4ec9b0",
-            "WARNING": "#dcdcaa",
-            "ERROR": "#f48771",
-            "DEBUG": "#969696",
-            "SUCCESS": "#4ec9b0",
-            "GENERATING": "#ce9178",
-        }
-
-        level_color = level_colors.get(level, color)
+    def log_messages(self, entries: list, color: str = "#cccccc"):
+        """Add several (level, message) entries to the logger, scrolling once"""
+        if not self.debug_enabled:
+            entries = [entry for entry in entries if entry[0] != "DEBUG"]
+            if not entries:
+                return
 
-        # Format the message with HTML
-        formatted_msg = f"""
-        <span style="color: #969696;">[{timestamp}]</span>
-        <span style="color: {level_color}; font-weight: bold;">[{level}]</span>
-        <span style="color: {color};">{message}</span>
-        """
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        text_format = self._text_format(color)
 
+        # Insert pre-formatted text runs instead of re-parsing HTML per line
         cursor = self.logger_text.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
-        cursor.insertHtml(formatted_msg + "<br>")
+        for level, message in entries:
+            level_format = self._level_formats.get(level)
+            if level_format is None:
+                level_format = self._text_format(color, bold=True)
+
+            cursor.insertText(f"[{timestamp}] ", self._timestamp_format)
+            cursor.insertText(f"[{level}] ", level_format)
+            cursor.insertText(message, text_format)
+            cursor.insertBlock()
 
         # Auto-scroll if enabled
         if self.auto_scroll_cb.isChecked():
@@ -2441,6 +2764,24 @@ class MTGDeckBuilder(QMainWindow):
                 self.logger_text.verticalScrollBar().maximum()
             )
 
+    def _text_format(self, color: str, bold: bool = False) -> QTextCharFormat:
+        """Return a cached character format for the given color and weight"""
+        key = (color, bold)
+        text_format = self._log_formats.get(key)
+        if text_format is None:
+            text_format = QTextCharFormat()
+            text_format.setForeground(QColor(color))
+            if bold:
+                text_format.setFontWeight(QFont.Weight.Bold)
+            self._log_formats[key] = text_format
+        return text_format
+
+    def set_debug_enabled(self, enabled: bool):
+        """Turn DEBUG logging on or off, for the generator worker as well"""
+        self.debug_enabled = enabled
+        if hasattr(self, "cards_tab"):
+            self.cards_tab.generator_worker.debug_enabled = enabled
+
     def clear_logs(self):
         """Clear the logger"""
         self.logger_text.clear()
@@ -2599,29 +2940,47 @@ class MTGDeckBuilder(QMainWindow):
         self.deck_switcher.clear()
         self.deck_switcher.addItem("-- Select Deck --")
 
-        if saved_decks_dir.exists():
-            # Get all deck directories
-            deck_dirs = [
-                d
-                for d in saved_decks_dir.iterdir()
-                if d.is_dir() and d.name.startswith("deck_")
-            ]
+        # Adding, removing or renaming a deck folder bumps the parent's mtime,
+        # so the scan only needs to be redone when that changes
+        try:
+            mtime = saved_decks_dir.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime is None:
+            deck_names = []
+        elif self._deck_switcher_cache and self._deck_switcher_cache[0] == mtime:
+            deck_names = self._deck_switcher_cache[1]
+        else:
+            # Get all deck directories; DirEntry reuses the d_type from the
+            # directory listing, so only the mtime needs a stat call
+            with os.scandir(saved_decks_dir) as it:
+                deck_dirs = [
+                    (entry.stat().st_mtime, entry.name)
+                    for entry in it
+                    if entry.name.startswith("deck_") and entry.is_dir()
+                ]
             # Sort by modification time (most recent first)
-            deck_dirs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            deck_dirs.sort(reverse=True)
 
             # Add max 10 recent decks
-            for deck_dir in deck_dirs[:10]:
-                deck_name = deck_dir.name
+            deck_names = []
+            for _, deck_name in deck_dirs[:10]:
                 # Check if YAML file exists
-                yaml_file = deck_dir / f"{deck_name}.yaml"
-                if yaml_file.exists():
-                    self.deck_switcher.addItem(deck_name)
+                yaml_file = os.path.join(
+                    saved_decks_dir, deck_name, f"{deck_name}.yaml"
+                )
+                if os.path.exists(yaml_file):
+                    deck_names.append(deck_name)
+            self._deck_switcher_cache = (mtime, deck_names)
 
-        # Select current deck if loaded
-        if self.current_deck_name:
-            index = self.deck_switcher.findText(self.current_deck_name)
-            if index >= 0:
-                self.deck_switcher.setCurrentIndex(index)
+        self.deck_switcher.addItems(deck_names)
+
+        # Select current deck if loaded (+1 skips the placeholder item)
+        if self.current_deck_name in deck_names:
+            self.deck_switcher.setCurrentIndex(
+                deck_names.index(self.current_deck_name) + 1
+            )
 
     def on_deck_switch(self, deck_name: str):
         """Handle deck selection from dropdown"""
@@ -2690,6 +3049,9 @@ class MTGDeckBuilder(QMainWindow):
                 if reply != QMessageBox.StandardButton.Yes:
                     return
 
+            # Write pending changes under the old name before moving the folder
+            self.flush_pending_save()
+
             # Rename the deck folder and files
             old_deck_dir = Path("saved_decks") / self.current_deck_name
 
@@ -2745,6 +3107,20 @@ class MTGDeckBuilder(QMainWindow):
         self.status_timer.timeout.connect(self.update_status_animation)
         self.dot_count = 0
         self.start_time = None
+        self._status_base_text = ""
+
+    def setup_save_timer(self):
+        """Setup single-shot timer used to debounce auto-saves"""
+        self._save_debounce_timer = QTimer()
+        self._save_debounce_timer.setSingleShot(True)
+        self._save_debounce_timer.timeout.connect(self.flush_pending_save)
+        self._pending_save = None
+
+        # Single writer thread keeps saves in submission order, which also
+        # makes it the only user of the per-card YAML cache
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
+        self._card_yaml_cache = {}
 
     def update_status(self, status: str, message: str = ""):
         """Update the status indicator"""
@@ -2755,6 +3131,7 @@ class MTGDeckBuilder(QMainWindow):
             )
             self.current_task_label.setText(message)
             self.current_task_label.setVisible(True)  # Show when generating
+            self._status_base_text = message.rstrip(".")  # Animated with dots
             self.generation_progress.setVisible(True)
             self.generation_active = True
             self.start_time = datetime.now()
@@ -2783,14 +3160,12 @@ class MTGDeckBuilder(QMainWindow):
     def update_status_animation(self):
         """Animate the status with dots"""
         if self.generation_active:
-            dots = "." * (self.dot_count % 4)
-            current_text = self.current_task_label.text()
-            if current_text:
-                base_text = current_text.rstrip(".")
-                self.current_task_label.setText(base_text + dots)
+            if self._status_base_text and self.current_task_label.isVisible():
+                dots = "." * (self.dot_count % 4)
+                self.current_task_label.setText(self._status_base_text + dots)
 
             # Update time elapsed
-            if self.start_time:
+            if self.start_time and self.time_label.isVisible():
                 elapsed = datetime.now() - self.start_time
                 minutes = int(elapsed.total_seconds() // 60)
                 seconds = int(elapsed.total_seconds() % 60)
@@ -2885,6 +3260,9 @@ class MTGDeckBuilder(QMainWindow):
 
     def clear_card_preview(self):
         """Clear the card preview panel"""
+        # A preview still waiting on the debounce timer would undo the clear
+        self._preview_timer.stop()
+        self._pending_preview_card = None
         self.current_preview_card = None
         self.preview_name.setText("Select a card")
         self.preview_type.setText("Type: ")
@@ -2899,7 +3277,37 @@ class MTGDeckBuilder(QMainWindow):
         self.card_image_label.setText("Select a card to preview")
 
     def update_card_preview(self, card: MTGCard):
-        """Update the card preview panel with the selected card"""
+        """Update the card preview panel with the selected card
+
+        The update is deferred until the selection has been stable for
+        PREVIEW_DEBOUNCE_MS, so skipping through the list only previews the
+        card it stops on.
+        """
+        self._pending_preview_card = card
+        self._preview_timer.start(self.PREVIEW_DEBOUNCE_MS)
+
+        # Meanwhile show the card's image right away if it's already scaled in
+        # the cache (e.g. prefetched), which costs no decode and no rescale
+        if card.card_path:
+            card_file = Path(card.card_path)
+            card_mtime = self._file_mtime(card_file)
+            if card_mtime is not None:
+                width, height = self._preview_image_size()
+                pixmap = QPixmapCache.find(
+                    self._preview_cache_key(card_file, card_mtime, width, height)
+                )
+                if pixmap is not None:
+                    self.card_image_label.setPixmap(pixmap)
+
+    def _commit_preview(self):
+        """Show the card passed to the last update_card_preview call"""
+        card = self._pending_preview_card
+        self._pending_preview_card = None
+        if card is not None:
+            self._show_card_preview(card)
+
+    def _show_card_preview(self, card: MTGCard):
+        """Fill the card preview panel with card"""
         self.current_preview_card = card
 
         # Update card name
@@ -2958,120 +3366,209 @@ class MTGDeckBuilder(QMainWindow):
 
     def update_card_images(self, card: MTGCard):
         """Update the card image previews"""
-        # Clear previous image first to ensure update is visible
-        self.card_image_label.clear()
-        self.card_image_label.setText("Loading...")
-
-        # Process events to show the loading state immediately
-        QApplication.processEvents()
-
-        # Log what we're trying to load
-        self.log_message("DEBUG", f"Updating image preview for card: {card.name}")
-        self.log_message(
-            "DEBUG", f"Card path: {card.card_path if card.card_path else 'None'}"
-        )
-        self.log_message(
-            "DEBUG",
-            f"Image path: {card.image_path if hasattr(card, 'image_path') and card.image_path else 'None'}",
-        )
+        debug = self.debug_enabled
+        if debug:
+            # Log what we're trying to load
+            self.log_message("DEBUG", f"Updating image preview for card: {card.name}")
+            self.log_message(
+                "DEBUG", f"Card path: {card.card_path if card.card_path else 'None'}"
+            )
+            self.log_message(
+                "DEBUG",
+                f"Image path: {card.image_path if hasattr(card, 'image_path') and card.image_path else 'None'}",
+            )
 
-        # Full card image
-        card_file = None
-        if card.card_path:
-            card_file = Path(card.card_path)
-            if not card_file.exists():
-                # Try to find in output directory using generate_card.py naming
-                safe_name = make_safe_filename(card.name)
-                card_file = self._find_card_image(safe_name)
-                if card_file:
-                    card.card_path = str(card_file)  # Update the card object
-                    self.log_message(
-                        "DEBUG", f"Found card in output directory: {card_file}"
-                    )
-        else:
-            # No card_path set, try to find it
-            safe_name = make_safe_filename(card.name)
-            card_file = self._find_card_image(safe_name)
+        # Full card image; the stat doubles as the existence check and gives
+        # the mtime that keys the preview cache
+        card_file = Path(card.card_path) if card.card_path else None
+        card_mtime = self._file_mtime(card_file) if card_file else None
+        if card_mtime is None:
+            # Try to find in output directory using generate_card.py naming
+            card_file = self._find_card_image(make_safe_filename(card.name))
             if card_file:
                 card.card_path = str(card_file)  # Update the card object
-                self.log_message(
-                    "DEBUG", f"Found card in output directory: {card_file}"
-                )
-
-        if card_file and card_file.exists():
-            self.log_message("DEBUG", f"Loading card image from: {card_file}")
-            pixmap = QPixmap(str(card_file))
-            if not pixmap.isNull():
-                # Get the available space in the preview widget
-                # Standard MTG card ratio is approximately 2.5:3.5 (width:height)
-                label_width = self.card_image_label.width() - 20  # Account for padding
-                label_height = self.card_image_label.height() - 20
-
-                # Scale to fit without cutting anything off
-                if label_width > 0 and label_height > 0:
-                    scaled_pixmap = pixmap.scaled(
-                        label_width,
-                        label_height,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
-                    )
-                else:
-                    # Fallback to reasonable default size
-                    scaled_pixmap = pixmap.scaled(
-                        350,
-                        488,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation,
+                card_mtime = self._file_mtime(card_file)
+                if debug:
+                    self.log_message(
+                        "DEBUG", f"Found card in output directory: {card_file}"
                     )
 
-                self.card_image_label.setPixmap(scaled_pixmap)
-                print(
-                    f"[SUCCESS] Card loaded (size: {scaled_pixmap.width()}x{scaled_pixmap.height()})"
-                )
+        if card_file and card_mtime is not None:
+            if debug:
+                self.log_message("DEBUG", f"Loading card image from: {card_file}")
+            label_width, label_height = self._preview_image_size()
+            image_key = self._preview_cache_key(
+                card_file, card_mtime, label_width, label_height
+            )
+            self._preview_image_key = image_key
+            pixmap = QPixmapCache.find(image_key)
+            if pixmap is not None:
+                # Replaces whatever is shown without flashing the loading state
+                self.card_image_label.setPixmap(pixmap)
             else:
-                self.card_image_label.setText("Card image failed to load")
-                self.log_message("ERROR", "QPixmap failed to load card image")
+                # Clear previous image first; the loading state shows while the
+                # image is decoded in the background
+                self.card_image_label.clear()
+                self.card_image_label.setText("Loading...")
+
+            if pixmap is None and image_key not in self._pending_image_keys:
+                # Decode and scale off the UI thread; _on_card_image_loaded shows
+                # it if this is still the most recently requested preview. A
+                # prefetch already in flight for this image will show it too.
+                self._start_image_load(
+                    QThreadPool.globalInstance(),
+                    image_key,
+                    card_file,
+                    label_width,
+                    label_height,
+                )
+
+            self._prefetch_card_images(card, label_width, label_height)
         else:
+            self._preview_image_key = None
             self.card_image_label.setText(
                 f"Card image not available\n\n{card.name}\n{card.type}"
             )
-            self.log_message("DEBUG", f"No card image found for {card.name}")
+            if debug:
+                self.log_message("DEBUG", f"No card image found for {card.name}")
+
+    def eventFilter(self, obj, event):
+        """Note preview label resizes so _preview_image_size recomputes"""
+        if obj is self.card_image_label and event.type() == QEvent.Type.Resize:
+            self._preview_size = None
+        return super().eventFilter(obj, event)
+
+    def _preview_image_size(self) -> tuple[int, int]:
+        """Size card images are scaled to for the preview label"""
+        if self._preview_size is None:
+            # Get the available space in the preview widget
+            # Standard MTG card ratio is approximately 2.5:3.5 (width:height)
+            label_width = self.card_image_label.width() - 20  # Account for padding
+            label_height = self.card_image_label.height() - 20
+            if label_width <= 0 or label_height <= 0:
+                # Fallback to reasonable default size
+                label_width, label_height = 350, 488
+            self._preview_size = (label_width, label_height)
+        return self._preview_size
+
+    @staticmethod
+    def _preview_cache_key(path: Path, mtime: float, width: int, height: int) -> str:
+        """QPixmapCache key of a scaled preview"""
+        # A rewritten file gets a new mtime and therefore a new cache key
+        return f"{path}:{mtime}:{width}x{height}"
+
+    def _start_image_load(
+        self, pool: QThreadPool, image_key: str, path: Path, width: int, height: int
+    ):
+        """Decode and scale an image on pool, reporting to _on_card_image_loaded"""
+        task = _ImageLoadTask(image_key, str(path), width, height)
+        task.signals.loaded.connect(self._on_card_image_loaded)
+        self._pending_image_keys.add(image_key)
+        pool.start(task)
+
+    def _prefetch_card_images(self, card: MTGCard, width: int, height: int):
+        """Decode the images of the cards around card into the preview cache"""
+        cards = self.cards_tab.cards
+        idx = self._find_card_index(cards, card.id)
+        if idx is None:
+            return
+
+        radius = self.PREVIEW_PREFETCH_RADIUS
+        for neighbour in cards[max(idx - radius, 0) : idx + radius + 1]:
+            # Only cards with a known render; directory scans for the rest
+            # happen when they are actually previewed
+            if neighbour is card or not neighbour.card_path:
+                continue
+            card_file = Path(neighbour.card_path)
+            card_mtime = self._file_mtime(card_file)
+            if card_mtime is None:
+                continue
+
+            image_key = self._preview_cache_key(card_file, card_mtime, width, height)
+            if (
+                image_key not in self._pending_image_keys
+                and QPixmapCache.find(image_key) is None
+            ):
+                self._start_image_load(
+                    self._prefetch_pool, image_key, card_file, width, height
+                )
+
+    def _on_card_image_loaded(self, image_key: str, image: QImage):
+        """Cache a card image decoded by _ImageLoadTask, show it if still wanted"""
+        self._pending_image_keys.discard(image_key)
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(image_key, pixmap)
+
+        if image_key != self._preview_image_key:
+            return  # The user has moved on to another card
+
+        if pixmap is None:
+            self.card_image_label.setText("Card image failed to load")
+            self.log_message("ERROR", "Failed to load card image")
+            return
+
+        self.card_image_label.setPixmap(pixmap)
+        print(f"[SUCCESS] Card loaded (size: {image.width()}x{image.height()})")
+
+    @staticmethod
+    def _file_mtime(path: Path) -> Optional[float]:
+        """Modification time of path, or None if it can't be stat'ed"""
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
 
     def _find_card_image(self, safe_name: str) -> Path:
+        """Find card image in output directories, using cached results when valid"""
+        cached = self._card_image_cache.get(safe_name)
+        if cached is not None and cached.exists():
+            return cached
+
+        card_file = self._scan_card_image(safe_name)
+        if card_file:
+            self._card_image_cache[safe_name] = card_file
+        return card_file
+
+    @staticmethod
+    def _scan_latest(directory: str, prefix: str) -> Optional[Path]:
+        """Return the most recently modified prefix*.png file in directory
+
+        A single os.scandir pass; DirEntry caches the file type from the
+        listing, so only matching files are stat'ed for their mtime.
+        """
+        best_mtime = None
+        best_path = None
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith(".png")):
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if best_mtime is None or mtime > best_mtime:
+                        best_mtime, best_path = mtime, entry.path
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return Path(best_path) if best_path else None
+
+    def _scan_card_image(self, safe_name: str) -> Path:
         """Find card image in output directories, handling timestamp patterns"""
         # Check direct path first
         direct_path = Path("output") / f"{safe_name}.png"
         if direct_path.exists():
             return direct_path
 
-        # Check in cards subdirectory with timestamp pattern
-        cards_dir = Path("output/cards")
-        if cards_dir.exists():
-            # Look for files matching the pattern: safe_name_YYYYMMDD_HHMMSS.png
-            pattern = f"{safe_name}_*.png"
-            matching_files = list(cards_dir.glob(pattern))
-            if matching_files:
-                # Return the most recent file
-                matching_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                return matching_files[0]
-
-        # Check in images subdirectory
-        images_dir = Path("output/images")
-        if images_dir.exists():
-            pattern = f"{safe_name}_*.png"
-            matching_files = list(images_dir.glob(pattern))
-            if matching_files:
-                matching_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                return matching_files[0]
-
-        # Check in root output directory with timestamp
-        output_dir = Path("output")
-        if output_dir.exists():
-            pattern = f"{safe_name}_*.png"
-            matching_files = list(output_dir.glob(pattern))
-            if matching_files:
-                matching_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                return matching_files[0]
+        # Look for files matching the pattern: safe_name_YYYYMMDD_HHMMSS.png
+        # in cards, then images, then the root output directory
+        prefix = f"{safe_name}_"
+        for directory in ("output/cards", "output/images", "output"):
+            latest = self._scan_latest(directory, prefix)
+            if latest:
+                return latest
 
         return None
 
@@ -3105,7 +3602,12 @@ class MTGDeckBuilder(QMainWindow):
     def on_image_generation_started(self):
         """Handle image generation start"""
         if hasattr(self.cards_tab, "cards"):
-            total = len([c for c in self.cards_tab.cards if c.status == "pending"])
+            cards = self.cards_tab.cards
+            status_counts = Counter(c.status for c in cards)
+            self._generation_total = len(cards)
+            self._generation_completed = status_counts["completed"]
+
+            total = status_counts["pending"]
             self.update_status("generating", f"Generating images (0/{total})...")
             self.log_message(
                 "GENERATING", f"Starting image generation for {total} cards..."
@@ -3132,37 +3634,38 @@ class MTGDeckBuilder(QMainWindow):
         )
         if success:
             self.log_message("SUCCESS", f"Card {card_id} generated successfully")
+            self._generation_completed += 1
 
             # Update the card's paths if provided
             if hasattr(self.cards_tab, "crud_manager") and self.cards_tab.crud_manager:
                 cards_list = self.cards_tab.crud_manager.cards
                 card_updated = False
-                for card in cards_list:
-                    if str(card.id) == str(card_id):
-                        # Update the card's paths
-                        if card_path:
-                            card.card_path = card_path
-                            card_updated = True
-                        if image_path:
-                            card.image_path = image_path
-                            card_updated = True
-
-                        # Update status to completed
-                        card.status = "completed"
-                        card.generated_at = datetime.now().isoformat()
-
-                        # Check if this card is currently selected
-                        current_row = self.cards_tab.table.currentRow()
-                        if 0 <= current_row < len(cards_list):
-                            selected_card = cards_list[current_row]
-                            if selected_card.id == card.id:
-                                # This is the currently selected card, update preview
-                                self.log_message(
-                                    "DEBUG",
-                                    f"Updating preview for just-generated card: {card.name}",
-                                )
-                                self.update_card_preview(card)
-                        break
+                idx = self._find_card_index(cards_list, card_id)
+                if idx is not None:
+                    card = cards_list[idx]
+                    # Update the card's paths
+                    if card_path:
+                        card.card_path = card_path
+                        card_updated = True
+                    if image_path:
+                        card.image_path = image_path
+                        card_updated = True
+
+                    # Update status to completed
+                    card.status = "completed"
+                    card.generated_at = datetime.now().isoformat()
+
+                    # Check if this card is currently selected
+                    current_row = self.cards_tab.table.currentRow()
+                    if 0 <= current_row < len(cards_list):
+                        selected_card = cards_list[current_row]
+                        if selected_card.id == card.id:
+                            # This is the currently selected card, update preview
+                            self.log_message(
+                                "DEBUG",
+                                f"Updating preview for just-generated card: {card.name}",
+                            )
+                            self.update_card_preview(card)
 
                 # Auto-save the deck after successful generation
                 if card_updated:
@@ -3175,14 +3678,12 @@ class MTGDeckBuilder(QMainWindow):
         """Update status for individual image generation"""
         if hasattr(self.cards_tab, "cards"):
             # Find the card being processed
-            current_card = None
-            for card in self.cards_tab.cards:
-                if str(card.id) == str(card_id):
-                    current_card = card
-                    break
+            cards = self.cards_tab.cards
+            idx = self._find_card_index(cards, card_id)
+            current_card = cards[idx] if idx is not None else None
 
-            total = len(self.cards_tab.cards)
-            completed = sum(1 for c in self.cards_tab.cards if c.status == "completed")
+            total = self._generation_total or len(cards)
+            completed = self._generation_completed
             processing = card_id
 
             if status == "generating" and current_card:
@@ -3212,6 +3713,10 @@ class MTGDeckBuilder(QMainWindow):
 
         # Load last deck if available
         last_deck_path = settings.value("last_deck_path")
+
+        # What is on disk now; closeEvent only writes settings that differ
+        self._saved_geometry = bytes(geometry) if geometry else None
+        self._saved_deck_path = last_deck_path
         if last_deck_path and Path(last_deck_path).exists():
             self.log_message(
                 "INFO", f"Auto-loading last deck: {Path(last_deck_path).name}"
@@ -3230,10 +3735,30 @@ class MTGDeckBuilder(QMainWindow):
         self.watching_file = None
         self.ignore_next_change = False
 
+        # Card image lookups are cached until an output directory changes
+        self._card_image_cache = {}
+        self.file_watcher.directoryChanged.connect(self.on_output_dir_changed)
+        self._watch_output_dirs()
+
+    def _watch_output_dirs(self):
+        """Watch the directories searched by _find_card_image that exist"""
+        watched = set(self.file_watcher.directories())
+        for directory in self.CARD_IMAGE_DIRS:
+            if directory not in watched and Path(directory).is_dir():
+                self.file_watcher.addPath(directory)
+
+    def on_output_dir_changed(self, path):
+        """Drop cached card image lookups when an output directory changes"""
+        self._card_image_cache.clear()
+        # Subdirectories may have been created since the watcher was set up
+        self._watch_output_dirs()
+
     def on_deck_file_changed(self, path):
         """Handle external changes to deck file"""
         if self.ignore_next_change:
             self.ignore_next_change = False
+            # Our atomic save replaces the file, so Qt stops watching it
+            self._rewatch_deck_file(path)
             return
 
         # Show notification that file changed
@@ -3247,17 +3772,39 @@ class MTGDeckBuilder(QMainWindow):
         QTimer.singleShot(100, lambda: self.cards_tab.reload_current_deck())
 
         # Re-add the file to watcher (Qt removes it after change)
-        if Path(path).exists():
+        self._rewatch_deck_file(path)
+
+    def _rewatch_deck_file(self, path: str):
+        """Watch path again if Qt dropped it and the file still exists"""
+        if path in self.file_watcher.files():
+            return
+        # The stat doubles as the existence check
+        if self._file_mtime(Path(path)) is not None:
             self.file_watcher.addPath(path)
 
     def closeEvent(self, event):
         """Save settings on close"""
-        settings = QSettings("MTGDeckBuilder", "Settings")
-        settings.setValue("geometry", self.saveGeometry())
-
-        # Save current deck path if one is loaded
-        if hasattr(self, "last_loaded_deck_path") and self.last_loaded_deck_path:
-            settings.setValue("last_deck_path", self.last_loaded_deck_path)
+        # Write out any auto-save still waiting on the debounce timer
+        self.flush_pending_save()
+        self._save_pool.waitForDone()
+        self._prefetch_pool.clear()  # Drop prefetches that haven't started
+
+        # Only touch the settings file when something actually changed
+        geometry = self.saveGeometry()
+        geometry_changed = bytes(geometry) != self._saved_geometry
+        deck_path = getattr(self, "last_loaded_deck_path", None)
+        deck_path_changed = bool(deck_path) and deck_path != self._saved_deck_path
+
+        if geometry_changed or deck_path_changed:
+            settings = QSettings("MTGDeckBuilder", "Settings")
+            if geometry_changed:
+                settings.setValue("geometry", geometry)
+                self._saved_geometry = bytes(geometry)
+
+            # Save current deck path if one is loaded
+            if deck_path_changed:
+                settings.setValue("last_deck_path", deck_path)
+                self._saved_deck_path = deck_path
 
         event.accept()
 
@@ -3265,6 +3812,7 @@ class MTGDeckBuilder(QMainWindow):
 def main():
     app = QApplication(sys.argv)
     app.setApplicationName("MTG Deck Builder")
+    app.aboutToQuit.connect(AIService.close_session)
 
     window = MTGDeckBuilder()
 
@@ -3276,6 +3824,17 @@ def main():
     # Alternativ: window.setWindowState(Qt.WindowState.WindowMaximized)  # Maximiert mit Taskleiste
     window.show()
 
+    # Ask once for an OpenRouter key if none is configured yet
+    if not load_api_key():
+        api_key, ok = QInputDialog.getText(
+            window,
+            "OpenRouter API Key",
+            "Enter your OpenRouter API key (or set OPENROUTER_API_KEY):",
+            QLineEdit.EchoMode.Password,
+        )
+        if ok and api_key.strip():
+            save_api_key(api_key.strip())
+
     sys.exit(app.exec())
 
 
@@ -242,10 +242,7 @@ class AIWorker(QThread):
 
     def __init__(self):
         super().__init__()
-        self.api_key = os.getenv(
-            "OPENROUTER_API_KEY",
-            "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",
-        )
+        self.api_key = os.getenv("OPENROUTER_API_KEY", "")
         self.model = "openai/gpt-oss-120b"
         self.task = ""
         self.prompt = ""
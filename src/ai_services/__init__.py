@@ -6,8 +6,9 @@ This module provides AI service classes for Magic: The Gathering card generation
 
 from .ai_worker import AIWorker
 from .art_description_generator import ArtDescriptionGenerator
-from .base_ai_service import AIService
+from .base_ai_service import AIService, load_api_key, save_api_key
 from .card_generator import CardGenerator
+from .response_cache import ResponseCache
 from .theme_analyzer import ThemeAnalyzer
 
 __all__ = [
@@ -16,4 +17,7 @@ __all__ = [
     "CardGenerator",
     "ArtDescriptionGenerator",
     "AIWorker",
+    "ResponseCache",
+    "load_api_key",
+    "save_api_key",
 ]
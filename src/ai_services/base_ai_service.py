@@ -7,28 +7,78 @@ This module provides the base AIService class that handles common AI API functio
 import json
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Optional
 
 import requests
 
+from .response_cache import ResponseCache
+
+try:
+    import orjson
+except ImportError:  # Optional, only speeds up decoding large responses
+    orjson = None
+
+# Same QSettings scope the deck builder keeps its preferences in
+_SETTINGS_SCOPE = ("MTGDeckBuilder", "Settings")
+_API_KEY_SETTING = "openrouter_api_key"
+
+
+@lru_cache(maxsize=1)
+def _stored_api_key() -> str:
+    """OpenRouter API key saved in the application settings, read once."""
+    from PyQt6.QtCore import QSettings
+
+    return str(QSettings(*_SETTINGS_SCOPE).value(_API_KEY_SETTING, "") or "")
+
+
+def load_api_key() -> str:
+    """
+    Return the OpenRouter API key.
+
+    The OPENROUTER_API_KEY env variable wins over the key saved with
+    save_api_key; an empty string means no key is configured.
+    """
+    return os.getenv("OPENROUTER_API_KEY") or _stored_api_key()
+
+
+def save_api_key(api_key: str) -> None:
+    """
+    Store the OpenRouter API key in the application settings.
+
+    Args:
+        api_key: Key to use when OPENROUTER_API_KEY is not set
+    """
+    from PyQt6.QtCore import QSettings
+
+    QSettings(*_SETTINGS_SCOPE).setValue(_API_KEY_SETTING, api_key)
+    _stored_api_key.cache_clear()
+
 
 class AIService(ABC):
     """Base class for AI services with OpenRouter API integration."""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    # Shared by all services so calls reuse open connections to OpenRouter
+    _session: requests.Session | None = None
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str | None = None,
+        use_cache: bool = True,
+    ):
         """
         Initialize AI service with API configuration.
 
         Args:
-            api_key: OpenRouter API key (defaults to env variable)
+            api_key: OpenRouter API key (defaults to load_api_key())
             model: AI model to use (defaults to openai/gpt-oss-120b)
+            use_cache: Reuse stored responses for identical requests
         """
-        self.api_key = api_key or os.getenv(
-            "OPENROUTER_API_KEY",
-            "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",
-        )
+        self.api_key = api_key or load_api_key()
         self.model = model or "openai/gpt-oss-120b"
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.response_cache = ResponseCache() if use_cache else None
 
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -77,6 +127,60 @@ class AIService(ABC):
             requests.RequestException: If API call fails
             ValueError: If response is invalid
         """
+        cache_key, content = self._cached_response(prompt, task_type, log_callback)
+        if content is not None:
+            return content
+
+        headers, payload, timeout = self._prepare_request(
+            prompt, task_type, progress_callback, log_callback
+        )
+
+        # Make API call
+        response = self._get_session().post(
+            self.base_url, headers=headers, json=payload, timeout=timeout
+        )
+        content = self._parse_response(response, log_callback)
+        self._cache_response(cache_key, content)
+        return content
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """Return the shared HTTP session, creating it on first use."""
+        if AIService._session is None:
+            AIService._session = requests.Session()
+        return AIService._session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """Close the shared HTTP session; the next call opens a new one."""
+        if AIService._session is not None:
+            AIService._session.close()
+            AIService._session = None
+
+    def _cached_response(
+        self, prompt: str, task_type: str, log_callback
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Return the cache key for a request and its cached content, if any."""
+        if self.response_cache is None:
+            return None, None
+
+        cache_key = ResponseCache.make_key(
+            self.model, task_type, self.get_system_prompt(), prompt
+        )
+        content = self.response_cache.get(cache_key)
+        if content is not None and log_callback:
+            log_callback("INFO", f"Using cached response for {task_type}")
+        return cache_key, content
+
+    def _cache_response(self, cache_key: Optional[str], content: str) -> None:
+        """Store a fresh response under the key from _cached_response."""
+        if cache_key is not None:
+            self.response_cache.set(cache_key, content)
+
+    def _prepare_request(
+        self, prompt: str, task_type: str, progress_callback, log_callback
+    ) -> tuple[dict[str, str], dict[str, Any], float]:
+        """Build headers, JSON body and timeout for an API call."""
         # Get parameters for this task type
         params = self.get_default_parameters(task_type)
 
@@ -108,19 +212,25 @@ class AIService(ABC):
         if log_callback:
             log_callback("DEBUG", f"Request size: {request_size} characters")
 
-        # Make API call
-        response = requests.post(
-            self.base_url,
-            headers=headers,
-            json={
-                "model": self.model,
-                "messages": messages,
-                "temperature": params["temperature"],
-                "max_tokens": params["max_tokens"],
-            },
-            timeout=params["timeout"],
-        )
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": params["temperature"],
+            "max_tokens": params["max_tokens"],
+        }
+        return headers, payload, params["timeout"]
+
+    @staticmethod
+    def _decode_json(response) -> Any:
+        """Decode a response body, straight from bytes with orjson if installed."""
+        if orjson is not None:
+            body = response.content
+            if isinstance(body, bytes):
+                return orjson.loads(body)
+        return response.json()
 
+    def _parse_response(self, response, log_callback) -> str:
+        """Extract the content from an API response."""
         # Handle response
         if response.status_code != 200:
             error_msg = f"API Error {response.status_code}: {response.text}"
@@ -129,7 +239,7 @@ class AIService(ABC):
             raise requests.RequestException(error_msg)
 
         try:
-            response_data = response.json()
+            response_data = self._decode_json(response)
             content = response_data["choices"][0]["message"]["content"]
 
             # Log success
@@ -141,7 +251,8 @@ class AIService(ABC):
 
             return content
 
-        except (KeyError, IndexError, json.JSONDecodeError) as e:
+        except (KeyError, IndexError, ValueError) as e:
+            # ValueError covers json and orjson decode errors
             error_msg = f"Invalid API response format: {str(e)}"
             if log_callback:
                 log_callback("ERROR", error_msg)
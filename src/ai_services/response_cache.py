@@ -0,0 +1,98 @@
+"""
+On-disk cache for AI service responses.
+
+This module provides the ResponseCache class used by AIService to avoid paying
+for the same request twice.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """Cache of AI responses stored as one JSON file per request."""
+
+    DEFAULT_TTL = 7 * 24 * 60 * 60  # One week, in seconds
+
+    def __init__(self, directory: Path | None = None, ttl: float = DEFAULT_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Where cache entries are stored (defaults to the
+                MTG_LLM_CACHE_DIR env variable or ~/.cache/mtg_deckbuilder_llm)
+            ttl: Seconds an entry stays valid
+        """
+        if directory is None:
+            directory = os.getenv("MTG_LLM_CACHE_DIR") or (
+                Path.home() / ".cache" / "mtg_deckbuilder_llm"
+            )
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(model: str, task_type: str, system_prompt: str, prompt: str) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: AI model the request is sent to
+            task_type: Type of task (selects the request parameters)
+            system_prompt: System prompt of the request
+            prompt: User prompt of the request
+
+        Returns:
+            Hex digest identifying the request
+        """
+        digest = hashlib.sha256()
+        for part in (model, task_type, system_prompt, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")  # Keep ("ab", "c") apart from ("a", "bc")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for key, or None if missing or expired.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached response content or None
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("expires", 0) < time.time():
+            return None
+        return entry.get("content")
+
+    def set(self, key: str, content: str) -> None:
+        """
+        Store a response; failures to write are ignored.
+
+        Args:
+            key: Key from make_key
+            content: Response content to cache
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires": time.time() + self.ttl, "content": content}, f)
+            # Readers never see a half-written entry
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _path(self, key: str) -> Path:
+        """File holding the entry for key."""
+        return self.directory / f"{key}.json"
@@ -5,6 +5,6 @@ free from dependencies on UI or external systems.
 """
 
 from .models.mtg_card import MTGCard
-from .enums.rarity import Rarity
+from .enums.rarity import Rarity, normalize_rarity
 
-__all__ = ["MTGCard", "Rarity"]
\ No newline at end of file
+__all__ = ["MTGCard", "Rarity", "normalize_rarity"]
\ No newline at end of file
@@ -1,5 +1,5 @@
 """Domain enumerations for Magic: The Gathering cards."""
 
-from .rarity import Rarity
+from .rarity import Rarity, normalize_rarity
 
-__all__ = ["Rarity"]
\ No newline at end of file
+__all__ = ["Rarity", "normalize_rarity"]
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Enumeration for Magic: The Gathering card rarities."""
 
+import sys
 from enum import Enum
 
 
@@ -34,4 +35,18 @@ class Rarity(str, Enum):
             if rarity.value == normalized:
                 return rarity
         
-        raise ValueError(f"Invalid rarity: {value}. Valid rarities are: {[r.value for r in cls]}")
\ No newline at end of file
+        raise ValueError(f"Invalid rarity: {value}. Valid rarities are: {[r.value for r in cls]}")
+
+
+# Canonical rarity strings, so cards with the same rarity share one string
+_CANONICAL_RARITIES = {rarity.value: rarity.value for rarity in Rarity}
+
+
+def normalize_rarity(value: str) -> str:
+    """Return the lowercase rarity, shared with every card of that rarity.
+
+    Unknown rarities are interned as well rather than rejected, since cards
+    store rarity as free text.
+    """
+    normalized = value.strip().lower()
+    return _CANONICAL_RARITIES.get(normalized) or sys.intern(normalized)
@@ -134,6 +134,38 @@ class CardCollection:
             
             return list(unique_cards.values())
     
+    def count_lands(self) -> int:
+        """
+        Get number of lands in the collection.
+        
+        Types are checked on each call, since cards can be edited in place.
+        
+        Returns:
+            int: Number of land cards
+        """
+        with self._lock:
+            return sum(1 for card in self.cards if card.is_land())
+    
+    def count_creatures(self) -> int:
+        """
+        Get number of creatures in the collection.
+        
+        Returns:
+            int: Number of creature cards
+        """
+        with self._lock:
+            return sum(1 for card in self.cards if card.is_creature())
+    
+    def get_nonland_cards(self) -> List[MTGCard]:
+        """
+        Get all non-land cards in the collection.
+        
+        Returns:
+            List[MTGCard]: Non-land cards, in collection order
+        """
+        with self._lock:
+            return [card for card in self.cards if not card.is_land()]
+    
     @property
     def total_cards(self) -> int:
         """
@@ -7,33 +7,29 @@ with all its attributes and business logic methods.
 Extracted from mtg_deck_builder.py as part of the domain model refactoring.
 """
 
+import re
+import shlex
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+# Use unbuffered Python output (-u flag) to ensure logs are captured immediately
+_CMD_PREFIX = ("poetry", "run", "python", "-u", "generate_card.py")
 
+# Problematic characters become underscores; commas and apostrophes are dropped
+_SAFE_FILENAME_TABLE = str.maketrans(
+    {
+        **dict.fromkeys('/\\:*?"<>|\u202f\u00a0—– ', "_"),
+        ",": None,
+        "'": None,
+    }
+)
+
+
+@lru_cache(maxsize=4096)
 def make_safe_filename(name: str) -> str:
     """Convert a card name to a safe filename, matching generate_card.py logic."""
-    safe_name = name
-    # Replace problematic characters with underscores
-    for char in [
-        "/",
-        "\\",
-        ":",
-        "*",
-        "?",
-        '"',
-        "<",
-        ">",
-        "|",
-        "\u202f",
-        "\u00a0",
-        "—",
-        "–",
-    ]:
-        safe_name = safe_name.replace(char, "_")
-    # Replace spaces, commas, and apostrophes
-    safe_name = safe_name.replace(" ", "_").replace(",", "").replace("'", "")
-    return safe_name
+    return name.translate(_SAFE_FILENAME_TABLE)
 
 
 def escape_for_shell(text: str) -> str:
@@ -57,30 +53,23 @@ def convert_mana_cost(cost) -> str:
         return cost
 
     # Convert compact format to MTG format
-    result = ""
-    i = 0
-    while i < len(cost):
-        char = cost[i]
-        # Check if it's a number (generic mana)
-        if char.isdigit():
-            # Look ahead for multi-digit numbers
-            j = i
-            while j < len(cost) and cost[j].isdigit():
-                j += 1
-            result += "{" + cost[i:j] + "}"
-            i = j
-        # Check if it's a mana symbol (W, U, B, R, G, C, X)
-        elif char.upper() in "WUBRGCX":
-            result += "{" + char.upper() + "}"
-            i += 1
-        else:
-            # Skip unknown characters
-            i += 1
-
-    return result
-
-
-@dataclass
+    return _convert_compact_cost(cost)
+
+
+# Generic mana (multi-digit) or a mana symbol; anything else is skipped
+_MANA_SYMBOL_RE = re.compile(r"(\d+)|([WUBRGCX])", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _convert_compact_cost(cost: str) -> str:
+    """Convert a compact cost like 2UR to {2}{U}{R}; deck costs repeat a lot."""
+    return "".join(
+        "{" + (generic or symbol.upper()) + "}"
+        for generic, symbol in _MANA_SYMBOL_RE.findall(cost)
+    )
+
+
+@dataclass(slots=True)
 class MTGCard:
     """Represents a single MTG card with all attributes"""
 
@@ -101,74 +90,76 @@ class MTGCard:
     generated_at: Optional[str] = None  # Timestamp when generated
     generation_status: str = "pending"  # For tracking individual generation
     custom_image_path: Optional[str] = None  # Path to custom uploaded image
+    art_prompt: Optional[str] = None  # Edited art prompt (not saved with the deck)
+    skip_generation: bool = False  # Marked completed without generating
 
     def is_creature(self) -> bool:
         # Check for both English and German, including compound words
         type_lower = self.type.lower()
-        return any(word in type_lower for word in ["creature", "kreatur"])
+        return "creature" in type_lower or "kreatur" in type_lower
 
     def is_land(self) -> bool:
         # Works for both English and German (both use "Land")
         return "Land" in self.type
 
     def get_command(self, model: str = "sdxl", style: str = "mtg_modern") -> str:
-        """Generate the command for generate_card.py"""
-        # Use unbuffered Python output (-u flag) to ensure logs are captured immediately
-        cmd_parts = ["poetry", "run", "python", "-u", "generate_card.py"]
-
-        # Add name
-        cmd_parts.extend(["--name", escape_for_shell(self.name)])
+        """Generate the command for generate_card.py, quoted for a shell"""
+        return shlex.join(self.get_command_args(model, style))
+
+    def get_command_args(
+        self, model: str = "sdxl", style: str = "mtg_modern"
+    ) -> list[str]:
+        """Generate the argv for generate_card.py, for use with shell=False"""
+        args = list(_CMD_PREFIX)
+        for key, value in self.get_generate_kwargs(model, style).items():
+            args += ("--" + key.replace("_", "-"), value)
+        return args
+
+    def get_generate_kwargs(
+        self, model: str = "sdxl", style: str = "mtg_modern"
+    ) -> dict:
+        """Keyword arguments for generate_card.generate, in command line order."""
+        kwargs = {"name": self.name}
 
         # Add cost if not a land (lands have no mana cost)
         if not self.is_land() and self.cost:
             # Convert mana cost to proper MTG format
             formatted_cost = convert_mana_cost(self.cost)
             if formatted_cost:
-                cmd_parts.extend(["--cost", escape_for_shell(formatted_cost)])
+                kwargs["cost"] = formatted_cost
 
-        # Add type
-        cmd_parts.extend(["--type", escape_for_shell(self.type)])
+        kwargs["type"] = self.type
 
         # Add text - ALWAYS include text, even for lands
         if self.text:
-            cmd_parts.extend(["--text", escape_for_shell(self.text)])
+            kwargs["text"] = self.text
 
-        # Add P/T if creature - with debug logging
+        # Add P/T if creature
         if self.is_creature():
-            # Always add P/T for creatures, even if values might be None
-            if self.power is not None and self.toughness is not None:
-                cmd_parts.extend(["--power", str(self.power)])
-                cmd_parts.extend(["--toughness", str(self.toughness)])
-            else:
+            if self.power is None or self.toughness is None:
                 # Log error - creature MUST have P/T
                 print(
                     f"ERROR: Creature '{self.name}' has invalid P/T: power={self.power}, toughness={self.toughness}"
                 )
-                # Still try to add what we have to avoid black card
-                if self.power is not None:
-                    cmd_parts.extend(["--power", str(self.power)])
-                if self.toughness is not None:
-                    cmd_parts.extend(["--toughness", str(self.toughness)])
+            # Still pass what we have to avoid black card
+            if self.power is not None:
+                kwargs["power"] = str(self.power)
+            if self.toughness is not None:
+                kwargs["toughness"] = str(self.toughness)
 
-        # Add flavor if exists
         if self.flavor:
-            cmd_parts.extend(["--flavor", escape_for_shell(self.flavor)])
+            kwargs["flavor"] = self.flavor
 
-        # Add rarity
-        cmd_parts.extend(["--rarity", self.rarity])
+        kwargs["rarity"] = self.rarity
 
-        # Add art description
         if self.art:
-            cmd_parts.extend(["--art", escape_for_shell(self.art)])
+            kwargs["art"] = self.art
 
-        # Add model and style
-        cmd_parts.extend(["--model", model])
-        cmd_parts.extend(["--style", style])
+        kwargs["model"] = model
+        kwargs["style"] = style
 
         # Add custom image path if provided
-        if hasattr(self, "custom_image_path") and self.custom_image_path:
-            cmd_parts.extend(
-                ["--custom-image", escape_for_shell(str(self.custom_image_path))]
-            )
+        if self.custom_image_path:
+            kwargs["custom_image"] = str(self.custom_image_path)
 
-        return " ".join(cmd_parts)
\ No newline at end of file
+        return kwargs
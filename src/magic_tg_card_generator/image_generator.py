@@ -96,6 +96,7 @@ class ImageGenerator:
         output_dir: Path | None = None,
         device: str | None = None,
         low_memory: bool = False,
+        quantize: str | None = None,
     ) -> None:
         """Initialize the image generator.
 
@@ -106,6 +107,8 @@ class ImageGenerator:
             output_dir: Directory to save generated images
             device: Device to run on ('cuda', 'mps', 'cpu', or None for auto)
             low_memory: Enable memory optimizations for low VRAM systems
+            quantize: Quantize the denoising model weights ('int8' or 'fp8',
+                CUDA only, needs optimum-quanto)
         """
         # Load configuration from file if provided
         self.config = self._load_config(config_file) if config_file else {}
@@ -138,6 +141,9 @@ class ImageGenerator:
         self.low_memory = low_memory or self.config.get("image_generation", {}).get(
             "low_memory", False
         )
+        self.quantize = quantize or self.config.get("image_generation", {}).get(
+            "quantize"
+        )
         self.pipeline: StableDiffusionPipeline | None = None
 
         logger.info(
@@ -376,12 +382,51 @@ class ImageGenerator:
                 elif hasattr(self.pipeline, "enable_attention_slicing"):
                     self.pipeline.enable_attention_slicing()
 
+            if self.quantize:
+                self._quantize_weights()
+
             logger.info("Model loaded successfully")
 
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise
 
+    def _quantize_weights(self) -> None:
+        """Quantize the UNet (or FLUX transformer) weights in place.
+
+        Falls back to the unquantized model when the device or installed
+        packages cannot support the requested precision.
+        """
+        if self.quantize not in ("int8", "fp8"):
+            logger.warning(f"Unknown quantization '{self.quantize}', skipping")
+            return
+
+        if self.device != "cuda":
+            logger.info("Quantization is CUDA only, keeping full precision")
+            return
+
+        # FP8 needs Ada/Hopper tensor cores
+        if self.quantize == "fp8" and torch.cuda.get_device_capability() < (8, 9):
+            logger.warning("GPU has no FP8 support, keeping full precision")
+            return
+
+        try:
+            from optimum.quanto import freeze, qfloat8, qint8, quantize
+        except ImportError:
+            logger.warning("optimum-quanto not installed, keeping full precision")
+            return
+
+        model = getattr(self.pipeline, "unet", None) or getattr(
+            self.pipeline, "transformer", None
+        )
+        if model is None:
+            logger.warning("Pipeline has no UNet or transformer to quantize")
+            return
+
+        quantize(model, weights=qint8 if self.quantize == "int8" else qfloat8)
+        freeze(model)
+        logger.info(f"Quantized model weights to {self.quantize}")
+
     def generate_card_art(
         self,
         card: Card,
@@ -102,6 +102,13 @@ class CardCRUDManager(QObject):
         self.validation_manager = validation_manager
         self.logger = logger
 
+        # Next free card ID and the (list, length) it was worked out for
+        self._next_id = 1
+        self._next_id_for: tuple = (None, -1)
+        if table_manager is not None:
+            # Table edits can renumber a card, so work the ID out again
+            table_manager.item_changed.connect(self._forget_next_card_id)
+
     def _log_message(self, level: str, message: str):
         """Log a message using available logger"""
         if self.logger and hasattr(self.logger, "log_message"):
@@ -124,15 +131,32 @@ class CardCRUDManager(QObject):
         return get_main_window()
 
     def get_next_card_id(self) -> int:
-        """Get next available card ID."""
-        max_id = 0
-        for card in self.cards:
-            try:
-                card_id = int(card.id) if isinstance(card.id, str | int) else 0
-                max_id = max(max_id, card_id)
-            except (ValueError, TypeError):
-                continue
-        return max_id + 1
+        """Get next available card ID.
+
+        The cards are only scanned again when the list was replaced or its
+        length changed since the last call; adding a card here bumps the ID.
+        """
+        cards, count = self._next_id_for
+        if cards is not self.cards or count != len(self.cards):
+            max_id = 0
+            for card in self.cards:
+                try:
+                    card_id = int(card.id) if isinstance(card.id, str | int) else 0
+                    max_id = max(max_id, card_id)
+                except (ValueError, TypeError):
+                    continue
+            self._next_id = max_id + 1
+            self._next_id_for = (self.cards, len(self.cards))
+        return self._next_id
+
+    def _forget_next_card_id(self, *_args) -> None:
+        """Make the next get_next_card_id call scan the cards again."""
+        self._next_id_for = (None, -1)
+
+    def _claim_card_id(self, card_id: int) -> None:
+        """Record that a card with card_id was just added to the list."""
+        self._next_id = card_id + 1
+        self._next_id_for = (self.cards, len(self.cards))
 
     # CREATE operations
     def add_new_card(self):
@@ -156,10 +180,11 @@ class CardCRUDManager(QObject):
 
         # Add to cards list
         self.cards.append(new_card)
+        self._claim_card_id(next_id)
 
-        # Refresh table if available
+        # Show the new row if a table is available
         if self.table_manager:
-            self.table_manager.refresh_table()
+            self.table_manager.insert_card_row(len(self.cards) - 1)
 
         # Select the new card (last row) if table widget is available
         if self.parent_widget and hasattr(self.parent_widget, "table"):
@@ -231,10 +256,11 @@ class CardCRUDManager(QObject):
                     # Default to pending
                     card.status = "pending"
 
-        # Update the table manager with new cards and commander colors
+        # Update the table manager with new cards and commander colors,
+        # colors first so the table is only rebuilt once
         if self.table_manager:
+            self.table_manager.set_commander_colors(commander_colors, refresh=False)
             self.table_manager.set_cards(self.cards)
-            self.table_manager.set_commander_colors(commander_colors)
 
         # Update stats if parent widget has these methods
         if self.parent_widget:
@@ -523,10 +549,11 @@ class CardCRUDManager(QObject):
 
         # Add after the current card
         self.cards.insert(current_row + 1, new_card)
+        self._claim_card_id(next_id)
 
-        # Refresh and select the new card
+        # Show and select the new card
         if self.table_manager:
-            self.table_manager.refresh_table()
+            self.table_manager.insert_card_row(current_row + 1)
         table.selectRow(current_row + 1)
 
         # Auto-save
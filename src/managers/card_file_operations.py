@@ -27,6 +27,14 @@ else:
     from src.domain.models import MTGCard
 
 
+def _as_int_id(value: Any, default: int) -> int:
+    """Normalize a card id read from a file to int, falling back to default."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 # Protocol definitions for dependency injection
 class Logger(Protocol):
     """Protocol for logging functionality."""
@@ -368,13 +376,17 @@ class CardFileOperations:
             if "commander" in deck_data:
                 # Old format with separate commander
                 cmd_data = deck_data["commander"]
-                commander = self._dict_to_mtg_card(cmd_data, cmd_data.get("id", 1))
+                commander = self._dict_to_mtg_card(
+                    cmd_data, _as_int_id(cmd_data.get("id"), 1)
+                )
                 cards.append(commander)
 
             # Add other cards
             if "cards" in deck_data:
                 for i, card_data in enumerate(deck_data["cards"], start=2):
-                    card = self._dict_to_mtg_card(card_data, card_data.get("id", i))
+                    card = self._dict_to_mtg_card(
+                        card_data, _as_int_id(card_data.get("id"), i)
+                    )
                     # Don't set status from YAML, let it be determined by actual files
                     # This prevents status from one deck affecting another
                     card.status = "pending"
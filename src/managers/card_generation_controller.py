@@ -11,15 +11,23 @@ maintainability, and testability.
 """
 
 import contextlib
+import fnmatch
+import io
 import os
-import subprocess
+import queue
+import re
+import shutil
 import sys
+import threading
+import time
+import traceback
 from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Protocol
 
+from PIL import Image
 from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QInputDialog, QMessageBox, QProgressBar, QWidget
 
@@ -29,7 +37,7 @@ if TYPE_CHECKING:
 else:
     # Try to import from domain model first (PR branch)
     try:
-        from src.domain.models import MTGCard, escape_for_shell, make_safe_filename
+        from src.domain.models import MTGCard, make_safe_filename
     except ImportError:
         # Fallback to importing from mtg_deck_builder (main branch)
         root_path = Path(__file__).parent.parent.parent
@@ -37,7 +45,7 @@ else:
             sys.path.insert(0, str(root_path))
 
         try:
-            from mtg_deck_builder import MTGCard, escape_for_shell, make_safe_filename
+            from mtg_deck_builder import MTGCard, make_safe_filename
         except ImportError:
             # Final fallback to protocol definition
             from typing import Protocol
@@ -64,6 +72,10 @@ else:
                     """Get the command to generate this card."""
                     ...
 
+                def get_generate_kwargs(self, model: str, style: str) -> dict:
+                    """Get the generate_card.generate options for this card."""
+                    ...
+
                 def is_creature(self) -> bool:
                     """Check if this card is a creature."""
                     ...
@@ -73,13 +85,6 @@ else:
                 """Convert a card name to a safe filename."""
                 return name.replace(" ", "_").replace("/", "_")
 
-            def escape_for_shell(text: str) -> str:
-                """Escape text for shell command."""
-                # Replace double quotes with escaped double quotes
-                text = str(text).replace('"', '\\"')
-                # Return with double quotes around it
-                return f'"{text}"'
-
 
 # Protocol definitions for dependency injection
 class Logger(Protocol):
@@ -235,6 +240,100 @@ class GenerationStatistics:
         }
 
 
+# Log level for a line of generate_card output as (level, pattern, tag_source)
+_LOG_LINE_RULES = (
+    ("SUCCESS", re.compile("✅|SUCCESS"), False),
+    ("ERROR", re.compile("❌|ERROR|Failed"), False),
+    (
+        "ERROR",
+        re.compile("missing|invalid|corrupted|black regions|too dark", re.IGNORECASE),
+        True,
+    ),
+    ("WARNING", re.compile("\u26a0|WARNING"), False),
+    ("GENERATING", re.compile("🎨|Generating"), False),
+    ("INFO", re.compile("INFO|📋|🔍"), False),
+    ("DEBUG", re.compile("DEBUG"), False),
+)
+
+
+class _LineWriter(io.TextIOBase):
+    """Text stream that passes each complete line to a callback as written."""
+
+    def __init__(self, on_line: Callable[[str], None]):
+        super().__init__()
+        self._on_line = on_line
+        self._partial = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._on_line(line)
+        return len(text)
+
+    def close(self) -> None:
+        if self._partial:
+            self._on_line(self._partial)
+            self._partial = ""
+        super().close()
+
+
+class _ThreadOutput:
+    """
+    Stand-in for sys.stdout or sys.stderr that routes writes per thread.
+
+    Threads inside capture() write to their own stream; every other thread
+    keeps writing to the stream that was installed before.
+    """
+
+    _install_lock = threading.Lock()
+    _captures = 0
+    _installed = None
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, "stream", None) or self._stream
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._target(), name)
+
+    @classmethod
+    @contextlib.contextmanager
+    def capture(cls, stdout, stderr):
+        """Send this thread's stdout and stderr to the given streams."""
+        with cls._install_lock:
+            if cls._captures == 0:
+                cls._installed = (cls(sys.stdout), cls(sys.stderr))
+                sys.stdout, sys.stderr = cls._installed
+            cls._captures += 1
+            out, err = cls._installed
+        out._local.stream, err._local.stream = stdout, stderr
+        try:
+            yield
+        finally:
+            out._local.stream = err._local.stream = None
+            with cls._install_lock:
+                cls._captures -= 1
+                # Put the original streams back unless someone replaced ours
+                if cls._captures == 0:
+                    if sys.stdout is out:
+                        sys.stdout = out._stream
+                    if sys.stderr is err:
+                        sys.stderr = err._stream
+
+
 class CardGeneratorWorker(QThread):
     """Worker thread for card generation"""
 
@@ -243,6 +342,10 @@ class CardGeneratorWorker(QThread):
         int, bool, str, str, str
     )  # card_id, success, message, image_path, card_path
     log_message = pyqtSignal(str, str)  # level, message - for thread-safe logging
+    log_batch = pyqtSignal(list)  # [(level, message), ...] - one burst of lines
+
+    # Rendered cards are validated on a copy reduced to about this height
+    VALIDATION_HEIGHT = 256
 
     def __init__(self):
         super().__init__()
@@ -253,6 +356,12 @@ class CardGeneratorWorker(QThread):
         self.current_card = None
         self.theme = "default"
         self.output_dir = None
+        self._generate = None  # generate_card.generate, imported on first use
+        # DEBUG lines are formatted and emitted only while set (mirrors the
+        # main window's debug_enabled, which its Debug checkbox sets)
+        self.debug_enabled = True
+        # Held while scanning or renaming files in the output directories
+        self._files_lock = threading.Lock()
 
     def set_cards(
         self,
@@ -305,6 +414,24 @@ class CardGeneratorWorker(QThread):
         # Note: We can't directly access GUI elements from worker thread
         # Use signals instead for thread-safe communication
 
+        # Validation and saving run on a second thread, one card behind
+        finish_queue = queue.Queue()
+        finisher = threading.Thread(
+            target=self._finish_cards, args=(finish_queue,), daemon=True
+        )
+        finisher.start()
+        try:
+            self._generate_cards(finish_queue)
+        finally:
+            finish_queue.put(None)
+            finisher.join()
+
+    def _generate_cards(self, finish_queue: queue.Queue) -> None:
+        """Generate each queued card and hand it to the finishing thread."""
+        # Output directories are the same for every card in the queue
+        cards_dir_abs = str(self.cards_dir.absolute())
+        images_dir_abs = str(self.images_dir.absolute())
+
         for card in self.cards_queue:
             if self.paused:
                 while self.paused:
@@ -312,25 +439,26 @@ class CardGeneratorWorker(QThread):
 
             self.current_card = card
             # Debug logging for ID tracking
-            self.log_message.emit(
-                "DEBUG",
-                f"Processing card: {card.name} with ID: {card.id} (type: {type(card.id)})",
+            self._debug(
+                "Processing card: %s with ID: %s (type: %s)",
+                card.name,
+                card.id,
+                type(card.id),
             )
             self.progress.emit(card.id, "generating")
 
             try:
-                # Build command with output directories
-                command = card.get_command(self.model, self.style)
+                # Build generation options with output directories
+                kwargs = card.get_generate_kwargs(self.model, self.style)
 
                 # Add output directory parameters with absolute paths
-                cards_dir_abs = self.cards_dir.absolute()
-                images_dir_abs = self.images_dir.absolute()
-                command += f" --output {escape_for_shell(str(cards_dir_abs))}"
-                command += f" --images-output {escape_for_shell(str(images_dir_abs))}"
+                kwargs["output"] = cards_dir_abs
+                kwargs["images_output"] = images_dir_abs
 
-                self.log_message.emit(
-                    "DEBUG",
-                    f"Output directories: cards={cards_dir_abs}, images={images_dir_abs}",
+                self._debug(
+                    "Output directories: cards=%s, images=%s",
+                    cards_dir_abs,
+                    images_dir_abs,
                 )
 
                 # Check if this is card-only regeneration
@@ -341,21 +469,19 @@ class CardGeneratorWorker(QThread):
                     self.log_message.emit(
                         "INFO", f"Card-only regeneration mode for: {card.name}"
                     )
-                    self.log_message.emit(
-                        "DEBUG", f"Existing artwork path: {card.image_path}"
-                    )
+                    self._debug("Existing artwork path: %s", card.image_path)
 
                     # If we have an image path, use --custom-image instead of generating new artwork
                     if card.image_path and Path(card.image_path).exists():
-                        # Use --custom-image flag with the existing artwork
-                        command += f" --custom-image {escape_for_shell(str(Path(card.image_path).absolute()))}"
-                        self.log_message.emit(
-                            "DEBUG",
-                            f"Using existing artwork with --custom-image: {card.image_path}",
+                        # Use the existing artwork as a custom image
+                        kwargs["custom_image"] = str(Path(card.image_path).absolute())
+                        self._debug(
+                            "Using existing artwork with --custom-image: %s",
+                            card.image_path,
                         )
                     else:
                         # If no existing image, still skip image generation (will use placeholder)
-                        command += " --skip-image"
+                        kwargs["skip_image"] = True
                         self.log_message.emit(
                             "WARNING",
                             "No existing artwork found for card-only regeneration",
@@ -366,420 +492,433 @@ class CardGeneratorWorker(QThread):
                         "INFO", f"Full generation mode for: {card.name}"
                     )
 
-                self.log_message.emit("DEBUG", f"Command: {command}")
+                # Equivalent command line, for debugging only
+                if self.debug_enabled:
+                    self._debug("Command: %s", card.get_command(self.model, self.style))
 
-                # Execute command from project root directory
-                project_root = Path(__file__).parent.parent.parent
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    cwd=str(project_root),
-                )
+                # Output is logged line by line while the card generates
+                error = self._generate_card(kwargs)
 
-                # Log ALL output from the subprocess
-                if result.stdout:
-                    # Split stdout by lines and log each line
-                    for line in result.stdout.strip().split("\n"):
-                        if line.strip():
-                            # Parse the line to extract log level if present
-                            line_lower = line.lower()
-                            if "" in line or "SUCCESS" in line:
-                                self.log_message.emit("SUCCESS", line)
-                            elif "" in line or "ERROR" in line or "Failed" in line:
-                                self.log_message.emit("ERROR", line)
-                            elif any(
-                                err in line_lower
-                                for err in [
-                                    "missing",
-                                    "invalid",
-                                    "corrupted",
-                                    "black regions",
-                                    "too dark",
-                                ]
-                            ):
-                                self.log_message.emit(
-                                    "ERROR", f"[generate_card.py] {line}"
-                                )
-                            elif "" in line or "WARNING" in line:
-                                self.log_message.emit("WARNING", line)
-                            elif "" in line or "Generating" in line:
-                                self.log_message.emit("GENERATING", line)
-                            elif "INFO" in line or "" in line or "" in line:
-                                self.log_message.emit("INFO", line)
-                            elif "DEBUG" in line:
-                                self.log_message.emit("DEBUG", line)
-                            else:
-                                # Default to INFO for other output
-                                self.log_message.emit("INFO", line)
-
-                # Log stderr if there are errors
-                if result.stderr:
-                    for line in result.stderr.strip().split("\n"):
-                        if line.strip():
-                            self.log_message.emit("ERROR", f"[generate_card.py] {line}")
-
-                if result.returncode == 0:
-                    # Try to locate generated files in deck-specific directories
-                    safe_name = make_safe_filename(card.name)
-
-                    # List all files in output directory for debugging
-                    if self.cards_dir.exists():
-                        all_files = list(self.cards_dir.glob("*.png"))
-                        self.log_message.emit(
-                            "DEBUG",
-                            f"Files in cards directory: {[f.name for f in all_files]}",
-                        )
-
-                    # Find actual generated files
-                    default_card_path = None
-                    default_art_path = None
-
-                    # Use deck-specific directories
-                    cards_dir = self.cards_dir
-                    images_dir = self.images_dir
-
-                    # Check cards directory for files matching the pattern
-                    if cards_dir.exists():
-                        # Get the most recently created PNG file in the directory
-                        # This is more reliable than pattern matching for custom images
-                        recent_files = sorted(
-                            cards_dir.glob("*.png"),
-                            key=lambda p: p.stat().st_mtime,
-                            reverse=True,
-                        )
-
-                        if recent_files:
-                            # Check if the most recent file was created within last 10 seconds
-                            import time
-
-                            current_time = time.time()
-                            for recent_file in recent_files[
-                                :3
-                            ]:  # Check the 3 most recent files
-                                file_mtime = recent_file.stat().st_mtime
-                                if (
-                                    current_time - file_mtime < 10
-                                ):  # Created within last 10 seconds
-                                    default_card_path = recent_file
-                                    self.log_message.emit(
-                                        "INFO",
-                                        f"Found recently generated card at: {default_card_path}",
-                                    )
-                                    break
-
-                        # If not found by recency, try pattern matching
-                        if not default_card_path:
-                            # First try with normal safe name
-                            normal_safe_name = card.name.replace(" ", "_").replace(
-                                "/", "_"
-                            )
-                            pattern = f"{normal_safe_name}_*.png"
-                            matching_files = list(cards_dir.glob(pattern))
-
-                            # If not found, try with the heavily escaped safe name
-                            if not matching_files:
-                                pattern = f"{safe_name}_*.png"
-                                matching_files = list(cards_dir.glob(pattern))
-
-                            if matching_files:
-                                # Get the most recent file
-                                matching_files.sort(
-                                    key=lambda p: p.stat().st_mtime, reverse=True
-                                )
-                                default_card_path = matching_files[0]
-                                self.log_message.emit(
-                                    "INFO", f"Found card image at: {default_card_path}"
-                                )
-
-                    # If not found in cards, check images directory
-                    if not default_card_path and images_dir.exists():
-                        pattern = f"{safe_name}_*.png"
-                        matching_files = list(images_dir.glob(pattern))
-                        if matching_files:
-                            matching_files.sort(
-                                key=lambda p: p.stat().st_mtime, reverse=True
-                            )
-                            default_card_path = matching_files[0]
-                            self.log_message.emit(
-                                "INFO", f"Found card image at: {default_card_path}"
-                            )
-
-                    # Also try exact name without timestamp as fallback
-                    if not default_card_path:
-                        primary_path = cards_dir / f"{safe_name}.png"
-                        if primary_path.exists():
-                            default_card_path = primary_path
-                            self.log_message.emit(
-                                "INFO", f"Found card image at: {primary_path}"
-                            )
-
-                    # If still not found, try to find any recent PNG files
-                    if not default_card_path and cards_dir.exists():
-                        recent_files = sorted(
-                            cards_dir.glob("*.png"),
-                            key=lambda p: p.stat().st_mtime,
-                            reverse=True,
-                        )
-                        if recent_files:
-                            # Take the most recent file that doesn't have _art in the name
-                            for f in recent_files:
-                                if "_art" not in f.name and "artwork" not in f.name:
-                                    default_card_path = f
-                                    self.log_message.emit(
-                                        "INFO", f"Using most recent card file: {f}"
-                                    )
-                                    break
-
-                    # Check for art/image files in output/images/
-                    if images_dir.exists():
-                        # Look for artwork with various naming patterns
-                        art_patterns = [
-                            f"{safe_name}.jpg",
-                            f"{safe_name}.jpeg",
-                            f"{safe_name}.png",
-                            f"{card.name.split(',')[0].strip()}.jpg",  # Try simple name (e.g., "Mountain" for "Mountain, Basic")
-                            f"{card.name.split(',')[0].strip()}.jpeg",
-                            f"{card.name.split(',')[0].strip()}.png",
-                        ]
-
-                        for pattern in art_patterns:
-                            art_path = images_dir / pattern
-                            if art_path.exists():
-                                default_art_path = art_path
-                                self.log_message.emit(
-                                    "INFO", f"Found artwork at: {art_path}"
-                                )
-                                break
-
-                    # Check for art files
-                    if default_card_path and not default_art_path:
-                        # Try to find corresponding art file
-                        base_name = default_card_path.stem
-                        possible_art_names = [
-                            f"{base_name}_art",
-                            f"{base_name}_artwork",
-                            f"{base_name}-art",
-                            base_name.replace("_card", "_art"),
-                        ]
+                if not error:
+                    # Locate the files now, before the next card adds newer ones
+                    with self._files_lock:
+                        card_file, art_file = self._locate_generated_files(card)
+                    finish_queue.put((card, None, card_file, art_file))
+                else:
+                    # Generation failed - log detailed error information,
+                    # the whole traceback in one emission
+                    lines = [("ERROR", f"Card generation failed for: {card.name}")]
+                    lines.extend(
+                        ("ERROR", f"[generate_card.py] {line}")
+                        for line in error.splitlines()
+                        if line.strip()
+                    )
+                    self.log_batch.emit(lines)
 
-                        for art_name in possible_art_names:
-                            art_path = default_card_path.parent / f"{art_name}.png"
-                            if art_path.exists():
-                                default_art_path = art_path
-                                self.log_message.emit(
-                                    "INFO", f"Found art image at: {art_path}"
-                                )
-                                break
-
-                    # Use the actual generated file paths
-                    card_path = ""
-                    image_path = ""
-
-                    if default_card_path and default_card_path.exists():
-                        # For custom images, keep the original filename from generation
-                        # Don't rename to safe_name as it may not match
-                        if self.theme == "custom_image" or self.style == "custom_image":
-                            final_path = default_card_path
-                        else:
-                            # Target path without timestamp for non-custom images
-                            final_path = self.cards_dir / f"{safe_name}.png"
+                    finish_queue.put((card, error, None, None))
+                    # Stop on error
+                    break
 
-                        try:
-                            # Validate the generated card before saving
-                            import numpy as np
-                            from PIL import Image
-
-                            # Open and check the image
-                            with Image.open(default_card_path) as img:
-                                # Convert to RGB if needed
-                                if img.mode != "RGB":
-                                    img = img.convert("RGB")
-
-                                # Check if image is mostly black (potential rendering error)
-                                img_array = np.array(img)
-                                # Calculate average brightness (0-255)
-                                avg_brightness = img_array.mean()
-
-                                # Check different regions of the card for black sections
-                                height, width = img_array.shape[:2]
-
-                                # Sample regions
-                                regions = {
-                                    "top (title/cost)": img_array[: height // 4],
-                                    "upper-middle (artwork)": img_array[
-                                        height // 4 : height // 2
-                                    ],
-                                    "lower-middle (type/text)": img_array[
-                                        height // 2 : 3 * height // 4
-                                    ],
-                                    "bottom (P/T)": img_array[3 * height // 4 :],
-                                }
-
-                                # Check each region
-                                black_regions = []
-                                for region_name, region_data in regions.items():
-                                    region_brightness = region_data.mean()
-                                    self.log_message.emit(
-                                        "DEBUG",
-                                        f"Region '{region_name}' brightness: {region_brightness:.1f}/255",
-                                    )
-                                    if region_brightness < 30:
-                                        black_regions.append(region_name)
-
-                                # If image is too dark, it's likely a rendering error
-                                if avg_brightness < 30:
-                                    self.log_message.emit(
-                                        "ERROR",
-                                        f"Card appears corrupted (brightness: {avg_brightness:.1f}/255)",
-                                    )
-                                    self.log_message.emit(
-                                        "ERROR",
-                                        f"Black regions: {', '.join(black_regions) if black_regions else 'entire card'}",
-                                    )
-
-                                    # Log card data for debugging
-                                    self.log_message.emit("ERROR", "Card data debug:")
-                                    self.log_message.emit(
-                                        "ERROR", f"  Name: {card.name}"
-                                    )
-                                    self.log_message.emit(
-                                        "ERROR", f"  Cost: {card.cost}"
-                                    )
-                                    self.log_message.emit(
-                                        "ERROR", f"  Type: {card.type}"
-                                    )
-                                    self.log_message.emit(
-                                        "ERROR", f"  P/T: {card.power}/{card.toughness}"
-                                    )
-                                    self.log_message.emit(
-                                        "ERROR", f"  Rarity: {card.rarity}"
-                                    )
-
-                                    # Check if it's a creature without P/T
-                                    if card.is_creature() and (
-                                        not card.power or not card.toughness
-                                    ):
-                                        self.log_message.emit(
-                                            "ERROR", " Creature missing P/T values!"
-                                        )
-
-                                    raise Exception(
-                                        f"Card corrupted (black in: {', '.join(black_regions)})"
-                                    )
-                                elif black_regions:
-                                    self.log_message.emit(
-                                        "WARNING",
-                                        f"Card has black regions in: {', '.join(black_regions)}",
-                                    )
-                                    self.log_message.emit(
-                                        "WARNING",
-                                        f"May indicate missing data for: {card.name}",
-                                    )
-
-                            # For custom images, just use the path as-is
-                            # For other images, rename to remove timestamp
-                            if (
-                                self.theme == "custom_image"
-                                or self.style == "custom_image"
-                                or final_path == default_card_path
-                            ):
-                                # Don't move/rename for custom images
-                                card_path = str(default_card_path)
-                            else:
-                                # Move/rename the file to remove timestamp
-                                import shutil
-
-                                if final_path.exists():
-                                    final_path.unlink()  # Remove old file if exists
-                                shutil.move(str(default_card_path), str(final_path))
-                                card_path = str(final_path)
-                            self.log_message.emit(
-                                "INFO", f"Card saved: {final_path.name}"
-                            )
-
-                            # Clean up JSON file if it exists
-                            json_path = default_card_path.with_suffix(".json")
-                            if json_path.exists():
-                                try:
-                                    json_path.unlink()
-                                    self.log_message.emit(
-                                        "DEBUG", f"Cleaned up JSON: {json_path.name}"
-                                    )
-                                except:
-                                    pass
-                        except Exception as e:
-                            # If move fails, use the original path
-                            card_path = str(default_card_path)
-                            self.log_message.emit(
-                                "WARNING", f"Could not rename file: {e}"
-                            )
-                    else:
-                        self.log_message.emit(
-                            "WARNING", f"No card image found for {card.name}"
-                        )
+            except Exception as e:
+                self.log_message.emit(
+                    "ERROR", f"Exception during card generation: {str(e)}"
+                )
+                finish_queue.put((card, str(e), None, None))
+                break
 
-                    # Set image_path from artwork if found
-                    if default_art_path and default_art_path.exists():
-                        image_path = str(default_art_path)
+    def _finish_cards(self, finish_queue: queue.Queue) -> None:
+        """
+        Validate and save generated cards until a None sentinel arrives.
 
-                    # Log the successful generation with file paths
-                    # Make sure we have absolute paths
-                    if card_path and not Path(card_path).is_absolute():
-                        card_path = str(Path(card_path).resolve())
-                    if image_path and not Path(image_path).is_absolute():
-                        image_path = str(Path(image_path).resolve())
+        Runs on its own thread so opening and checking one card overlaps
+        with generating the next. Every completed signal is emitted from
+        here, in queue order.
+        """
+        while (item := finish_queue.get()) is not None:
+            card, error, card_file, art_file = item
+            if error is not None:
+                self.completed.emit(card.id, False, error, "", "")
+                continue
+            try:
+                self._finish_card(card, card_file, art_file)
+            except Exception as e:
+                self.log_message.emit(
+                    "ERROR", f"Exception while saving {card.name}: {str(e)}"
+                )
+                self.completed.emit(card.id, False, str(e), "", "")
 
-                    # Debug: log what we're emitting
+    def _locate_generated_files(
+        self, card: MTGCard
+    ) -> tuple[Optional[Path], Optional[Path]]:
+        """Find the rendered card and artwork files for a just generated card."""
+        safe_name = make_safe_filename(card.name)
+
+        # Use deck-specific directories
+        cards_dir = self.cards_dir
+        images_dir = self.images_dir
+
+        # Scan the cards directory once; every lookup below uses this snapshot
+        card_files = self._scan_pngs(cards_dir)
+
+        # List all files in output directory for debugging
+        if card_files and self.debug_enabled:
+            self._debug("Files in cards directory: %s", [f.name for f, _ in card_files])
+
+        # Find actual generated files
+        default_card_path = None
+        default_art_path = None
+
+        # Check cards directory for files matching the pattern
+        if card_files:
+            # Get the most recently created PNG file in the directory
+            # This is more reliable than pattern matching for custom images
+            # Check if the most recent file was created within last 10 seconds
+            current_time = time.time()
+            for recent_file, file_mtime in card_files[:3]:  # 3 most recent files
+                if current_time - file_mtime < 10:  # Created within last 10 seconds
+                    default_card_path = recent_file
                     self.log_message.emit(
-                        "DEBUG",
-                        f"Emitting completed signal for card {card.name} with ID: {card.id}",
-                    )
-                    self.log_message.emit("DEBUG", f"Card path: {card_path}")
-                    self.log_message.emit("DEBUG", f"Image path: {image_path}")
-                    self.completed.emit(
-                        card.id,
-                        True,
-                        "Card generated successfully",
-                        image_path,
-                        card_path,
-                    )
-                else:
-                    # Command failed - log detailed error information
-                    error_msg = (
-                        result.stderr
-                        if result.stderr
-                        else "Command failed with no error message"
+                        "INFO",
+                        f"Found recently generated card at: {default_card_path}",
                     )
+                    break
 
+            # If not found by recency, try pattern matching
+            if not default_card_path:
+                # First try with normal safe name, then the heavily escaped one
+                normal_safe_name = card.name.replace(" ", "_").replace("/", "_")
+                default_card_path = self._newest_match(
+                    card_files, f"{normal_safe_name}_*.png"
+                ) or self._newest_match(card_files, f"{safe_name}_*.png")
+                if default_card_path:
                     self.log_message.emit(
-                        "ERROR", f"Card generation failed for: {card.name}"
+                        "INFO", f"Found card image at: {default_card_path}"
                     )
-                    self.log_message.emit("ERROR", f"Exit code: {result.returncode}")
 
-                    # Log any stdout that might contain error info
-                    if result.stdout:
-                        for line in result.stdout.strip().split("\n"):
-                            if line.strip():
-                                self.log_message.emit("ERROR", f"[stdout] {line}")
+        # If not found in cards, check images directory
+        if not default_card_path:
+            default_card_path = self._newest_match(
+                self._scan_pngs(images_dir), f"{safe_name}_*.png"
+            )
+            if default_card_path:
+                self.log_message.emit(
+                    "INFO", f"Found card image at: {default_card_path}"
+                )
 
-                    # Log stderr
-                    if result.stderr:
-                        for line in result.stderr.strip().split("\n"):
-                            if line.strip():
-                                self.log_message.emit("ERROR", f"[stderr] {line}")
+        # Also try exact name without timestamp as fallback
+        if not default_card_path:
+            primary_path = cards_dir / f"{safe_name}.png"
+            if any(f == primary_path for f, _ in card_files):
+                default_card_path = primary_path
+                self.log_message.emit("INFO", f"Found card image at: {primary_path}")
+
+        # If still not found, take the most recent file that isn't artwork
+        if not default_card_path:
+            for f, _ in card_files:
+                if "_art" not in f.name and "artwork" not in f.name:
+                    default_card_path = f
+                    self.log_message.emit("INFO", f"Using most recent card file: {f}")
+                    break
 
-                    self.completed.emit(card.id, False, error_msg, "", "")
-                    # Stop on error
+        # Check for art/image files in output/images/
+        try:
+            image_names = set(os.listdir(images_dir))
+        except OSError:
+            image_names = set()
+
+        # Look for artwork with various naming patterns
+        simple_name = card.name.split(",")[0].strip()
+        art_patterns = [
+            f"{safe_name}.jpg",
+            f"{safe_name}.jpeg",
+            f"{safe_name}.png",
+            f"{simple_name}.jpg",  # Try simple name (e.g., "Mountain" for "Mountain, Basic")
+            f"{simple_name}.jpeg",
+            f"{simple_name}.png",
+        ]
+
+        for pattern in art_patterns:
+            if pattern in image_names:
+                default_art_path = images_dir / pattern
+                self.log_message.emit("INFO", f"Found artwork at: {default_art_path}")
+                break
+
+        # Check for art files
+        if default_card_path and not default_art_path:
+            # Try to find corresponding art file
+            base_name = default_card_path.stem
+            possible_art_names = [
+                f"{base_name}_art",
+                f"{base_name}_artwork",
+                f"{base_name}-art",
+                base_name.replace("_card", "_art"),
+            ]
+
+            for art_name in possible_art_names:
+                art_path = default_card_path.parent / f"{art_name}.png"
+                if art_path.exists():
+                    default_art_path = art_path
+                    self.log_message.emit("INFO", f"Found art image at: {art_path}")
                     break
 
+        return default_card_path, default_art_path
+
+    @staticmethod
+    def _scan_pngs(directory: Path) -> list[tuple[Path, float]]:
+        """List (path, mtime) of the PNG files in directory, newest first."""
+        files = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".png") and entry.is_file():
+                        try:
+                            files.append((Path(entry.path), entry.stat().st_mtime))
+                        except OSError:
+                            pass  # Removed while scanning
+        except OSError:
+            return []
+        files.sort(key=lambda item: item[1], reverse=True)
+        return files
+
+    @staticmethod
+    def _newest_match(files: list[tuple[Path, float]], pattern: str) -> Optional[Path]:
+        """Newest file from a _scan_pngs listing whose name matches pattern."""
+        for path, _ in files:
+            if fnmatch.fnmatchcase(path.name, pattern):
+                return path
+        return None
+
+    def _finish_card(
+        self,
+        card: MTGCard,
+        default_card_path: Optional[Path],
+        default_art_path: Optional[Path],
+    ) -> None:
+        """Validate the rendered card, rename it and emit completed."""
+        safe_name = make_safe_filename(card.name)
+
+        # Use the actual generated file paths
+        card_path = ""
+        image_path = ""
+
+        if default_card_path and default_card_path.exists():
+            # For custom images, keep the original filename from generation
+            # Don't rename to safe_name as it may not match
+            if self.theme == "custom_image" or self.style == "custom_image":
+                final_path = default_card_path
+            else:
+                # Target path without timestamp for non-custom images
+                final_path = self.cards_dir / f"{safe_name}.png"
+
+            try:
+                # Validate the generated card before saving
+                # Average each block of rows in one pass over the pixels;
+                # the overall and region brightness are taken from those
+                with Image.open(default_card_path) as img:
+                    # Let JPEG decoders scale while decoding (no-op for PNG)
+                    img.draft("RGB", (img.width // 4, img.height // 4))
+                    # Convert to RGB if needed
+                    if img.mode != "RGB":
+                        img = img.convert("RGB")
+                    rows = self._row_brightness(img)
+
+                    # Check if image is mostly black (potential rendering error)
+                    # Calculate average brightness (0-255)
+                    height = len(rows)
+                    avg_brightness = sum(rows) / height
+
+                    # Sample regions as (top, bottom) row blocks
+                    regions = {
+                        "top (title/cost)": (0, height // 4),
+                        "upper-middle (artwork)": (height // 4, height // 2),
+                        "lower-middle (type/text)": (height // 2, 3 * height // 4),
+                        "bottom (P/T)": (3 * height // 4, height),
+                    }
+
+                    # Check each region
+                    black_regions = []
+                    for region_name, (top, bottom) in regions.items():
+                        region_brightness = sum(rows[top:bottom]) / max(1, bottom - top)
+                        self._debug(
+                            "Region '%s' brightness: %.1f/255",
+                            region_name,
+                            region_brightness,
+                        )
+                        if region_brightness < 30:
+                            black_regions.append(region_name)
+
+                    # If image is too dark, it's likely a rendering error
+                    if avg_brightness < 30:
+                        lines = [
+                            f"Card appears corrupted (brightness: {avg_brightness:.1f}/255)",
+                            f"Black regions: {', '.join(black_regions) if black_regions else 'entire card'}",
+                        ]
+                        # Card data dump, only built when someone reads it
+                        if self.debug_enabled:
+                            lines += [
+                                "Card data debug:",
+                                f"  Name: {card.name}",
+                                f"  Cost: {card.cost}",
+                                f"  Type: {card.type}",
+                                f"  P/T: {card.power}/{card.toughness}",
+                                f"  Rarity: {card.rarity}",
+                            ]
+
+                        # Check if it's a creature without P/T
+                        if card.is_creature() and (
+                            not card.power or not card.toughness
+                        ):
+                            lines.append(" Creature missing P/T values!")
+                        self.log_batch.emit([("ERROR", line) for line in lines])
+
+                        raise Exception(
+                            f"Card corrupted (black in: {', '.join(black_regions)})"
+                        )
+                    elif black_regions:
+                        self.log_message.emit(
+                            "WARNING",
+                            f"Card has black regions in: {', '.join(black_regions)}",
+                        )
+                        self.log_message.emit(
+                            "WARNING",
+                            f"May indicate missing data for: {card.name}",
+                        )
+
+                # For custom images, just use the path as-is
+                # For other images, rename to remove timestamp
+                if (
+                    self.theme == "custom_image"
+                    or self.style == "custom_image"
+                    or final_path == default_card_path
+                ):
+                    # Don't move/rename for custom images
+                    card_path = str(default_card_path)
+                else:
+                    # Move/rename the file to remove timestamp; a plain rename
+                    # replaces any old file in one step
+                    with self._files_lock:
+                        try:
+                            os.replace(default_card_path, final_path)
+                        except OSError:
+                            # Found on another filesystem; copy it over instead
+                            if final_path.exists():
+                                final_path.unlink()  # Remove old file if exists
+                            shutil.move(str(default_card_path), str(final_path))
+                    card_path = str(final_path)
+                self.log_message.emit("INFO", f"Card saved: {final_path.name}")
+
+                # Clean up JSON file if it exists
+                json_path = default_card_path.with_suffix(".json")
+                if json_path.exists():
+                    try:
+                        json_path.unlink()
+                        self._debug("Cleaned up JSON: %s", json_path.name)
+                    except OSError:
+                        pass
             except Exception as e:
+                # If move fails, use the original path
+                card_path = str(default_card_path)
+                self.log_message.emit("WARNING", f"Could not rename file: {e}")
+        else:
+            self.log_message.emit("WARNING", f"No card image found for {card.name}")
+
+        # Set image_path from artwork if found
+        if default_art_path and default_art_path.exists():
+            image_path = str(default_art_path)
+
+        # Log the successful generation with file paths
+        # Make sure we have absolute paths
+        if card_path and not Path(card_path).is_absolute():
+            card_path = str(Path(card_path).resolve())
+        if image_path and not Path(image_path).is_absolute():
+            image_path = str(Path(image_path).resolve())
+
+        # Debug: log what we're emitting
+        self._debug(
+            "Emitting completed signal for card %s with ID: %s", card.name, card.id
+        )
+        self._debug("Card path: %s", card_path)
+        self._debug("Image path: %s", image_path)
+        self.completed.emit(
+            card.id, True, "Card generated successfully", image_path, card_path
+        )
+
+    @classmethod
+    def _row_brightness(cls, img) -> list[float]:
+        """
+        Brightness (0-255) of each block of rows of a PIL image.
+
+        The image is box-reduced to a single column about VALIDATION_HEIGHT
+        pixels tall, so every pixel is read once; each remaining pixel is
+        then averaged over its bands.
+        """
+        bands = len(img.getbands())
+        factor = (img.width, max(1, img.height // cls.VALIDATION_HEIGHT))
+        column = img.reduce(factor).tobytes()
+        return [
+            sum(column[i : i + bands]) / bands for i in range(0, len(column), bands)
+        ]
+
+    def _debug(self, message: str, *args) -> None:
+        """Emit a DEBUG line; message % args is only built while debug is on."""
+        if self.debug_enabled:
+            self.log_message.emit("DEBUG", message % args if args else message)
+
+    def _classify_and_emit(self, line: str) -> None:
+        """Log one line of generate_card output at the level it suggests."""
+        if not line.strip():
+            return
+        # First matching rule wins, so earlier levels take precedence
+        for level, pattern, tag_source in _LOG_LINE_RULES:
+            if pattern.search(line):
+                if level == "DEBUG" and not self.debug_enabled:
+                    return
                 self.log_message.emit(
-                    "ERROR", f"Exception during card generation: {str(e)}"
+                    level, f"[generate_card.py] {line}" if tag_source else line
                 )
-                self.completed.emit(card.id, False, str(e), "", "")
-                break
+                return
+        # Default to INFO for other output
+        self.log_message.emit("INFO", line)
+
+    def _emit_stderr_line(self, line: str) -> None:
+        """Log one line generate_card wrote to stderr as an error."""
+        if line.strip():
+            self.log_message.emit("ERROR", f"[generate_card.py] {line}")
+
+    def _generate_card(self, kwargs: dict) -> str:
+        """
+        Run generate_card.generate in this process.
+
+        The module is imported on first use and kept for the rest of the
+        session, so interpreter startup and heavy imports are paid only once.
+
+        Args:
+            kwargs: Options from MTGCard.get_generate_kwargs
+
+        Returns:
+            Error text, or "" on success
+        """
+        if self._generate is None:
+            project_root = Path(__file__).parent.parent.parent
+            if str(project_root) not in sys.path:
+                sys.path.insert(0, str(project_root))
+            from generate_card import generate
+
+            self._generate = generate
+
+        # Only this thread's output is captured; the GUI thread keeps printing
+        # to the console
+        output = _LineWriter(self._classify_and_emit)
+        errors = _LineWriter(self._emit_stderr_line)
+        try:
+            with _ThreadOutput.capture(output, errors):
+                self._generate(**kwargs)
+        except (Exception, SystemExit):
+            return traceback.format_exc()
+        finally:
+            output.close()
+            errors.close()
+        return ""
 
 
 class CardGenerationController(QObject):
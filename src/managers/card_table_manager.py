@@ -24,6 +24,11 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem,
 )
 
+from src.domain.enums import normalize_rarity
+
+# The five colors; intersecting with a cost string scans it once
+_COLOR_SET = frozenset("WUBRG")
+
 
 class CardTableManager(QObject):
     """
@@ -71,6 +76,34 @@ class CardTableManager(QObject):
         "Image",
     ]
 
+    # Shared cell backgrounds for color identity violations
+    VIOLATION_BRUSH = QBrush(QColor(255, 200, 200))
+    VIOLATION_COST_BRUSH = QBrush(QColor(255, 150, 150))  # Stronger red
+
+    # Status color -> brush, filled as statuses are first shown
+    _STATUS_BRUSHES: dict[str, QBrush] = {}
+
+    # Type filter choice -> keywords in the type line (English and German)
+    TYPE_FILTER_KEYWORDS = {
+        "Creatures": ("kreatur", "creature"),
+        "Lands": ("land",),
+        "Instants": ("spontanzauber", "instant"),
+        "Sorceries": ("hexerei", "sorcery"),
+        "Artifacts": ("artefakt", "artifact"),
+        "Enchantments": ("verzauberung", "enchantment"),
+    }
+
+    # Status filter choice -> icon shown in the status column
+    STATUS_FILTER_ICONS = {
+        "✅ Completed": "✅",
+        "⏸️ Pending": "⏸️",
+        "❌ Failed": "❌",
+        "🔄 Generating": "🔄",
+    }
+
+    # Columns the search box looks in
+    SEARCH_COLUMNS = (COLUMN_NAME, COLUMN_COST, COLUMN_TYPE, COLUMN_TEXT, COLUMN_ART)
+
     # Column widths
     COLUMN_WIDTHS = {
         COLUMN_ID: 40,
@@ -171,34 +204,37 @@ class CardTableManager(QObject):
         self.cards = cards
         self.refresh_table()
 
-    def set_commander_colors(self, colors: set[str]):
+    def set_commander_colors(self, colors: set[str], refresh: bool = True):
         """
         Set the commander colors for color validation.
 
         Args:
             colors: Set of commander color identities
+            refresh: Whether to refresh now; pass False when a refresh follows
         """
         self.commander_colors = colors
-        self.refresh_table()  # Refresh to update color violations
+        if refresh:
+            self.refresh_table()  # Refresh to update color violations
 
     def refresh_table(self):
         """Refresh table display with current cards and color validation."""
-        # Temporarily disconnect itemChanged signal to avoid triggering saves during refresh
-        with contextlib.suppress(Exception):
-            self.table.itemChanged.disconnect()
-
+        # Repaint once when done rather than for every cell and hidden row
+        self.table.setUpdatesEnabled(False)
         try:
-            self.table.setRowCount(len(self.cards))
+            # Block table signals so populating cells doesn't trigger edits or saves
+            self.table.blockSignals(True)
+            try:
+                self.table.setRowCount(len(self.cards))
 
-            for row, card in enumerate(self.cards):
-                self._populate_table_row(row, card)
+                for row, card in enumerate(self.cards):
+                    self._populate_table_row(row, card)
+            finally:
+                self.table.blockSignals(False)
 
             # Apply current filters after refresh
             self.apply_filter()
-
         finally:
-            # Reconnect the signal
-            self.table.itemChanged.connect(self._on_item_changed)
+            self.table.setUpdatesEnabled(True)
 
     def _populate_table_row(self, row: int, card: Any):
         """
@@ -208,37 +244,10 @@ class CardTableManager(QObject):
             row: Row index
             card: MTG card object
         """
-        # Check if this card violates commander color identity
-        violates_colors = self._check_color_violation(card.cost)
-
         # ID column
         id_item = QTableWidgetItem()
         id_item.setData(Qt.ItemDataRole.DisplayRole, str(card.id))
         id_item.setData(Qt.ItemDataRole.UserRole, int(card.id))
-        if violates_colors:
-            id_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_ID, id_item)
-
-        # Name column
-        name_item = QTableWidgetItem(card.name)
-        if violates_colors:
-            name_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_NAME, name_item)
-
-        # Cost column - highlight in stronger red for violations
-        cost_item = QTableWidgetItem(card.cost)
-        if violates_colors:
-            cost_item.setBackground(QBrush(QColor(255, 150, 150)))
-            cost_item.setToolTip(
-                f"Color violation! Contains colors not in commander identity: {self.commander_colors}"
-            )
-        self.table.setItem(row, self.COLUMN_COST, cost_item)
-
-        # Type column
-        type_item = QTableWidgetItem(card.type)
-        if violates_colors:
-            type_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_TYPE, type_item)
 
         # Power/Toughness column
         pt_text = ""
@@ -249,50 +258,63 @@ class CardTableManager(QObject):
             and card.toughness is not None
         ):
             pt_text = f"{card.power}/{card.toughness}"
-        pt_item = QTableWidgetItem(pt_text)
-        if violates_colors:
-            pt_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_PT, pt_item)
-
-        # Text column
-        text_display = card.text[:50] + "..." if len(card.text) > 50 else card.text
-        text_item = QTableWidgetItem(text_display)
-        text_item.setToolTip(card.text)
-        if violates_colors:
-            text_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_TEXT, text_item)
-
-        # Rarity column
-        rarity_item = QTableWidgetItem(card.rarity.title())
-        if violates_colors:
-            rarity_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_RARITY, rarity_item)
-
-        # Art description column
-        art_display = card.art[:50] + "..." if len(card.art) > 50 else card.art
-        art_item = QTableWidgetItem(art_display)
-        art_item.setToolTip(card.art)
-        if violates_colors:
-            art_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_ART, art_item)
+
+        # Text and art description columns are truncated, full text in tooltip
+        text = card.text
+        text_item = QTableWidgetItem(text[:50] + "..." if len(text) > 50 else text)
+        text_item.setToolTip(text)
+        art = card.art
+        art_item = QTableWidgetItem(art[:50] + "..." if len(art) > 50 else art)
+        art_item.setToolTip(art)
 
         # Status column with styling
         status_text, status_color = self._get_status_display(card)
         status_item = QTableWidgetItem(status_text)
         if status_color:
-            status_item.setBackground(QBrush(QColor(status_color)))
-        if violates_colors and not status_color:
-            status_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_STATUS, status_item)
+            status_item.setBackground(self._status_brush(status_color))
 
         # Image column
         image_text = (
             "✅ Yes" if (hasattr(card, "image_path") and card.image_path) else "❌ No"
         )
-        image_item = QTableWidgetItem(image_text)
-        if violates_colors:
-            image_item.setBackground(QBrush(QColor(255, 200, 200)))
-        self.table.setItem(row, self.COLUMN_IMAGE, image_item)
+
+        # In column order
+        items = (
+            id_item,
+            QTableWidgetItem(card.name),
+            QTableWidgetItem(card.cost),
+            QTableWidgetItem(card.type),
+            QTableWidgetItem(pt_text),
+            text_item,
+            QTableWidgetItem(card.rarity.title()),
+            art_item,
+            status_item,
+            QTableWidgetItem(image_text),
+        )
+
+        # Highlight cards that violate commander color identity, the cost
+        # in stronger red; done before placing items so no edits are reported
+        if self._check_color_violation(card.cost):
+            for item in items:
+                if item is not status_item or not status_color:
+                    item.setBackground(self.VIOLATION_BRUSH)
+            cost_item = items[self.COLUMN_COST]
+            cost_item.setBackground(self.VIOLATION_COST_BRUSH)
+            cost_item.setToolTip(
+                f"Color violation! Contains colors not in commander identity: {self.commander_colors}"
+            )
+
+        set_item = self.table.setItem
+        for column, item in enumerate(items):
+            set_item(row, column, item)
+
+    @classmethod
+    def _status_brush(cls, color: str) -> QBrush:
+        """Get the shared background brush for a status color."""
+        brush = cls._STATUS_BRUSHES.get(color)
+        if brush is None:
+            brush = cls._STATUS_BRUSHES[color] = QBrush(QColor(color))
+        return brush
 
     def _get_status_display(self, card: Any) -> tuple[str, Optional[str]]:
         """
@@ -328,13 +350,7 @@ class CardTableManager(QObject):
             return False
 
         # Extract color symbols from mana cost
-        cost_colors = set()
-        cost_upper = mana_cost.upper()
-
-        color_symbols = ["W", "U", "B", "R", "G"]
-        for symbol in color_symbols:
-            if symbol in cost_upper:
-                cost_colors.add(symbol)
+        cost_colors = _COLOR_SET.intersection(mana_cost.upper())
 
         # Check if any cost colors are not in commander colors
         return bool(cost_colors - self.commander_colors)
@@ -403,45 +419,23 @@ class CardTableManager(QObject):
 
     def _matches_type_filter(self, card_type: str, filter_text: str) -> bool:
         """Check if card type matches the type filter."""
-        type_mappings = {
-            "Creatures": ["kreatur", "creature"],
-            "Lands": ["land"],
-            "Instants": ["spontanzauber", "instant"],
-            "Sorceries": ["hexerei", "sorcery"],
-            "Artifacts": ["artefakt", "artifact"],
-            "Enchantments": ["verzauberung", "enchantment"],
-        }
-
-        if filter_text in type_mappings:
-            return any(keyword in card_type for keyword in type_mappings[filter_text])
+        keywords = self.TYPE_FILTER_KEYWORDS.get(filter_text)
+        if keywords:
+            return any(keyword in card_type for keyword in keywords)
 
         return True
 
     def _matches_status_filter(self, status_text: str, status_filter: str) -> bool:
         """Check if status text matches the status filter."""
-        status_mappings = {
-            "✅ Completed": "✅",
-            "⏸️ Pending": "⏸️",
-            "❌ Failed": "❌",
-            "🔄 Generating": "🔄",
-        }
-
-        if status_filter in status_mappings:
-            return status_mappings[status_filter] in status_text
+        icon = self.STATUS_FILTER_ICONS.get(status_filter)
+        if icon:
+            return icon in status_text
 
         return True
 
     def _matches_search_filter(self, row: int, search_text: str) -> bool:
         """Check if any cell in the row matches the search text."""
-        searchable_columns = [
-            self.COLUMN_NAME,
-            self.COLUMN_COST,
-            self.COLUMN_TYPE,
-            self.COLUMN_TEXT,
-            self.COLUMN_ART,
-        ]
-
-        for col in searchable_columns:
+        for col in self.SEARCH_COLUMNS:
             item = self.table.item(row, col)
             if item and search_text in item.text().lower():
                 return True
@@ -537,15 +531,14 @@ class CardTableManager(QObject):
             card.type = new_value
         elif column == self.COLUMN_PT:
             # Parse P/T like "2/3" or "*/4"
-            if "/" in new_value:
-                parts = new_value.split("/")
-                if len(parts) == 2:
-                    card.power = parts[0].strip()
-                    card.toughness = parts[1].strip()
+            power, sep, toughness = new_value.partition("/")
+            if sep and "/" not in toughness:
+                card.power = power.strip()
+                card.toughness = toughness.strip()
         elif column == self.COLUMN_TEXT:
             card.text = new_value
         elif column == self.COLUMN_RARITY:
-            card.rarity = new_value.lower()
+            card.rarity = normalize_rarity(new_value)
         elif column == self.COLUMN_ART:
             card.art = new_value
         elif column == self.COLUMN_STATUS:
@@ -649,11 +642,33 @@ class CardTableManager(QObject):
             position: Optional position to insert at (None = append)
         """
         if position is None:
-            self.cards.append(card)
-        else:
-            self.cards.insert(position, card)
+            position = len(self.cards)
+        self.cards.insert(position, card)
 
-        self.refresh_table()
+        self.insert_card_row(position)
+
+    def insert_card_row(self, row: int):
+        """
+        Show a card that was just inserted into the cards list.
+
+        Only the new row is populated; the table falls back to a full
+        refresh if it was not in sync with the cards list beforehand.
+
+        Args:
+            row: Index of the new card in the cards list
+        """
+        if self.table.rowCount() != len(self.cards) - 1:
+            self.refresh_table()
+            return
+
+        self.table.blockSignals(True)
+        try:
+            self.table.insertRow(row)
+            self._populate_table_row(row, self.cards[row])
+        finally:
+            self.table.blockSignals(False)
+
+        self.apply_filter()
 
     def get_card_count(self) -> int:
         """Get the total number of cards in the table."""
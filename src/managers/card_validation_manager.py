@@ -7,8 +7,39 @@ in the MTG Card Generator application. It encapsulates commander color identity
 validation, mana cost checking, and violation reporting.
 """
 
+import re
+from functools import lru_cache
 from typing import Optional
 
+# The five colors; intersecting with a cost string scans it once
+_COLOR_SET = frozenset("WUBRG")
+
+# Hybrid mana symbols that add both their colors to a commander's identity
+_HYBRID_TOKENS = frozenset(
+    {
+        "{W/U}",
+        "{U/B}",
+        "{B/R}",
+        "{R/G}",
+        "{G/W}",
+        "{W/B}",
+        "{U/R}",
+        "{B/G}",
+        "{R/W}",
+        "{G/U}",
+    }
+)
+# Finds every hybrid symbol in a rules text in one scan
+_HYBRID_RE = re.compile("|".join(map(re.escape, sorted(_HYBRID_TOKENS))))
+
+
+@lru_cache(maxsize=512)
+def _cost_colors(card_cost) -> frozenset[str]:
+    """Colors in a mana cost; no logging, for per-card loops over repeated costs."""
+    if not card_cost or card_cost == "-":
+        return frozenset()
+    return _COLOR_SET.intersection(str(card_cost).upper())
+
 
 class CardValidationManager:
     """
@@ -38,97 +69,52 @@ class CardValidationManager:
         self.commander_colors = self.get_commander_colors()
 
     def get_commander_colors(self) -> set[str]:
-        """Get the color identity of the commander (first card or legendary creature)"""
+        """Get the color identity of the commander (card ID 1, else the first legendary creature)"""
+        commander = next((card for card in self.cards if card.id == 1), None)
+        if commander is None:
+            commander = next(
+                (
+                    card
+                    for card in self.cards
+                    if "Legendary" in card.type and "Creature" in card.type
+                ),
+                None,
+            )
+        if commander is None:
+            return set()
+
         commander_colors = set()
+        if commander.cost and commander.cost != "-":
+            # Convert to string first to handle integer costs
+            commander_colors |= _COLOR_SET.intersection(str(commander.cost).upper())
 
-        for card in self.cards:
-            # Commander is usually the first card or a legendary creature
-            if card.id == 1 or ("Legendary" in card.type and "Creature" in card.type):
-                if self.logger and hasattr(self.logger, "log_message"):
-                    self.logger.log_message(
-                        "DEBUG",
-                        f"Found potential commander: {card.name} (ID: {card.id}, Cost: {card.cost})",
-                    )
+            # Also check card text for hybrid mana symbols
+            if commander.text:
+                for hybrid in _HYBRID_RE.findall(commander.text.upper()):
+                    commander_colors |= _COLOR_SET.intersection(hybrid)
 
-                if card.cost and card.cost != "-":
-                    # Convert to string first to handle integer costs
-                    cost = str(card.cost).upper()
-                    # Extract colors from mana cost
-                    for color in ["W", "U", "B", "R", "G"]:
-                        if color in cost:
-                            commander_colors.add(color)
-
-                    # Also check card text for color indicators
-                    if card.text:
-                        text = card.text.upper()
-                        # Check for hybrid mana symbols
-                        for hybrid in [
-                            "{W/U}",
-                            "{U/B}",
-                            "{B/R}",
-                            "{R/G}",
-                            "{G/W}",
-                            "{W/B}",
-                            "{U/R}",
-                            "{B/G}",
-                            "{R/W}",
-                            "{G/U}",
-                        ]:
-                            if hybrid in text:
-                                for color in ["W", "U", "B", "R", "G"]:
-                                    if color in hybrid:
-                                        commander_colors.add(color)
-
-                # If this is card ID 1, it's definitely the commander
-                if card.id == 1:
-                    if self.logger and hasattr(self.logger, "log_message"):
-                        self.logger.log_message(
-                            "INFO",
-                            f"Commander identified: {card.name} with colors: {commander_colors}",
-                        )
-                    break
+        if self.logger and hasattr(self.logger, "log_message"):
+            self.logger.log_message(
+                "INFO",
+                f"Commander identified: {commander.name} with colors: {commander_colors}",
+            )
 
         return commander_colors
 
     def check_color_violation(self, card_cost: str) -> bool:
         """Check if a card's mana cost violates commander color identity"""
-        # Handle different types of cost input
-        if card_cost is None:
-            return False
-
-        # Convert to string if it's not already
-        cost_str = str(card_cost) if not isinstance(card_cost, str) else card_cost
-
-        if not cost_str or cost_str == "-" or cost_str == "":
-            return False  # Colorless cards are always legal
-
-        # For colorless commanders (empty commander_colors set), only colorless cards are allowed
-        # We need to distinguish between "not initialized" and "colorless commander"
-        # If commander_colors is a set (even empty), it means it's been initialized
-
-        card_colors = set()
-        # Clean up the cost string (remove curly braces) - ensure it's a string first
-        if hasattr(cost_str, "upper"):
-            cost = cost_str.upper().replace("{", "").replace("}", "")
-        else:
-            # If for some reason upper() doesn't exist, convert to string first
-            cost = str(cost_str).upper().replace("{", "").replace("}", "")
-
-        # Extract colors from the card's mana cost
-        for color in ["W", "U", "B", "R", "G"]:
-            if color in cost:
-                card_colors.add(color)
+        # Colorless cards ("-", empty or no cost) have no colors and are always legal
+        card_colors = _cost_colors(card_cost)
 
         # Check if any card color is not in commander colors
-        violation = bool(card_colors - self.commander_colors)
+        violation = not card_colors <= self.commander_colors
 
         # Debug log for problematic cards
-        if violation and card_colors and self.logger:
-            if hasattr(self.logger, "log_message"):
-                self.logger.log_message(
-                    "DEBUG",
-                    f"Color violation: Card has {card_colors}, Commander allows {self.commander_colors}",
-                )
+        if violation and self.logger and hasattr(self.logger, "log_message"):
+            self.logger.log_message(
+                "DEBUG",
+                f"Color violation: Card has {set(card_colors)}, Commander allows {self.commander_colors}",
+            )
 
         return violation
 
@@ -139,18 +125,10 @@ class CardValidationManager:
 
         violations = []
         for card in self.cards:
-            if self.check_color_violation(card.cost):
-                # Get the card's colors
-                card_colors = set()
-                cost_str = str(card.cost) if card.cost else ""
-                # Ensure it's a string before calling upper()
-                cost = str(cost_str).upper().replace("{", "").replace("}", "")
-                for color in ["W", "U", "B", "R", "G"]:
-                    if color in str(cost):  # Ensure cost is string
-                        card_colors.add(color)
-
+            card_colors = _cost_colors(card.cost)
+            if not card_colors <= self.commander_colors:
                 violations.append(
-                    f"{card.name} (Cost: {card.cost}, Colors: {card_colors})"
+                    f"{card.name} (Cost: {card.cost}, Colors: {set(card_colors)})"
                 )
 
         if violations:
@@ -203,17 +181,7 @@ class CardValidationManager:
 
     def get_card_colors(self, card_cost: str) -> set[str]:
         """Extract colors from a card's mana cost."""
-        if not card_cost or card_cost == "-":
-            return set()
-
-        cost_str = str(card_cost).upper().replace("{", "").replace("}", "")
-        card_colors = set()
-
-        for color in ["W", "U", "B", "R", "G"]:
-            if color in cost_str:
-                card_colors.add(color)
-
-        return card_colors
+        return set(_cost_colors(card_cost))
 
     def validate_card_data(self, card) -> tuple[bool, list[str]]:
         """
@@ -618,8 +586,7 @@ class CardValidationManager:
             errors.append("Card text has unbalanced brackets")
 
         # Check for proper ability formatting (abilities usually end with periods)
-        lines = text.split("\n")
-        for line in lines:
+        for line in text.splitlines():
             line = line.strip()
             if (
                 line
@@ -221,7 +221,7 @@ class DeckBuilderService:
         """
         with self._lock:
             color_dist = self.get_color_distribution()
-            total_nonland_cards = sum(1 for card in self.deck.cards if not card.is_land())
+            total_nonland_cards = self.deck.total_cards - self.deck.count_lands()
             
             # Basic land calculation based on color intensity
             total_color_symbols = sum(color_dist.values())
@@ -277,8 +277,8 @@ class DeckBuilderService:
                 'type_distribution': self._get_type_distribution(),
                 'rarity_distribution': self._get_rarity_distribution(),
                 'average_cmc': self._calculate_average_cmc(),
-                'land_count': sum(1 for card in self.deck.cards if card.is_land()),
-                'creature_count': sum(1 for card in self.deck.cards if card.is_creature()),
+                'land_count': self.deck.count_lands(),
+                'creature_count': self.deck.count_creatures(),
             }
             
         return stats
@@ -490,7 +490,7 @@ class DeckBuilderService:
     
     def _calculate_average_cmc(self) -> float:
         """Calculate average converted mana cost of non-land cards."""
-        nonland_cards = [card for card in self.deck.cards if not card.is_land()]
+        nonland_cards = self.deck.get_nonland_cards()
         
         if not nonland_cards:
             return 0.0
@@ -8,6 +8,7 @@ import json
 import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from statistics import median
 from typing import Dict, List, Tuple, Set, Optional
 from ...domain.models.mtg_card import MTGCard
@@ -16,6 +17,9 @@ from ...domain.models.mtg_card import MTGCard
 # Type alias for card collections
 CardCollection = List[MTGCard]
 
+# Deletes mana symbol braces in one pass: "{2}{U}" -> "2U"
+_STRIP_BRACES = str.maketrans("", "", "{}")
+
 
 @dataclass
 class ManaCurveData:
@@ -195,6 +199,24 @@ class DeckStatistics:
             devotion=dict(devotion)
         )
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _type_bucket(card_type: str) -> Optional[str]:
+        """Return the type count a type line falls under; decks repeat type lines a lot."""
+        card_type = card_type.lower()
+        for keywords, bucket in (
+            (DeckStatistics.CREATURE_KEYWORDS, 'creatures'),
+            (DeckStatistics.INSTANT_KEYWORDS, 'instants'),
+            (DeckStatistics.SORCERY_KEYWORDS, 'sorceries'),
+            (DeckStatistics.ENCHANTMENT_KEYWORDS, 'enchantments'),
+            (DeckStatistics.ARTIFACT_KEYWORDS, 'artifacts'),
+            (DeckStatistics.PLANESWALKER_KEYWORDS, 'planeswalkers'),
+            (DeckStatistics.LAND_KEYWORDS, 'lands'),
+        ):
+            if any(keyword in card_type for keyword in keywords):
+                return bucket
+        return None
+
     @staticmethod
     def calculate_type_distribution(deck: CardCollection) -> TypeDistribution:
         """Calculate card type distribution.
@@ -216,22 +238,9 @@ class DeckStatistics:
         }
         
         for card in deck:
-            card_type = card.type.lower()
-            
-            if any(keyword in card_type for keyword in DeckStatistics.CREATURE_KEYWORDS):
-                counts['creatures'] += 1
-            elif any(keyword in card_type for keyword in DeckStatistics.INSTANT_KEYWORDS):
-                counts['instants'] += 1
-            elif any(keyword in card_type for keyword in DeckStatistics.SORCERY_KEYWORDS):
-                counts['sorceries'] += 1
-            elif any(keyword in card_type for keyword in DeckStatistics.ENCHANTMENT_KEYWORDS):
-                counts['enchantments'] += 1
-            elif any(keyword in card_type for keyword in DeckStatistics.ARTIFACT_KEYWORDS):
-                counts['artifacts'] += 1
-            elif any(keyword in card_type for keyword in DeckStatistics.PLANESWALKER_KEYWORDS):
-                counts['planeswalkers'] += 1
-            elif any(keyword in card_type for keyword in DeckStatistics.LAND_KEYWORDS):
-                counts['lands'] += 1
+            bucket = DeckStatistics._type_bucket(card.type)
+            if bucket:
+                counts[bucket] += 1
         
         return TypeDistribution(**counts)
 
@@ -762,7 +771,7 @@ class DeckStatistics:
             return 0
         
         # Remove braces if present
-        clean_cost = mana_cost.replace("{", "").replace("}", "")
+        clean_cost = mana_cost.translate(_STRIP_BRACES)
         
         total_cmc = 0
         i = 0
@@ -1,4 +1,4 @@
 """UI tabs package."""
-from .theme_config_tab import ThemeConfigTab
+from .theme_config_tab import ThemeConfigTab, noop_log
 
-__all__ = ["ThemeConfigTab"]
+__all__ = ["ThemeConfigTab", "noop_log"]
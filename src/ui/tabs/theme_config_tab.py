@@ -1,5 +1,7 @@
 """Theme configuration tab for MTG deck builder."""
 
+import re
+from collections.abc import Callable
 from typing import Optional
 
 from PyQt6.QtCore import pyqtSignal
@@ -15,11 +17,40 @@ from PyQt6.QtWidgets import (
 )
 
 from src.ai_services.ai_worker import AIWorker
+from src.domain.enums import normalize_rarity
 from src.domain.models import MTGCard
 
 from ..widgets.color_selector import ColorSelector
 from ..widgets.theme_input import ThemeInput
 
+# The lines parse_cards reads: "12. Name | Type" headers and "Key: value"
+# attributes. finditer skips every other line inside the regex engine.
+_CARD_LINE_RE = re.compile(
+    r"^[ \t]*(?:\d[^\n]*?\. (?P<header>[^\n]*)"
+    r"|(?P<key>Cost|Text|P/T|Flavor|Rarity):(?P<value>[^\n]*))",
+    re.MULTILINE,
+)
+
+
+def _set_power_toughness(card: dict, value: str) -> None:
+    """Store a "P/T: 2/3" value; "-" and malformed values are ignored."""
+    power, sep, toughness = value.partition("/")
+    if sep:
+        try:
+            power, toughness = int(power), int(toughness)
+        except ValueError:
+            return
+        card["power"] = power
+        card["toughness"] = toughness
+
+
+def noop_log(level: str, message: str) -> None:
+    """Stand-in for log_message while no main window is reachable."""
+
+
+# Attribute key -> card field that stores its stripped value as is
+_TEXT_FIELDS = {"Cost": "cost", "Text": "text", "Flavor": "flavor"}
+
 
 class ThemeConfigTab(QWidget):
     """Tab for theme & configuration selection.
@@ -46,6 +77,7 @@ class ThemeConfigTab(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
+        self._log: Optional[Callable[[str, str], None]] = None
         self.ai_worker = AIWorker()
         self._init_ui()
         self._connect_signals()
@@ -169,21 +201,18 @@ class ThemeConfigTab(QWidget):
             QMessageBox.warning(self, "Warning", "Please enter a theme!")
             return
 
-        # Get parent for logging
-        parent = self._get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message("INFO", f"Starting theme analysis for: {theme}")
+        log = self._logger()
+        log("INFO", f"Starting theme analysis for: {theme}")
 
         commander = self.get_commander()
         colors = self.get_colors()
 
-        if parent and hasattr(parent, "log_message"):
-            if commander:
-                parent.log_message("DEBUG", f"Commander specified: {commander}")
-            if colors:
-                parent.log_message("DEBUG", f"Colors: {', '.join(colors)}")
-            else:
-                parent.log_message("DEBUG", "Colors: Auto (based on theme)")
+        if commander:
+            log("DEBUG", f"Commander specified: {commander}")
+        if colors:
+            log("DEBUG", f"Colors: {', '.join(colors)}")
+        else:
+            log("DEBUG", "Colors: Auto (based on theme)")
 
         # Build prompt for AI analysis
         prompt = f"Theme: {theme}"
@@ -196,8 +225,7 @@ class ThemeConfigTab(QWidget):
         self.output_text.append(f"Analyzing theme: {theme}...")
         self.analyze_button.setEnabled(False)
 
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message("GENERATING", "Sending theme analysis request to AI...")
+        log("GENERATING", "Sending theme analysis request to AI...")
 
         # Start AI analysis
         self.ai_worker.set_task("analyze_theme", prompt)
@@ -210,16 +238,12 @@ class ThemeConfigTab(QWidget):
         colors = self.get_colors()
         commander = self.get_commander() or f"{theme} Commander"
 
-        # Get parent for logging
-        parent = self._get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message("INFO", "Starting full deck generation")
-            parent.log_message("INFO", f"Theme: {theme}")
-            parent.log_message("INFO", f"Commander: {commander}")
-            parent.log_message(
-                "INFO", f"Colors: {', '.join(colors) if colors else 'Auto'}"
-            )
-            parent.log_message("DEBUG", f"Analysis length: {len(analysis)} characters")
+        log = self._logger()
+        log("INFO", "Starting full deck generation")
+        log("INFO", f"Theme: {theme}")
+        log("INFO", f"Commander: {commander}")
+        log("INFO", f"Colors: {', '.join(colors) if colors else 'Auto'}")
+        log("DEBUG", f"Analysis length: {len(analysis)} characters")
 
         # Build generation prompt
         prompt = f"""Theme: {theme}
@@ -238,12 +262,11 @@ DO NOT STOP until you reach card 100."""
         self.output_text.append("\\nGenerating 100 cards (this may take a moment)...")
         self.generate_button.setEnabled(False)
 
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message("GENERATING", "Requesting 100 cards from AI...")
-            parent.log_message(
-                "DEBUG",
-                "Expected: 1 commander, 37 lands, 30 creatures, 10 instants, 10 sorceries, 7 artifacts, 5 enchantments",
-            )
+        log("GENERATING", "Requesting 100 cards from AI...")
+        log(
+            "DEBUG",
+            "Expected: 1 commander, 37 lands, 30 creatures, 10 instants, 10 sorceries, 7 artifacts, 5 enchantments",
+        )
 
         # Start card generation
         self.ai_worker.set_task("generate_cards", prompt)
@@ -300,90 +323,75 @@ DO NOT STOP until you reach card 100."""
         Returns:
             List of parsed MTGCard objects
         """
-        parent = self._get_main_window()
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message("DEBUG", f"Parsing AI response: {len(text)} characters")
+        log = self._logger()
+        log("DEBUG", f"Parsing AI response: {len(text)} characters")
 
         cards = []
-        lines = text.split("\\n")
-
-        if parent and hasattr(parent, "log_message"):
-            parent.log_message("DEBUG", f"Response has {len(lines)} lines")
-
         current_card = {}
-        card_id = 1
 
-        for line in lines:
-            line = line.strip()
+        for match in _CARD_LINE_RE.finditer(text):
+            header = match["header"]
 
             # Check for card number and name
-            if line and line[0].isdigit() and ". " in line:
+            if header is not None:
+                header = header.strip()
+                if not header:
+                    continue
                 # Save previous card if exists
-                if current_card and "name" in current_card:
-                    card = MTGCard(
-                        id=card_id,
-                        name=current_card.get("name", ""),
-                        type=current_card.get("type", ""),
-                        cost=current_card.get("cost", ""),
-                        text=current_card.get("text", ""),
-                        power=current_card.get("power"),
-                        toughness=current_card.get("toughness"),
-                        flavor=current_card.get("flavor", ""),
-                        rarity=current_card.get("rarity", "common"),
-                        art="",  # Will be generated separately
-                    )
-                    cards.append(card)
-                    card_id += 1
+                if "name" in current_card:
+                    cards.append(self._card_from_fields(len(cards) + 1, current_card))
 
                 # Parse new card name and type
-                parts = line.split(". ", 1)[1].split(" | ")
-                if len(parts) == 2:
-                    current_card = {"name": parts[0].strip(), "type": parts[1].strip()}
+                name, sep, card_type = header.partition(" | ")
+                if sep and " | " not in card_type:
+                    current_card = {"name": name.strip(), "type": card_type.strip()}
+                else:
+                    current_card = {}
+                continue
 
             # Parse card attributes
-            elif line.startswith("Cost:"):
-                current_card["cost"] = line.replace("Cost:", "").strip()
-            elif line.startswith("Text:"):
-                current_card["text"] = line.replace("Text:", "").strip()
-            elif line.startswith("P/T:"):
-                pt = line.replace("P/T:", "").strip()
-                if pt != "-" and "/" in pt:
-                    parts = pt.split("/")
-                    try:
-                        current_card["power"] = int(parts[0])
-                        current_card["toughness"] = int(parts[1])
-                    except ValueError:
-                        pass
-            elif line.startswith("Flavor:"):
-                current_card["flavor"] = line.replace("Flavor:", "").strip()
-            elif line.startswith("Rarity:"):
-                current_card["rarity"] = line.replace("Rarity:", "").strip().lower()
+            key, value = match["key"], match["value"].strip()
+            if key in _TEXT_FIELDS:
+                current_card[_TEXT_FIELDS[key]] = value
+            elif key == "Rarity":
+                current_card["rarity"] = normalize_rarity(value)
+            else:
+                _set_power_toughness(current_card, value)
 
         # Add last card
-        if current_card and "name" in current_card:
-            card = MTGCard(
-                id=card_id,
-                name=current_card.get("name", ""),
-                type=current_card.get("type", ""),
-                cost=current_card.get("cost", ""),
-                text=current_card.get("text", ""),
-                power=current_card.get("power"),
-                toughness=current_card.get("toughness"),
-                flavor=current_card.get("flavor", ""),
-                rarity=current_card.get("rarity", "common"),
-                art="",
-            )
-            cards.append(card)
+        if "name" in current_card:
+            cards.append(self._card_from_fields(len(cards) + 1, current_card))
 
         return cards
 
-    def _get_main_window(self) -> Optional[QWidget]:
-        """Get reference to the main window for logging.
+    @staticmethod
+    def _card_from_fields(card_id: int, fields: dict) -> MTGCard:
+        """Build a card from the fields parse_cards collected for it."""
+        return MTGCard(
+            id=card_id,
+            name=fields.get("name", ""),
+            type=fields.get("type", ""),
+            cost=fields.get("cost", ""),
+            text=fields.get("text", ""),
+            power=fields.get("power"),
+            toughness=fields.get("toughness"),
+            flavor=fields.get("flavor", ""),
+            rarity=fields.get("rarity", "common"),
+            art="",  # Will be generated separately
+        )
+
+    def _logger(self) -> Callable[[str, str], None]:
+        """Get the main window's log_message, resolved once it is reachable.
 
         Returns:
-            Main window widget, or None if not found
+            The log function, or a no-op while the tab has no main window
         """
-        return self.parent().parent() if hasattr(self, "parent") else None
+        if self._log is None:
+            log = getattr(self.window(), "log_message", None)
+            if log is None:
+                return noop_log
+            self._log = log
+        return self._log
 
     def _validate_theme_input(self) -> tuple[bool, str]:
         """
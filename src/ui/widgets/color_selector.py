@@ -30,6 +30,30 @@ class ColorSelector(QWidget):
     # Signal emitted when color selection changes
     colors_changed = pyqtSignal(list)
 
+    # Preset combinations, in dropdown order: label -> colors
+    PRESET_COLORS = {
+        "Azorius (WU)": ("W", "U"),
+        "Dimir (UB)": ("U", "B"),
+        "Rakdos (BR)": ("B", "R"),
+        "Gruul (RG)": ("R", "G"),
+        "Selesnya (WG)": ("W", "G"),
+        "Orzhov (WB)": ("W", "B"),
+        "Izzet (UR)": ("U", "R"),
+        "Golgari (BG)": ("B", "G"),
+        "Boros (WR)": ("W", "R"),
+        "Simic (UG)": ("U", "G"),
+        "Bant (WUG)": ("W", "U", "G"),
+        "Esper (WUB)": ("W", "U", "B"),
+        "Grixis (UBR)": ("U", "B", "R"),
+        "Jund (BRG)": ("B", "R", "G"),
+        "Naya (WRG)": ("W", "R", "G"),
+        "WUBRG (All colors)": ("W", "U", "B", "R", "G"),
+    }
+    # Sorted colors -> label, for set_colors
+    _PRESET_BY_COLORS = {
+        tuple(sorted(colors)): label for label, colors in PRESET_COLORS.items()
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
@@ -79,26 +103,7 @@ class ColorSelector(QWidget):
     def _setup_preset_colors(self, layout: QVBoxLayout):
         """Setup preset color combination dropdown."""
         self.preset_color_combo = QComboBox()
-        self.preset_color_combo.addItems(
-            [
-                "Azorius (WU)",
-                "Dimir (UB)",
-                "Rakdos (BR)",
-                "Gruul (RG)",
-                "Selesnya (WG)",
-                "Orzhov (WB)",
-                "Izzet (UR)",
-                "Golgari (BG)",
-                "Boros (WR)",
-                "Simic (UG)",
-                "Bant (WUG)",
-                "Esper (WUB)",
-                "Grixis (UBR)",
-                "Jund (BRG)",
-                "Naya (WRG)",
-                "WUBRG (All colors)",
-            ]
-        )
+        self.preset_color_combo.addItems(list(self.PRESET_COLORS))
         self.preset_color_combo.setEnabled(False)
 
         layout.addWidget(self.preset_color_combo)
@@ -149,41 +154,16 @@ class ColorSelector(QWidget):
 
     def _get_manual_colors(self) -> list[str]:
         """Get colors from manual checkboxes."""
-        colors = []
-        for color, checkbox in self.color_checkboxes.items():
-            if checkbox.isChecked():
-                colors.append(color)
-        return colors
+        return [
+            color
+            for color, checkbox in self.color_checkboxes.items()
+            if checkbox.isChecked()
+        ]
 
     def _get_preset_colors(self) -> list[str]:
-        """Parse colors from preset combination."""
+        """Look up the colors of the selected preset combination."""
         combo_text = self.preset_color_combo.currentText()
-
-        # Color combination mappings
-        color_mappings = {
-            "WU": ["W", "U"],
-            "UB": ["U", "B"],
-            "BR": ["B", "R"],
-            "RG": ["R", "G"],
-            "WG": ["W", "G"],
-            "WB": ["W", "B"],
-            "UR": ["U", "R"],
-            "BG": ["B", "G"],
-            "WR": ["W", "R"],
-            "UG": ["U", "G"],
-            "WUG": ["W", "U", "G"],
-            "WUB": ["W", "U", "B"],
-            "UBR": ["U", "B", "R"],
-            "BRG": ["B", "R", "G"],
-            "WRG": ["W", "R", "G"],
-            "WUBRG": ["W", "U", "B", "R", "G"],
-        }
-
-        for pattern, colors in color_mappings.items():
-            if pattern in combo_text:
-                return colors
-
-        return []
+        return list(self.PRESET_COLORS.get(combo_text, ()))
 
     def set_colors(self, colors: list[str]):
         """
@@ -201,35 +181,19 @@ class ColorSelector(QWidget):
                 self.preset_color_radio.setChecked(True)
                 self.preset_color_combo.setCurrentText(preset_match)
             else:
-                # Use manual selection
+                # Use manual selection, announcing the new colors once
                 self.manual_color_radio.setChecked(True)
                 for color, checkbox in self.color_checkboxes.items():
-                    checkbox.setChecked(color in colors)
+                    checkbox.blockSignals(True)
+                    try:
+                        checkbox.setChecked(color in colors)
+                    finally:
+                        checkbox.blockSignals(False)
+                self._on_colors_changed()
 
     def _find_preset_match(self, colors: list[str]) -> str:
         """Find a preset combination that matches the given colors."""
-        sorted_colors = sorted(colors)
-
-        preset_mappings = {
-            "['U', 'W']": "Azorius (WU)",
-            "['B', 'U']": "Dimir (UB)",
-            "['B', 'R']": "Rakdos (BR)",
-            "['G', 'R']": "Gruul (RG)",
-            "['G', 'W']": "Selesnya (WG)",
-            "['B', 'W']": "Orzhov (WB)",
-            "['R', 'U']": "Izzet (UR)",
-            "['B', 'G']": "Golgari (BG)",
-            "['R', 'W']": "Boros (WR)",
-            "['G', 'U']": "Simic (UG)",
-            "['G', 'U', 'W']": "Bant (WUG)",
-            "['B', 'U', 'W']": "Esper (WUB)",
-            "['B', 'R', 'U']": "Grixis (UBR)",
-            "['B', 'G', 'R']": "Jund (BRG)",
-            "['G', 'R', 'W']": "Naya (WRG)",
-            "['B', 'G', 'R', 'U', 'W']": "WUBRG (All colors)",
-        }
-
-        return preset_mappings.get(str(sorted_colors), "")
+        return self._PRESET_BY_COLORS.get(tuple(sorted(colors)), "")
 
     def get_selection_mode(self) -> str:
         """
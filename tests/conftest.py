@@ -5,6 +5,12 @@ from magic_tg_card_generator.core import CardGenerator
 from magic_tg_card_generator.models import Card, CardType, Color
 
 
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep AI response caching out of the user's cache directory."""
+    monkeypatch.setenv("MTG_LLM_CACHE_DIR", str(tmp_path / "llm_cache"))
+
+
 @pytest.fixture
 def card_generator() -> CardGenerator:
     """Provide a CardGenerator instance."""
@@ -0,0 +1,68 @@
+"""Tests for the CardCollection domain model."""
+
+from src.domain.models import CardCollection, MTGCard
+from src.services.deck.deck_builder_service import DeckBuilderService
+
+
+def make_card(card_id: int, name: str, card_type: str) -> MTGCard:
+    """Create a minimal card for collection tests."""
+    return MTGCard(id=card_id, name=name, type=card_type, cost="{1}{G}")
+
+
+class TestCardCollectionTypeCounts:
+    """Test the land/creature queries on a card collection."""
+
+    def test_counts_follow_add_remove_clear(self) -> None:
+        """Test type counts stay in step with the cards."""
+        collection = CardCollection()
+        collection.add(make_card(1, "Forest", "Basic Land — Forest"), quantity=3)
+        collection.add(make_card(2, "Llanowar Elves", "Creature — Elf Druid"))
+        collection.add(make_card(3, "Giant Growth", "Instant"))
+
+        assert collection.count_lands() == 3
+        assert collection.count_creatures() == 1
+        assert [card.name for card in collection.get_nonland_cards()] == [
+            "Llanowar Elves",
+            "Giant Growth",
+        ]
+
+        assert collection.remove("2")
+        assert collection.count_creatures() == 0
+        assert [card.name for card in collection.get_nonland_cards()] == [
+            "Giant Growth"
+        ]
+
+        collection.clear()
+        assert collection.count_lands() == 0
+        assert collection.get_nonland_cards() == []
+
+    def test_counts_follow_type_edits(self) -> None:
+        """Test a card edited in place after add() is counted by its new type."""
+        collection = CardCollection()
+        card = make_card(1, "Shapeshifter", "Creature — Shapeshifter")
+        collection.add(card)
+
+        card.type = "Basic Land"
+
+        assert card.is_land()
+        assert collection.count_lands() == 1
+        assert collection.count_creatures() == 0
+        assert collection.get_nonland_cards() == []
+
+    def test_deck_statistics_use_type_counts(self) -> None:
+        """Test deck statistics report the collection's type counts."""
+        service = DeckBuilderService()
+        service.deck.add(make_card(1, "Forest", "Basic Land — Forest"), quantity=2)
+        service.deck.add(make_card(2, "Llanowar Elves", "Creature — Elf Druid"))
+
+        stats = service.get_deck_statistics()
+
+        assert stats["land_count"] == 2
+        assert stats["creature_count"] == 1
+        assert stats["average_cmc"] == 2.0
+
+        # Edited types show up in the next statistics call
+        service.deck.cards[-1].type = "Land"
+        stats = service.get_deck_statistics()
+        assert stats["land_count"] == 3
+        assert stats["creature_count"] == 0
@@ -124,6 +124,20 @@ class TestCardCRUDManager(unittest.TestCase):
         next_id = self.manager.get_next_card_id()
         self.assertEqual(next_id, 4)  # Should still be 4
 
+        # Cards added elsewhere or a replaced list are picked up again
+        self.manager.cards.append(MTGCard(id=9, name="Added", type="Creature"))
+        self.assertEqual(self.manager.get_next_card_id(), 10)
+        self.manager.cards = [MTGCard(id=2, name="Only", type="Creature")]
+        self.assertEqual(self.manager.get_next_card_id(), 3)
+
+        # Renumbering a card in the table is picked up through item_changed
+        self.table_manager.item_changed.connect.assert_called_with(
+            self.manager._forget_next_card_id
+        )
+        self.manager.cards[0].id = 7
+        self.manager._forget_next_card_id(self.manager.cards[0])
+        self.assertEqual(self.manager.get_next_card_id(), 8)
+
     @patch("src.managers.card_crud_manager.QDialog")
     def test_add_new_card(self, mock_dialog):
         """Test adding a new card"""
@@ -142,8 +156,9 @@ class TestCardCRUDManager(unittest.TestCase):
         self.assertEqual(new_card.type, "Creature")
         self.assertEqual(new_card.status, "pending")
 
-        # Check table was refreshed
-        self.table_manager.refresh_table.assert_called()
+        # Check only the new row was added to the table
+        self.table_manager.insert_card_row.assert_called_once_with(initial_count)
+        self.table_manager.refresh_table.assert_not_called()
 
     def test_load_cards(self):
         """Test loading cards"""
@@ -172,8 +187,11 @@ class TestCardCRUDManager(unittest.TestCase):
         self.validation_manager.update_cards.assert_called_with(new_cards)
         self.validation_manager.log_color_violations.assert_called()
 
-        # Check table manager was updated
+        # Check table manager was updated, with colors set before the one refresh
         self.table_manager.set_cards.assert_called_with(new_cards)
+        self.table_manager.set_commander_colors.assert_called_once_with(
+            self.validation_manager.commander_colors, refresh=False
+        )
 
     def test_get_card_by_id(self):
         """Test getting card by ID"""
@@ -320,8 +338,9 @@ class TestCardCRUDManager(unittest.TestCase):
         self.assertEqual(duplicate.status, "pending")
         self.assertEqual(duplicate.id, 4)  # Should have new ID
 
-        # Check table was refreshed
-        self.table_manager.refresh_table.assert_called()
+        # Check only the new row was added to the table
+        self.table_manager.insert_card_row.assert_called_once_with(1)
+        self.table_manager.refresh_table.assert_not_called()
 
     def test_duplicate_with_no_selection(self):
         """Test duplicating with no card selected"""
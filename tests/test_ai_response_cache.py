@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test suite for AI response caching and decoding.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from src.ai_services import ResponseCache, ThemeAnalyzer
+
+
+class TestResponseCache:
+    """Test the ResponseCache class."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test stored responses are returned until they expire."""
+        cache = ResponseCache(tmp_path)
+        key = ResponseCache.make_key("model", "analyze_theme", "system", "dragons")
+
+        assert cache.get(key) is None
+        cache.set(key, "Red and green")
+        assert cache.get(key) == "Red and green"
+
+        expired = ResponseCache(tmp_path, ttl=-1)
+        expired.set(key, "Red and green")
+        assert expired.get(key) is None
+
+    def test_make_key_separates_parts(self):
+        """Test keys differ for every part of the request."""
+        keys = {
+            ResponseCache.make_key("model", "task", "ab", "c"),
+            ResponseCache.make_key("model", "task", "a", "bc"),
+            ResponseCache.make_key("other", "task", "ab", "c"),
+            ResponseCache.make_key("model", "other", "ab", "c"),
+        }
+        assert len(keys) == 4
+
+    def test_service_reuses_cached_response(self):
+        """Test an identical request is answered without calling the API."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [{"message": {"content": "Theme analysis"}}]
+        }
+
+        analyzer = ThemeAnalyzer(api_key="test_key")
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
+            assert analyzer.analyze_theme("dragons") == "Theme analysis"
+            assert analyzer.analyze_theme("dragons") == "Theme analysis"
+            assert mock_post.call_count == 1
+
+            analyzer.analyze_theme("goblins")
+            assert mock_post.call_count == 2
+
+        uncached = ThemeAnalyzer(api_key="test_key", use_cache=False)
+        with patch("requests.Session.post", return_value=mock_response) as mock_post:
+            uncached.analyze_theme("dragons")
+            assert mock_post.call_count == 1
+
+
+class TestResponseDecoding:
+    """Test decoding of raw API responses."""
+
+    def _response(self, body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        return response
+
+    def test_decodes_raw_body(self):
+        """Test content is read from the raw bytes with or without orjson."""
+        body = json.dumps({"choices": [{"message": {"content": "Drachen ✨"}}]}).encode()
+        analyzer = ThemeAnalyzer(api_key="test_key", use_cache=False)
+
+        assert analyzer._parse_response(self._response(body), None) == "Drachen ✨"
+        with patch("src.ai_services.base_ai_service.orjson", None):
+            assert analyzer._parse_response(self._response(body), None) == "Drachen ✨"
+
+    def test_invalid_body_raises_value_error(self):
+        """Test undecodable bodies are reported as a format error."""
+        analyzer = ThemeAnalyzer(api_key="test_key", use_cache=False)
+
+        with pytest.raises(ValueError, match="Invalid API response format"):
+            analyzer._parse_response(self._response(b"<html>"), None)
+
+
+class TestSharedSession:
+    """Test the HTTP session shared by all AI services."""
+
+    def test_services_share_one_session(self):
+        """Test calls reuse one session until it is closed."""
+        from src.ai_services import AIService
+
+        AIService.close_session()
+        session = ThemeAnalyzer(api_key="test_key")._get_session()
+        assert ThemeAnalyzer(api_key="other_key")._get_session() is session
+
+        AIService.close_session()
+        assert AIService._session is None
+        assert ThemeAnalyzer(api_key="test_key")._get_session() is not session
+        AIService.close_session()
+
+
+class TestApiKey:
+    """Test where AI services get their API key from."""
+
+    def test_env_wins_over_saved_key(self, tmp_path, monkeypatch):
+        """Test the env variable is preferred and the saved key is the fallback."""
+        from PyQt6.QtCore import QSettings, QStandardPaths
+
+        from src.ai_services import load_api_key, save_api_key
+
+        scope = (QSettings.Format.NativeFormat, QSettings.Scope.UserScope)
+        QSettings.setPath(*scope, str(tmp_path))
+        try:
+            monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+            save_api_key("saved_key")
+            assert load_api_key() == "saved_key"
+            assert ThemeAnalyzer().api_key == "saved_key"
+
+            monkeypatch.setenv("OPENROUTER_API_KEY", "env_key")
+            assert load_api_key() == "env_key"
+        finally:
+            save_api_key("")
+            QSettings.setPath(
+                *scope,
+                QStandardPaths.writableLocation(
+                    QStandardPaths.StandardLocation.GenericConfigLocation
+                ),
+            )
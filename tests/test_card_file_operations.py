@@ -172,6 +172,26 @@ class TestCardFileOperations:
             finally:
                 self.file_ops.SAVED_DECKS_DIR = old_dir
 
+    def test_yaml_load_normalizes_ids(self):
+        """Test card ids read from YAML are always ints."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_file = Path(temp_dir) / "deck_ids.yaml"
+            yaml_file.write_text(
+                yaml.dump(
+                    {
+                        "cards": [
+                            {"id": "1", "name": "Lightning Bolt", "type": "Instant"},
+                            {"id": "abc", "name": "Black Lotus", "type": "Artifact"},
+                            {"name": "Sol Ring", "type": "Artifact"},
+                        ]
+                    }
+                )
+            )
+
+            loaded_cards = self.file_ops.load_deck_from_file(str(yaml_file))
+
+            assert [card.id for card in loaded_cards] == [1, 3, 4]
+
     def test_csv_export_and_import(self):
         """Test CSV export and import functionality."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -265,6 +265,10 @@ class TestCardTableManager(unittest.TestCase):
         # Should have red background due to color violation
         background_color = cost_item.background().color()
         self.assertEqual(background_color.red(), 255)  # Should be red-ish
+        self.assertEqual(
+            self.table.item(bears_row, CardTableManager.COLUMN_NAME).background(),
+            CardTableManager.VIOLATION_BRUSH,
+        )
 
     def test_card_addition_removal(self):
         """Test adding and removing cards."""
@@ -285,6 +289,26 @@ class TestCardTableManager(unittest.TestCase):
         self.assertEqual(self.manager.get_card_count(), initial_count)
         self.assertEqual(self.table.rowCount(), initial_count)
 
+    def test_insert_card_row_populates_only_new_row(self):
+        """Test inserting a card adds its row without re-populating the others."""
+        self.manager.refresh_table()
+        first_item = self.table.item(0, CardTableManager.COLUMN_NAME)
+        item_changed_spy = Mock()
+        self.manager.item_changed.connect(item_changed_spy)
+
+        new_card = MockCard(4, "Counterspell", "UU", "Instant")
+        self.manager.add_card_to_table(new_card, position=1)
+
+        self.assertEqual(self.table.rowCount(), 4)
+        self.assertIs(self.table.item(0, CardTableManager.COLUMN_NAME), first_item)
+        self.assertEqual(
+            self.table.item(1, CardTableManager.COLUMN_NAME).text(), "Counterspell"
+        )
+        self.assertEqual(
+            self.table.item(2, CardTableManager.COLUMN_NAME).text(), "Grizzly Bears"
+        )
+        item_changed_spy.assert_not_called()
+
     def test_signals_emitted(self):
         """Test that appropriate signals are emitted."""
         # Mock signal connections
@@ -307,6 +331,21 @@ class TestCardTableManager(unittest.TestCase):
         self.assertTrue(hasattr(self.manager, "selection_changed"))
         self.assertTrue(hasattr(self.manager, "card_action_requested"))
 
+    def test_refresh_does_not_emit_item_changed(self):
+        """Test populating the table is not reported as an edit, but edits still are."""
+        item_changed_spy = Mock()
+        self.table.itemChanged.connect(item_changed_spy)
+        self.manager.item_changed.connect(item_changed_spy)
+
+        self.manager.refresh_table()
+        item_changed_spy.assert_not_called()
+        self.assertFalse(self.table.signalsBlocked())
+        self.assertTrue(self.table.updatesEnabled())
+
+        self.table.item(0, CardTableManager.COLUMN_NAME).setText("Chain Lightning")
+        self.assertEqual(item_changed_spy.call_count, 2)
+        self.assertEqual(self.cards[0].name, "Chain Lightning")
+
 
 if __name__ == "__main__":
     unittest.main()
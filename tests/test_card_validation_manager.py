@@ -295,6 +295,48 @@ class TestCardValidationManager(unittest.TestCase):
         self.assertFalse(is_legal)
         self.assertIn("Card 'Counterspell' violates commander color identity", issues)
 
+    def test_commander_colors_include_hybrid_symbols(self):
+        """Test hybrid symbols in the commander's text add both colors, plain words don't."""
+        commander = MockCard(
+            1,
+            "Hybrid Commander",
+            "Legendary Creature — Elf",
+            "{2}{G}",
+            text="{W/U}: Draw a card. Tap: add {B/G}.",
+        )
+        self.manager.update_cards([commander])
+
+        self.assertEqual(self.manager.commander_colors, {"G", "W", "U", "B"})
+
+    def test_commander_colors_come_from_one_commander(self):
+        """Test card ID 1 is the commander wherever it is, else the first legend."""
+        legend = MockCard(2, "Other Legend", "Legendary Creature — Elf", "{G}")
+        commander = MockCard(1, "Commander", "Legendary Creature — Human", "{R}{W}")
+        second_legend = MockCard(3, "Third Legend", "Legendary Creature — Imp", "{B}")
+
+        self.manager.update_cards([legend, commander, second_legend])
+        self.assertEqual(self.manager.commander_colors, {"R", "W"})
+
+        self.manager.update_cards([legend, second_legend])
+        self.assertEqual(self.manager.commander_colors, {"G"})
+
+        self.manager.update_cards([MockCard(4, "Shock", "Instant", "{R}")])
+        self.assertEqual(self.manager.commander_colors, set())
+
+    def test_color_violations_only_logged_for_violations(self):
+        """Test colors are checked without logging unless a card violates them."""
+        self.manager.set_commander_colors({"R"})
+        self.logger.messages.clear()
+
+        self.assertFalse(self.manager.check_color_violation("{1}{R}"))
+        self.assertFalse(self.manager.check_color_violation("-"))
+        self.assertFalse(self.manager.check_color_violation(None))
+        self.assertEqual(self.logger.messages, [])
+
+        self.assertTrue(self.manager.check_color_violation("{G}{G}"))
+        self.assertEqual(len(self.logger.get_messages_by_level("DEBUG")), 1)
+        self.assertEqual(self.manager.get_card_colors("{2}{W}{U}"), {"W", "U"})
+
     # Tests for validate_mana_cost()
 
     def test_validate_mana_cost_empty_cost(self):
@@ -0,0 +1,57 @@
+"""Test cases for the ColorSelector widget."""
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.widgets.color_selector import ColorSelector
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create a QApplication instance for testing."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def color_selector(qapp):  # noqa: ARG001
+    """Create a ColorSelector instance for testing."""
+    return ColorSelector()
+
+
+class TestColorSelectorPresets:
+    """Test cases for the preset color combinations."""
+
+    def test_every_preset_returns_its_own_colors(self, color_selector):
+        """Test three and five color presets are not read as a two color pair."""
+        color_selector.preset_color_radio.setChecked(True)
+
+        for label, colors in ColorSelector.PRESET_COLORS.items():
+            color_selector.preset_color_combo.setCurrentText(label)
+            assert color_selector.get_colors() == list(colors)
+
+        color_selector.preset_color_combo.setCurrentText("Esper (WUB)")
+        assert color_selector.get_colors() == ["W", "U", "B"]
+
+    def test_set_colors_selects_matching_preset(self, color_selector):
+        """Test set_colors picks the preset regardless of color order."""
+        color_selector.set_colors(["G", "R", "B"])
+
+        assert color_selector.get_selection_mode() == "preset"
+        assert color_selector.preset_color_combo.currentText() == "Jund (BRG)"
+
+        color_selector.set_colors(["W", "U", "R"])
+        assert color_selector.get_selection_mode() == "manual"
+        assert sorted(color_selector.get_colors()) == ["R", "U", "W"]
+
+    def test_manual_set_colors_emits_once(self, color_selector):
+        """Test checking several manual colors reports the selection once."""
+        color_selector.manual_color_radio.setChecked(True)
+        emitted = []
+        color_selector.colors_changed.connect(emitted.append)
+
+        color_selector.set_colors(["W", "U", "R"])
+
+        assert emitted == [["W", "U", "R"]]
@@ -199,6 +199,37 @@ class TestImageGenerator:
         generator = ImageGenerator(low_memory=False)
         assert generator.low_memory is False
 
+    def test_quantize_skipped_off_cuda(self):
+        """Test quantization leaves the model alone on non-CUDA devices."""
+        generator = ImageGenerator(device="cpu", quantize="int8")
+        generator.pipeline = MagicMock()
+
+        with patch.dict(
+            "sys.modules", {"optimum": MagicMock(), "optimum.quanto": MagicMock()}
+        ) as modules:
+            generator._quantize_weights()
+            modules["optimum.quanto"].quantize.assert_not_called()
+
+    @patch("torch.cuda.get_device_capability", return_value=(8, 0))
+    def test_quantize_fp8_needs_capable_gpu(self, mock_capability):
+        """Test FP8 falls back to full precision on older GPUs."""
+        generator = ImageGenerator(device="cuda", quantize="fp8")
+        generator.pipeline = MagicMock()
+
+        with patch.dict(
+            "sys.modules", {"optimum": MagicMock(), "optimum.quanto": MagicMock()}
+        ) as modules:
+            generator._quantize_weights()
+            modules["optimum.quanto"].quantize.assert_not_called()
+
+            generator.quantize = "int8"
+            generator._quantize_weights()
+            quanto = modules["optimum.quanto"]
+            quanto.quantize.assert_called_once_with(
+                generator.pipeline.unet, weights=quanto.qint8
+            )
+            quanto.freeze.assert_called_once_with(generator.pipeline.unet)
+
     def test_model_config(self):
         """Test different model configurations."""
         generator = ImageGenerator(model=ModelConfig.SD_1_5)
@@ -4,6 +4,8 @@ import json
 import os
 import sys
 import tempfile
+import threading
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -25,11 +27,13 @@ from mtg_deck_builder import (
     MTGCard,
     MTGDeckBuilder,
     ThemeConfigTab,
+    _DeckSaveTask,
     convert_mana_cost,
     escape_for_shell,
     make_safe_filename,
 )
-from src.managers.card_generation_controller import CardGeneratorWorker
+from src.domain import Rarity
+from src.managers.card_generation_controller import CardGeneratorWorker, _ThreadOutput
 
 
 @pytest.fixture
@@ -77,6 +81,15 @@ class TestHelperFunctions:
             make_safe_filename('Path/To\\File:Name*?<>|"') == "Path_To_File_Name______"
         )
 
+    def test_make_safe_filename_follows_renames(self):
+        """Test the cached safe name is keyed on the name, so renames show up."""
+        card = MTGCard(id=1, name="Lightning Bolt", type="Instant")
+        assert make_safe_filename(card.name) == "Lightning_Bolt"
+        assert make_safe_filename(card.name) == "Lightning_Bolt"
+
+        card.name = "Jace/Vryn's"
+        assert make_safe_filename(card.name) == "Jace_Vryns"
+
     def test_escape_for_shell(self):
         """Test shell escaping functionality."""
         # Test normal string
@@ -96,6 +109,11 @@ class TestHelperFunctions:
         # Test normal case
         assert convert_mana_cost("2UR") == "{2}{U}{R}"
 
+        # Test multi-digit generic mana, lowercase symbols and ints
+        assert convert_mana_cost("10gx") == "{10}{G}{X}"
+        assert convert_mana_cost("2 W?W") == "{2}{W}{W}"
+        assert convert_mana_cost(3) == "{3}"
+
         # Test empty/None cases
         assert convert_mana_cost("") == ""
         assert convert_mana_cost(None) == ""
@@ -148,6 +166,20 @@ class TestMTGCard:
         assert minimal_card.cost == ""
         assert minimal_card.power is None
 
+    def test_card_uses_slots(self, sample_mtg_card):
+        """Test cards carry no instance dict but keep the UI-only fields."""
+        import copy
+
+        assert not hasattr(sample_mtg_card, "__dict__")
+        sample_mtg_card.art_prompt = "A bolt of red lightning"
+        sample_mtg_card.skip_generation = True
+
+        clone = copy.copy(sample_mtg_card)
+        assert clone == sample_mtg_card
+        assert clone.art_prompt == "A bolt of red lightning"
+        with pytest.raises(AttributeError):
+            sample_mtg_card.unknown_field = 1
+
 
 class TestAIWorker:
     """Test AI Worker thread functionality."""
@@ -160,7 +192,7 @@ class TestAIWorker:
         assert worker.task == "card_generation"
         assert isinstance(worker, QThread)
 
-    @patch("mtg_deck_builder.requests.post")
+    @patch("mtg_deck_builder.requests.Session.post")
     def test_ai_worker_run_success(self, mock_post, qapp):
         """Test successful AI worker execution."""
         # Mock successful API response
@@ -182,7 +214,7 @@ class TestAIWorker:
                 # Worker should emit the signal with result
                 mock_signal.emit.assert_called()
 
-    @patch("mtg_deck_builder.requests.post")
+    @patch("mtg_deck_builder.requests.Session.post")
     def test_ai_worker_run_failure(self, mock_post, qapp):
         """Test AI worker handling API failures."""
         # Mock failed API response
@@ -217,41 +249,289 @@ class TestCardGeneratorWorker:
         assert worker.style == "mtg_modern"
         assert isinstance(worker, QThread)
 
-    @patch("subprocess.run")
-    def test_card_generator_worker_run_success(self, mock_subprocess, qapp):
+    def test_card_generator_worker_run_success(self, qapp):
         """Test successful card generation."""
-        # Mock successful subprocess execution
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Card generated successfully"
-        mock_subprocess.return_value = mock_result
-
         worker = CardGeneratorWorker()
         test_card = MTGCard(
             id=1, name="Test Card", type="Creature", text="Test description"
         )
         worker.set_cards([test_card], "sdxl", "mtg_modern")
 
+        # Mock successful in-process generation
+        worker._generate = Mock(side_effect=lambda **kwargs: print("Card generated"))
+
         with patch.object(worker, "completed") as mock_signal:
             worker.run()
             mock_signal.emit.assert_called()
+            assert mock_signal.emit.call_args[0][1] is True
 
-    @patch("subprocess.run")
-    def test_card_generator_worker_run_failure(self, mock_subprocess, qapp):
-        """Test card generation failure handling."""
-        # Mock failed subprocess execution
-        mock_subprocess.side_effect = Exception("Generation failed")
+        kwargs = worker._generate.call_args.kwargs
+        assert kwargs["name"] == "Test Card"
+        assert kwargs["text"] == "Test description"
+        assert kwargs["model"] == "sdxl"
+        assert kwargs["output"] == str(worker.cards_dir.absolute())
 
+    def test_card_generator_worker_run_failure(self, qapp):
+        """Test card generation failure handling."""
         worker = CardGeneratorWorker()
         test_card = MTGCard(
             id=1, name="Test Card", type="Creature", text="Test description"
         )
         worker.set_cards([test_card], "sdxl", "mtg_modern")
 
+        # Mock failed in-process generation
+        worker._generate = Mock(side_effect=Exception("Generation failed"))
+
+        batches = []
+        worker.log_batch.connect(batches.append)
         with patch.object(worker, "completed") as mock_signal:
             worker.run()
             # Worker should emit completed signal even on failure
             mock_signal.emit.assert_called()
+            args = mock_signal.emit.call_args[0]
+            assert args[1] is False
+            assert "Generation failed" in args[2]
+
+        # The whole traceback is logged in one emission
+        assert len(batches) == 1
+        assert batches[0][0] == ("ERROR", "Card generation failed for: Test Card")
+        assert all(level == "ERROR" for level, _ in batches[0])
+        assert batches[0][-1] == (
+            "ERROR",
+            "[generate_card.py] Exception: Generation failed",
+        )
+
+    def test_card_generator_worker_completes_in_order(self, qapp, tmp_path):
+        """Test finished cards are saved and reported in queue order."""
+        from PIL import Image
+
+        worker = CardGeneratorWorker()
+        cards = [
+            MTGCard(id=1, name="First Card", type="Instant"),
+            MTGCard(id=2, name="Second Card", type="Instant"),
+            MTGCard(id=3, name="Third Card", type="Instant"),
+        ]
+        worker.set_cards(cards, "sdxl", "mtg_modern")
+        worker.cards_dir = tmp_path
+
+        def fake_generate(name, **kwargs):
+            if name == "Third Card":
+                raise RuntimeError("Render failed")
+            safe = name.replace(" ", "_")
+            Image.new("RGB", (40, 40), "white").save(tmp_path / f"{safe}_123.png")
+
+        worker._generate = Mock(side_effect=fake_generate)
+
+        with patch.object(worker, "completed") as mock_signal:
+            worker.run()
+
+        calls = [c[0] for c in mock_signal.emit.call_args_list]
+        assert [(c[0], c[1]) for c in calls] == [(1, True), (2, True), (3, False)]
+        assert calls[0][4] == str(tmp_path / "First_Card.png")
+        assert (tmp_path / "Second_Card.png").exists()
+
+    def test_card_generator_worker_flags_black_regions(self, qapp, tmp_path):
+        """Test validation spots a dark region on a large rendered card."""
+        from PIL import Image, ImageDraw
+
+        worker = CardGeneratorWorker()
+        card = MTGCard(id=1, name="Dark Card", type="Instant")
+        worker.set_cards([card], "sdxl", "mtg_modern")
+        worker.cards_dir = tmp_path
+
+        rendered = tmp_path / "Dark_Card_123.png"
+        img = Image.new("RGB", (1000, 1400), "white")
+        ImageDraw.Draw(img).rectangle((0, 0, 999, 349), fill="black")
+        img.save(rendered)
+        (tmp_path / "Dark_Card.png").write_bytes(b"previous render")
+
+        logs = []
+        worker.log_message.connect(lambda level, msg: logs.append((level, msg)))
+        with patch.object(worker, "completed"):
+            worker._finish_card(card, rendered, None)
+
+        assert (
+            "WARNING",
+            "Card has black regions in: top (title/cost)",
+        ) in logs
+        # The new render replaces the previous one
+        assert Image.open(tmp_path / "Dark_Card.png").size == (1000, 1400)
+        assert not rendered.exists()
+
+    def test_corrupted_card_dump_follows_debug(self, qapp, tmp_path):
+        """Test the card data dump for an all-black render is only sent in debug."""
+        from PIL import Image
+
+        card = MTGCard(id=1, name="Void", type="Instant")
+        rendered = tmp_path / "Void_123.png"
+        Image.new("RGB", (100, 140), "black").save(rendered)
+
+        for debug_enabled, expected in ((False, 2), (True, 8)):
+            worker = CardGeneratorWorker()
+            worker.set_cards([card], "sdxl", "mtg_modern")
+            worker.cards_dir = tmp_path
+            worker.debug_enabled = debug_enabled
+            batches = []
+            worker.log_batch.connect(batches.append)
+            with patch.object(worker, "completed"):
+                worker._finish_card(card, rendered, None)
+
+            assert len(batches) == 1
+            assert len(batches[0]) == expected
+            assert batches[0][0][1].startswith("Card appears corrupted")
+
+    def test_locate_generated_files_prefers_newest_match(self, qapp, tmp_path):
+        """Test older renders are found by name, newest first."""
+        worker = CardGeneratorWorker()
+        card = MTGCard(id=1, name="Old Card", type="Instant")
+        worker.set_cards([card], "sdxl", "mtg_modern")
+        worker.cards_dir = tmp_path
+        worker.images_dir = tmp_path / "art"
+
+        for name, age in [
+            ("Old_Card_1.png", 300),
+            ("Old_Card_2.png", 200),
+            ("Other_Card_3.png", 100),
+        ]:
+            path = tmp_path / name
+            path.touch()
+            mtime = path.stat().st_mtime - age
+            os.utime(path, (mtime, mtime))
+
+        card_path, _ = worker._locate_generated_files(card)
+
+        assert card_path == tmp_path / "Old_Card_2.png"
+
+        (tmp_path / "art").mkdir()
+        (tmp_path / "art" / "Old_Card.jpg").touch()
+        _, art_path = worker._locate_generated_files(card)
+
+        assert art_path == tmp_path / "art" / "Old_Card.jpg"
+
+    def test_card_generator_worker_streams_output(self, qapp):
+        """Test generate_card output is logged while the card is generating."""
+        worker = CardGeneratorWorker()
+        logs = []
+        worker.log_message.connect(lambda level, msg: logs.append(msg))
+
+        def fake_generate(**kwargs):
+            print("Rendering card", end="")
+            print("...")
+            # Already logged before generation finishes
+            assert "Rendering card..." in logs
+            print("partial line", end="")
+
+        worker._generate = Mock(side_effect=fake_generate)
+
+        assert worker._generate_card({}) == ""
+        assert logs[-2:] == ["Rendering card...", "partial line"]
+
+    def test_card_generator_worker_captures_only_its_thread(self, qapp, capsys):
+        """Test stderr is logged as errors and other threads keep the console."""
+        worker = CardGeneratorWorker()
+        logs = []
+        worker.log_message.connect(lambda level, msg: logs.append((level, msg)))
+
+        def fake_generate(**kwargs):
+            print("Rendering card")
+            print("Deprecated option", file=sys.stderr)
+            other = threading.Thread(target=print, args=("[SUCCESS] Card loaded",))
+            other.start()
+            other.join()
+
+        worker._generate = Mock(side_effect=fake_generate)
+
+        assert worker._generate_card({}) == ""
+        assert logs == [
+            ("INFO", "Rendering card"),
+            ("ERROR", "[generate_card.py] Deprecated option"),
+        ]
+        assert capsys.readouterr().out == "[SUCCESS] Card loaded\n"
+        assert not isinstance(sys.stdout, _ThreadOutput)
+        assert not isinstance(sys.stderr, _ThreadOutput)
+
+    def test_classify_and_emit_levels(self, qapp):
+        """Test generate_card output lines are logged at the matching level."""
+        worker = CardGeneratorWorker()
+        logs = []
+        worker.log_message.connect(lambda level, msg: logs.append((level, msg)))
+
+        for line in [
+            "✅ Card saved",
+            "❌ Render failed",
+            "Artwork is Too Dark",
+            "⚠️ No REPLICATE_API_TOKEN found",
+            "🎨 Generating artwork...",
+            "DEBUG: viewport set",
+            "   Name: Shivan Dragon",
+            "   ",
+        ]:
+            worker._classify_and_emit(line)
+
+        assert [level for level, _ in logs] == [
+            "SUCCESS",
+            "ERROR",
+            "ERROR",
+            "WARNING",
+            "GENERATING",
+            "DEBUG",
+            "INFO",
+        ]
+        assert logs[2][1] == "[generate_card.py] Artwork is Too Dark"
+
+    def test_debug_lines_skipped_when_disabled(self, qapp):
+        """Test DEBUG messages are neither formatted nor emitted while off."""
+        worker = CardGeneratorWorker()
+        logs = []
+        worker.log_message.connect(lambda level, msg: logs.append((level, msg)))
+        formatted = Mock(__str__=Mock(return_value="card"))
+
+        worker._debug("Processing %s", formatted)
+        assert logs == [("DEBUG", "Processing card")]
+
+        logs.clear()
+        formatted.__str__.reset_mock()
+        worker.debug_enabled = False
+        worker._debug("Processing %s", formatted)
+        worker._classify_and_emit("DEBUG: viewport set")
+        worker._classify_and_emit("✅ Card saved")
+
+        formatted.__str__.assert_not_called()
+        assert logs == [("SUCCESS", "✅ Card saved")]
+
+    def test_generate_kwargs_match_command(self):
+        """Test in-process options mirror the command line flags."""
+        creature = MTGCard(
+            id=1,
+            name="Shivan Dragon",
+            type="Creature — Dragon",
+            cost="4RR",
+            text="Flying",
+            power=5,
+            toughness=5,
+            art="A red dragon",
+        )
+        kwargs = creature.get_generate_kwargs("flux-dev", "mtg_classic")
+        assert kwargs["cost"] == "{4}{R}{R}"
+        assert kwargs["power"] == "5" and kwargs["toughness"] == "5"
+        assert kwargs["art"] == "A red dragon"
+        assert kwargs["model"] == "flux-dev"
+        assert kwargs["style"] == "mtg_classic"
+
+        land = MTGCard(id=2, name="Mountain", type="Basic Land", cost="R")
+        assert "cost" not in land.get_generate_kwargs()
+
+    def test_get_command_args_are_unquoted(self):
+        """Test the argv carries raw values and the command string round-trips."""
+        import shlex
+
+        card = MTGCard(
+            id=1, name='Jace\'s "$HOME" Trick', type="Instant", cost="1U", text="Draw"
+        )
+        args = card.get_command_args("sdxl", "mtg_modern")
+        assert args[args.index("--name") + 1] == 'Jace\'s "$HOME" Trick'
+        assert args[args.index("--cost") + 1] == "{1}{U}"
+        assert shlex.split(card.get_command("sdxl", "mtg_modern")) == args
 
 
 class TestThemeConfigTab:
@@ -295,6 +575,78 @@ class TestThemeConfigTab:
         except Exception:
             pass  # Method might not exist or work differently
 
+    def test_parse_cards(self, theme_tab):
+        """Test AI card lists are parsed line by line into cards."""
+        text = (
+            "Here is your deck:\n"
+            "1. Shivan Dragon | Legendary Creature — Dragon\n"
+            "   Cost: {4}{R}{R}\n"
+            "   Text: Flying\n"
+            "   P/T: 5/5\n"
+            "   Flavor: The fire is its own.\n"
+            "   Rarity: Mythic\n"
+            "\n"
+            "2. Mountain | Basic Land — Mountain\r\n"
+            "   P/T: -\r\n"
+            "   Rarity: common\r\n"
+            "3. Broken | Creature | Extra\n"
+            "   P/T: 2/2\n"
+        )
+
+        cards = theme_tab.parse_cards(text)
+
+        assert [(card.id, card.name) for card in cards] == [
+            (1, "Shivan Dragon"),
+            (2, "Mountain"),
+        ]
+        dragon, mountain = cards
+        assert dragon.type == "Legendary Creature — Dragon"
+        assert dragon.cost == "{4}{R}{R}"
+        assert dragon.text == "Flying"
+        assert (dragon.power, dragon.toughness) == (5, 5)
+        assert dragon.flavor == "The fire is its own."
+        assert dragon.rarity == "mythic"
+        assert mountain.power is None
+        assert mountain.cost == ""
+        assert mountain.rarity == "common"
+        # Rarities come back as the shared canonical strings
+        assert dragon.rarity is Rarity.MYTHIC.value
+
+    def test_parse_cards_skips_malformed_power_toughness(self, theme_tab):
+        """Test P/T values int() rejects are skipped instead of raising."""
+        text = "".join(
+            f"{number}. Card {number} | Creature\n   P/T: {value}\n"
+            for number, value in enumerate(["--1/2", "1/x", "1/2/3", "*/*"], 1)
+        )
+        text += "5. Giant Growth Bear | Creature\n   P/T: +1/+1\n"
+
+        cards = theme_tab.parse_cards(text)
+
+        assert [(card.power, card.toughness) for card in cards] == [
+            (None, None),
+            (None, None),
+            (None, None),
+            (None, None),
+            (1, 1),
+        ]
+
+    def test_logs_through_main_window(self, theme_tab):
+        """Test the tab finds the main window's log_message through its tab widget."""
+        from PyQt6.QtWidgets import QMainWindow, QTabWidget
+
+        assert theme_tab._logger() is not None
+        theme_tab.parse_cards("")  # No main window yet: nothing to log to
+
+        window = QMainWindow()
+        window.log_message = Mock()
+        tabs = QTabWidget()
+        window.setCentralWidget(tabs)
+        tabs.addTab(theme_tab, "Theme")
+
+        theme_tab.parse_cards("")
+        window.log_message.assert_any_call("DEBUG", "Parsing AI response: 0 characters")
+        assert theme_tab._log is window.log_message
+
 
 class TestCardManagementTab:
     """Test Card Management Tab functionality."""
@@ -305,6 +657,31 @@ class TestCardManagementTab:
         with patch("mtg_deck_builder.QSettings"):
             return CardManagementTab()
 
+    def test_update_stats_counts_types_without_full_analysis(self, card_tab):
+        """Test the stats label is filled from the type breakdown alone."""
+        card_tab.crud_manager.cards = [
+            MTGCard(id=1, name="Forest", type="Basic Land — Forest"),
+            MTGCard(id=2, name="Elves", type="Creature — Elf", cost="{G}"),
+            MTGCard(id=3, name="Shock", type="Instant", cost="{R}"),
+        ]
+
+        with patch.object(card_tab.deck_stats, "calculate_stats") as full_stats:
+            card_tab.update_stats()
+
+        full_stats.assert_not_called()
+        text = card_tab.type_stats_label.text()
+        assert "Total: 3 | Lands: 1 | Creatures: 1 | Instants: 1" in text
+
+    def test_table_signals_reach_table_manager(self, card_tab):
+        """Test the tab leaves the manager's table connections in place."""
+        card_tab.table_manager.set_cards([MTGCard(id=1, name="Shock", type="Instant")])
+        selection_spy = Mock()
+        card_tab.table_manager.selection_changed.connect(selection_spy)
+
+        card_tab.table.selectRow(0)
+
+        selection_spy.assert_called()
+
     def test_card_management_tab_initialization(self, card_tab):
         """Test card management tab initialization."""
         assert card_tab is not None
@@ -425,6 +802,19 @@ class TestMTGDeckBuilder:
         assert hasattr(deck_builder, "filtered_cards")
         assert hasattr(deck_builder, "deck_cards")
 
+    def test_debug_checkbox_controls_debug_logging(self, deck_builder):
+        """Test the Debug checkbox turns DEBUG lines off here and in the worker."""
+        worker = deck_builder.cards_tab.generator_worker
+        assert deck_builder.debug_log_cb.isChecked() and worker.debug_enabled
+
+        deck_builder.debug_log_cb.setChecked(False)
+
+        assert not deck_builder.debug_enabled
+        assert not worker.debug_enabled
+        deck_builder.logger_text.clear()
+        deck_builder.log_message("DEBUG", "hidden detail")
+        assert "hidden detail" not in deck_builder.logger_text.toPlainText()
+
     def test_load_card_database_success(self, deck_builder):
         """Test card database attribute exists."""
         # Simplified test - just check that database can be set
@@ -635,6 +1025,315 @@ class TestMTGDeckBuilder:
         except:
             pass  # Method might not exist in current implementation
 
+    def test_auto_save_skips_unchanged_deck(self, deck_builder, tmp_path, monkeypatch):
+        """Test auto-save does not rewrite the deck file when nothing changed."""
+        monkeypatch.chdir(tmp_path)
+        deck_builder.current_deck_name = "deck_test"
+        cards = [
+            MTGCard(id=1, name="Lightning Bolt", type="Instant", cost="{R}"),
+            MTGCard(id=2, name="Giant Growth", type="Instant", cost="{G}"),
+        ]
+
+        def save():
+            deck_builder._auto_save_deck_now(cards)
+            deck_builder._save_pool.waitForDone()
+
+        with patch.object(
+            _DeckSaveTask,
+            "_write_file",
+            autospec=True,
+            side_effect=_DeckSaveTask._write_file,
+        ) as mock_write:
+            save()
+            save()
+            assert mock_write.call_count == 1
+
+            cards[1].name = "Giant Growth Deluxe"
+            save()
+            assert mock_write.call_count == 2
+
+    def test_auto_save_is_debounced(self, deck_builder):
+        """Test bursts of auto-saves are coalesced into a single write."""
+        cards = [MTGCard(id=1, name="Lightning Bolt", type="Instant", cost="{R}")]
+
+        with patch.object(deck_builder, "_auto_save_deck_now") as mock_save:
+            deck_builder.auto_save_deck(cards)
+            deck_builder.auto_save_deck(cards)
+            mock_save.assert_not_called()
+            assert deck_builder._save_debounce_timer.isActive()
+
+            deck_builder.flush_pending_save()
+            mock_save.assert_called_once_with(cards, False)
+
+            deck_builder.auto_save_deck(cards, new_generation=True)
+            mock_save.assert_called_with(cards, new_generation=True)
+            assert not deck_builder._save_debounce_timer.isActive()
+
+    def test_auto_save_new_generation_creates_backup(
+        self, deck_builder, tmp_path, monkeypatch
+    ):
+        """Test a new generation writes the deck plus a matching timestamped backup."""
+        import yaml
+
+        monkeypatch.chdir(tmp_path)
+        deck_builder.current_deck_name = "deck_test"
+        cards = [MTGCard(id=7, name="Lightning Bolt", type="Instant", cost="{R}")]
+
+        deck_builder.auto_save_deck(cards, new_generation=True)
+        deck_builder._save_pool.waitForDone()
+
+        deck_dir = tmp_path / "saved_decks" / "deck_test"
+        deck_data = yaml.safe_load((deck_dir / "deck_test.yaml").read_text())
+        assert deck_data["cards"][0]["id"] == 1
+
+        backups = list((deck_dir / "backups").iterdir())
+        assert len(backups) == 1
+        generated_at = datetime.fromisoformat(deck_data["generated_at"])
+        assert backups[0].name == f"deck_test_{generated_at:%Y%m%d_%H%M%S}.yaml"
+
+    def test_deck_save_task_writes_atomically(self, tmp_path):
+        """Test the background save task replaces the deck file in one step."""
+        latest = tmp_path / "deck_test.yaml"
+        latest.write_text("old: true\n")
+        backup = tmp_path / "backups" / "deck_test_20240101_000000.yaml"
+
+        _DeckSaveTask({"card_count": 1}, latest, backup).run()
+
+        assert latest.read_text() == "card_count: 1\n"
+        assert backup.read_text() == "card_count: 1\n"
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_deck_save_task_reuses_unchanged_card_yaml(self, tmp_path):
+        """Test per-card YAML reuse produces the same text as a full dump."""
+        import yaml
+
+        cache = {}
+        cards = [
+            {"id": 1, "name": "Bolt", "power": None, "text": "Deal 3.\nDone"},
+            {"id": 2, "name": "Growth", "power": 1, "text": "Äther: +3/+3"},
+        ]
+        deck_data = {"theme": "Fire", "card_count": 2, "cards": cards}
+        expected = yaml.dump(deck_data, default_flow_style=False, allow_unicode=True)
+
+        task = _DeckSaveTask(deck_data, tmp_path / "deck.yaml", None, cache)
+        assert task._serialize() == expected
+        assert len(cache) == 2
+
+        cards[1] = {**cards[1], "power": True}
+        expected = yaml.dump(deck_data, default_flow_style=False, allow_unicode=True)
+        with patch.object(_DeckSaveTask, "_dump", wraps=_DeckSaveTask._dump) as dump:
+            assert task._serialize() == expected
+            dumped = [c.args[0] for c in dump.call_args_list]
+            assert [cards[1]] in dumped
+            assert [cards[0]] not in dumped
+
+    def test_find_card_image_is_cached(self, deck_builder, tmp_path, monkeypatch):
+        """Test card image lookups are cached until an output directory changes."""
+        monkeypatch.chdir(tmp_path)
+        cards_dir = tmp_path / "output" / "cards"
+        cards_dir.mkdir(parents=True)
+        (cards_dir / "Lightning_Bolt_20240101_120000.png").write_bytes(b"")
+
+        with patch.object(
+            deck_builder, "_scan_card_image", wraps=deck_builder._scan_card_image
+        ) as mock_scan:
+            found = deck_builder._find_card_image("Lightning_Bolt")
+            assert found == Path("output/cards/Lightning_Bolt_20240101_120000.png")
+            assert deck_builder._find_card_image("Lightning_Bolt") == found
+            assert mock_scan.call_count == 1
+
+            deck_builder.on_output_dir_changed(str(cards_dir))
+            deck_builder._find_card_image("Lightning_Bolt")
+            assert mock_scan.call_count == 2
+
+    def test_card_preview_is_debounced(self, deck_builder):
+        """Test rapid selection changes preview only the last card."""
+        cards = [MTGCard(id=i, name=f"Card {i}", type="Instant") for i in (1, 2, 3)]
+
+        with patch.object(deck_builder, "_show_card_preview") as mock_show:
+            for card in cards:
+                deck_builder.update_card_preview(card)
+            mock_show.assert_not_called()
+            assert deck_builder._preview_timer.isActive()
+
+            deck_builder._preview_timer.stop()
+            deck_builder._commit_preview()
+            mock_show.assert_called_once_with(cards[2])
+
+            deck_builder.update_card_preview(cards[0])
+            deck_builder.clear_card_preview()
+            assert not deck_builder._preview_timer.isActive()
+            deck_builder._commit_preview()
+            mock_show.assert_called_once()
+
+    def test_card_preview_is_cached(self, deck_builder, tmp_path):
+        """Test a previewed card is shown from QPixmapCache the second time."""
+        from PyQt6.QtCore import QThreadPool
+        from PyQt6.QtGui import QImage
+
+        card_file = tmp_path / "Lightning_Bolt.png"
+        image = QImage(50, 70, QImage.Format.Format_RGB32)
+        image.fill(QColor("red"))
+        assert image.save(str(card_file))
+        card = MTGCard(
+            id=1, name="Lightning Bolt", type="Instant", card_path=str(card_file)
+        )
+
+        deck_builder.update_card_images(card)
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+        assert not deck_builder.card_image_label.pixmap().isNull()
+
+        deck_builder.card_image_label.clear()
+        with patch("mtg_deck_builder._ImageLoadTask") as mock_task:
+            deck_builder.update_card_images(card)
+            mock_task.assert_not_called()
+        assert not deck_builder.card_image_label.pixmap().isNull()
+
+    def test_unreadable_card_image_shows_error(self, deck_builder, tmp_path):
+        """Test a file that isn't an image is reported without decoding it."""
+        from PyQt6.QtCore import QThreadPool
+
+        card_file = tmp_path / "Broken.png"
+        card_file.write_bytes(b"not an image")
+        card = MTGCard(id=1, name="Broken", type="Instant", card_path=str(card_file))
+
+        deck_builder.update_card_images(card)
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+
+        assert deck_builder.card_image_label.text() == "Card image failed to load"
+
+    def test_preview_image_size_follows_label_resize(self, deck_builder):
+        """Test the preview size is cached until the label is resized."""
+        from PyQt6.QtGui import QResizeEvent
+
+        label = deck_builder.card_image_label
+        label.resize(220, 320)
+        deck_builder._preview_size = None
+        assert deck_builder._preview_image_size() == (200, 300)
+
+        with patch.object(label, "width", wraps=label.width) as mock_width:
+            assert deck_builder._preview_image_size() == (200, 300)
+            mock_width.assert_not_called()
+
+        # The window is hidden, so deliver the resize event ourselves
+        old_size = label.size()
+        label.resize(320, 420)
+        QApplication.sendEvent(label, QResizeEvent(label.size(), old_size))
+        assert deck_builder._preview_image_size() == (300, 400)
+
+    def test_neighbouring_card_previews_are_prefetched(self, deck_builder, tmp_path):
+        """Test previewing a card decodes its neighbours into the cache."""
+        from PyQt6.QtCore import QThreadPool
+        from PyQt6.QtGui import QImage
+
+        cards = []
+        for i in range(1, 4):
+            card_file = tmp_path / f"Card_{i}.png"
+            image = QImage(50, 70, QImage.Format.Format_RGB32)
+            image.fill(QColor("blue"))
+            assert image.save(str(card_file))
+            cards.append(
+                MTGCard(
+                    id=i, name=f"Card {i}", type="Instant", card_path=str(card_file)
+                )
+            )
+        deck_builder.cards_tab.cards = cards
+
+        deck_builder.update_card_images(cards[1])
+        QThreadPool.globalInstance().waitForDone()
+        deck_builder._prefetch_pool.waitForDone()
+        QApplication.processEvents()
+
+        with patch("mtg_deck_builder._ImageLoadTask") as mock_task:
+            for card in (cards[0], cards[2]):
+                deck_builder.card_image_label.clear()
+                deck_builder.update_card_images(card)
+                assert not deck_builder.card_image_label.pixmap().isNull()
+            mock_task.assert_not_called()
+
+        # While a selection is still settling a cached image shows immediately
+        deck_builder.card_image_label.clear()
+        deck_builder.update_card_preview(cards[0])
+        assert deck_builder._preview_timer.isActive()
+        assert not deck_builder.card_image_label.pixmap().isNull()
+        deck_builder.clear_card_preview()
+
+    def test_generation_progress_uses_running_counts(self, deck_builder):
+        """Test progress updates count completions instead of rescanning."""
+        cards = [MTGCard(id=i, name=f"Card {i}", type="Instant") for i in (1, 2, 3)]
+        cards[0].status = "completed"
+        deck_builder.cards_tab.cards = cards
+
+        deck_builder.on_image_generation_started()
+        assert deck_builder._generation_total == 3
+        assert deck_builder._generation_completed == 1
+
+        with patch.object(deck_builder, "auto_save_deck"):
+            deck_builder.on_card_generation_completed(2, True, "ok")
+        # Progress no longer reads card statuses
+        cards[2].status = "completed"
+        deck_builder.on_image_generation_progress(3, "generating")
+
+        assert deck_builder.generation_progress.maximum() == 3
+        assert deck_builder.generation_progress.value() == 2
+
+    def test_close_skips_unchanged_settings(self, deck_builder):
+        """Test closing only writes settings that differ from the saved ones."""
+        from PyQt6.QtGui import QCloseEvent
+
+        deck_builder._saved_geometry = bytes(deck_builder.saveGeometry())
+        deck_builder._saved_deck_path = None
+        with patch("mtg_deck_builder.QSettings") as mock_settings:
+            deck_builder.closeEvent(QCloseEvent())
+            mock_settings.assert_not_called()
+
+            deck_builder.last_loaded_deck_path = "saved_decks/test/test.yaml"
+            deck_builder.closeEvent(QCloseEvent())
+            mock_settings.return_value.setValue.assert_called_once_with(
+                "last_deck_path", "saved_decks/test/test.yaml"
+            )
+
+    def test_debug_messages_respect_debug_enabled(self, deck_builder):
+        """Test DEBUG lines are dropped while debug logging is off."""
+        deck_builder.logger_text.clear()
+        deck_builder.debug_enabled = False
+        deck_builder.log_message("DEBUG", "hidden detail")
+        deck_builder.log_message("INFO", "visible info")
+
+        text = deck_builder.logger_text.toPlainText()
+        assert "hidden detail" not in text
+        assert "visible info" in text
+
+    def test_log_messages_appends_batch(self, deck_builder):
+        """Test a batch of lines is appended in order, one line per entry."""
+        deck_builder.logger_text.clear()
+        deck_builder.debug_enabled = False
+        deck_builder.log_messages(
+            [("ERROR", "first"), ("DEBUG", "hidden"), ("ERROR", "second")]
+        )
+
+        lines = deck_builder.logger_text.toPlainText().splitlines()
+        assert [line.split("] ", 2)[2] for line in lines] == ["first", "second"]
+        assert "[ERROR]" in lines[0]
+
+    def test_find_card_index(self, deck_builder):
+        """Test id lookup follows in-place renumbering of the cards list."""
+        cards = [MTGCard(id=i, name=f"Card {i}", type="Instant") for i in (1, 2, 3)]
+
+        assert deck_builder._find_card_index(cards, 2) == 1
+        assert deck_builder._find_card_index(cards, 3) == 2
+        assert deck_builder._find_card_index(cards, 99) is None
+
+        cards[0].id, cards[2].id = 3, 1
+        assert deck_builder._find_card_index(cards, 3) == 0
+
+        # Ids that don't follow list order fall back to the id map
+        shuffled = [MTGCard(id=i, name=f"Card {i}", type="Instant") for i in (7, 2, 5)]
+        assert deck_builder._find_card_index(shuffled, 5) == 2
+        assert deck_builder._find_card_index(shuffled, 1) is None
+
 
 class TestIntegration:
     """Integration tests for the complete application."""
@@ -674,7 +1373,7 @@ class TestIntegration:
         app = app_with_mocks
 
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}), patch(
-            "mtg_deck_builder.requests.post"
+            "mtg_deck_builder.requests.Session.post"
         ) as mock_post:
             # Mock AI response
             mock_response = Mock()